@@ -467,16 +467,18 @@ def scan_altoholic_db(db_path):
 # ===============================================
 # Existing helpers
 # ===============================================
-def extract_fc_data(full_data):
+def _fc_entry(obj):
+    return {
+        "Name": obj.get("Name", "Unknown FC"),
+        "FCPoints": obj.get("FCPoints", 0)
+    }
+
+def extract_fc_data_full_walk(full_data):
     fc_data = {}
     def recursive_search(obj):
         if isinstance(obj, dict):
             if "HolderChara" in obj:
-                holder_id = obj["HolderChara"]
-                fc_data[holder_id] = {
-                    "Name": obj.get("Name", "Unknown FC"),
-                    "FCPoints": obj.get("FCPoints", 0)
-                }
+                fc_data[obj["HolderChara"]] = _fc_entry(obj)
             for v in obj.values():
                 recursive_search(v)
         elif isinstance(obj, list):
@@ -485,6 +487,23 @@ def extract_fc_data(full_data):
     recursive_search(full_data)
     return fc_data
 
+def extract_fc_data(full_data):
+    # AutoRetainer keeps FCs in the top-level "FCData" section; read it directly and only
+    # walk the whole config if that section is missing or its entries don't look like FCs
+    section = full_data.get("FCData") if isinstance(full_data, dict) else None
+    if isinstance(section, dict):
+        entries = list(section.values())
+    elif isinstance(section, list):
+        entries = section
+    else:
+        return extract_fc_data_full_walk(full_data)
+    fc_data = {}
+    for obj in entries:
+        if not isinstance(obj, dict) or "HolderChara" not in obj:
+            return extract_fc_data_full_walk(full_data)
+        fc_data[obj["HolderChara"]] = _fc_entry(obj)
+    return fc_data
+
 def collect_characters(full_data, account_nickname):
     all_chars = []
     def assign_nickname(chara):
@@ -47,13 +47,46 @@
 ###########################################
 
 import json
+import math
+import operator
 import os
 import datetime
+import time
+import collections
 import getpass
+import gzip
+import hashlib
 import sqlite3
+import sys
 import re
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from pathlib import Path
-from flask import Flask, render_template_string, jsonify
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import pass_context
+from markupsafe import Markup
+
+try:
+    import brotli  # Optional: pip install brotli (adds "br" response compression)
+except ImportError:
+    brotli = None
+
+try:
+    import numpy  # Optional: pip install numpy (vectorized fleet summaries)
+except ImportError:
+    numpy = None
+
+try:
+    import inotify_simple  # Optional (Linux): pip install inotify_simple (event-driven file change detection)
+except ImportError:
+    inotify_simple = None
+
+try:
+    import waitress  # Optional: pip install waitress (multi-threaded server for --serve production)
+except ImportError:
+    waitress = None
 
 # ===============================================
 # Server Configuration
@@ -61,12 +94,26 @@ from flask import Flask, render_template_string, jsonify
 HOST = "127.0.0.1"      # Server host address (use "0.0.0.0" for network access)
 PORT = 1234             # Server port number
 DEBUG = False           # Flask debug mode (set True for development)
-AUTO_REFRESH = 60       # Auto-refresh interval in seconds (0 to disable)
+SERVER_THREADS = 16     # Worker threads for --serve production (each open tab's /api/events stream holds one)
+AUTO_REFRESH = 60       # Auto-refresh interval in seconds (0 to disable; only used when LIVE_UPDATES is off)
+LIVE_UPDATES = True     # Push new dashboard data to open pages over /api/events instead of polling every AUTO_REFRESH seconds
+EVENTS_KEEPALIVE = 15   # Seconds between keep-alive comments on idle /api/events streams
+MODEL_REFRESH_INTERVAL = 60     # Background rebuild interval in seconds (keeps timers/ready flags current)
+MODEL_CHANGE_POLL_INTERVAL = 1  # Seconds between checks of config/xa.db files for changes (rebuilds on change)
+SOURCE_WATCHER = "auto"         # "auto" = inotify for local files when inotify_simple is installed, polling for the rest; "poll" = always poll
+WATCH_DEBOUNCE = 1.0            # Seconds without further writes before a changed file triggers a rebuild (AutoRetainer saves in bursts)
+ACCOUNT_LOAD_WORKERS = 8        # Threads used to load account files in parallel (1 = serial)
+ACCOUNT_LOAD_TIMEOUT = 15       # Seconds to wait for an account's files before serving its last good data as stale (0 = wait forever)
+RENDER_CACHE = True             # Reuse rendered page HTML until the dashboard model changes
+CARD_PAGE_SIZE = 60             # Character cards rendered per page; bigger accounts load more while scrolling (0 = render all up front)
+HTTP_COMPRESSION = True         # gzip (or brotli when installed) page and JSON responses for clients that accept it
+COMPRESSION_MIN_SIZE = 1024     # Responses smaller than this many bytes are sent uncompressed
+SIMULATE_SLOW_ACCOUNTS = {}     # Testing only: {"nickname": seconds} delay added to that account's file loads
 
 # Display options
 VERSION = "v1.40"       # Version number shown in footer and startup
-SHOW_CLASSES = False     # Show DoW/DoM and DoH/DoL job sections, disable to speed up page load
-SHOW_CURRENCIES = False  # Show currencies section, disable to speed up page load
+SHOW_CLASSES = True      # Show DoW/DoM and DoH/DoL job sections (loaded per character when expanded)
+SHOW_CURRENCIES = True   # Show currencies section (loaded per character when expanded)
 SHOW_MSQ_PROGRESSION = True  # Show MSQ progression tracking
 DEFAULT_THEME = "default"  # Theme preset for dashboard
 HIGHLIGHT_IDLE_RETAINERS = True  # Cyan outline on character cards with idle retainers
@@ -80,6 +127,8 @@ HONOR_AR_EXCLUSIONS = True  # Honor AutoRetainer's ExcludeRetainer/ExcludeWorksh
 # XA Database Integration (financial data from XA Database plugin)
 # This Is Under Development And May Not Report Everything Correctly
 USE_AAR_DB = True          # Enable /charts/ page with xa.db data from XA Database plugin
+SNAPSHOT_MIN_INTERVAL = 300  # Minimum seconds between /charts/ snapshot writes to sublord.db (first write of a day always goes through)
+USE_SQLITE_JSON_SCAN = False  # Aggregate xa.db JSON columns inside SQLite (JSON1); compare with --benchmark before enabling
 
 # Highlight Colors (customizable)
 HIGHLIGHT_COLOR_IDLE_RETAINERS = "cyan"       # Cyan for idle retainers
@@ -896,13 +945,121 @@ item_values = {
     "jet_black_dye": 600000,
     "pastel_pink_dye": 40000
 }
-# Plan GUID to Name lookup (built from DefaultConfig.json)
-submarine_plan_names = {}  # GUID -> Name
+# ===============================================
+# Record Types (submarines, retainers, characters)
+# ===============================================
+# A dashboard model holds one record per character, submarine and retainer. These use
+# __slots__ instead of a per-instance dict (roughly a quarter of the size) and keep the
+# dict-style reads the views and templates use: rec["key"], rec.get(), `in`, items().
+# JSON encoding goes through Record.to_json(), which also converts nested record lists.
+class Record:
+    """Base for fixed-field records; subclasses list their fields in __slots__"""
+    __slots__ = ()
+    _nested_fields = ()  # Fields holding lists of records, converted by to_json() in the same pass
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.__slots__)
+        cls._values = operator.attrgetter(*cls.__slots__)
+    
+    def __init__(self, **fields):
+        missing = self._field_set.difference(fields)
+        if missing:
+            raise TypeError(f"{type(self).__name__} missing fields: {', '.join(sorted(missing))}")
+        for name, value in fields.items():
+            setattr(self, name, value)
+    
+    def __getitem__(self, key):
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __setitem__(self, key, value):
+        if key not in self._field_set:
+            raise KeyError(key)
+        setattr(self, key, value)
+    
+    def __contains__(self, key):
+        return key in self._field_set
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self):
+        return len(self.__slots__)
+    
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self._values(self) == other._values(other)
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_json()!r})"
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._field_set else default
+    
+    def keys(self):
+        return self.__slots__
+    
+    def items(self):
+        return zip(self.__slots__, self._values(self))
+    
+    def to_json(self):
+        """Plain dict of the fields, with _nested_fields record lists converted too"""
+        d = dict(zip(self.__slots__, self._values(self)))
+        for name in self._nested_fields:
+            d[name] = [v.to_json() if isinstance(v, Record) else v for v in d[name]]
+        return d
+
+
+class Submarine(Record):
+    __slots__ = ("name", "level", "build", "plan_name", "return_time", "return_formatted", "is_ready",
+                 "is_leveling", "is_farming", "vessel_behavior", "daily_gil", "monthly_gil",
+                 "tanks_per_day", "kits_per_day", "daily_cost")
+
+
+class Retainer(Record):
+    __slots__ = ("name", "level", "job", "gil", "mb_items", "has_venture", "venture_ends",
+                 "venture_formatted", "is_ready")
+
+
+class Character(Record):
+    _nested_fields = ("submarines", "retainers")
+    __slots__ = (
+        "cid", "name", "world", "region", "gil", "retainer_gil", "fc_gil", "total_gil",
+        "treasure_value", "coffer_dye_value", "coffer_count", "dye_count", "dye_pure_white",
+        "dye_jet_black", "dye_pastel_pink", "mb_dye_count", "venture_coins", "total_with_treasure",
+        "submarines", "retainers", "fc_name", "fc_points", "ceruleum", "repair_kits", "ventures",
+        "inventory_space", "gc_seals", "daily_income", "monthly_income", "daily_cost", "mb_items",
+        "current_job", "current_level", "subs_leveling", "subs_farming", "idle_subs", "has_idle_sub",
+        "retainers_leveling", "retainers_farming", "idle_retainers", "has_idle_retainer",
+        "days_until_restock", "private_house", "fc_house", "all_jobs", "all_currencies",
+        "categorized_currencies", "highest_job", "highest_level", "lowest_job", "lowest_level",
+        "msq_percent", "msq_completed", "msq_total", "msq_quest_name", "ready_subs", "total_subs",
+        "ready_retainers", "total_retainers", "max_retainer_level", "max_sub_level",
+        "min_retainer_level", "min_sub_level", "min_retainer_return", "min_sub_return",
+        "has_max_mb_retainer", "exclude_retainer", "exclude_workshop", "retainers_sleeping",
+        "subs_sleeping", "is_processing", "sleeping_retainer_count", "sleeping_sub_count",
+        "has_potential_retainer", "has_potential_subs", "max_mb_count",
+    )
+
+
+class RecordJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes records by their fields"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, Record):
+            return o.to_json()
+        return DefaultJSONProvider.default(o)
+
 
 # ===============================================
 # Flask Application
 # ===============================================
 app = Flask(__name__)
+app.json = RecordJSONProvider(app)
 
 @app.template_filter('sp_compact')
 def sp_compact_filter(value):
@@ -929,7 +1086,10 @@ def sp_compact_filter(value):
 # ===============================================
 def load_external_config():
     """Load external config file if it exists"""
-    global HOST, PORT, DEBUG, AUTO_REFRESH, account_locations
+    global HOST, PORT, DEBUG, AUTO_REFRESH, LIVE_UPDATES, EVENTS_KEEPALIVE, account_locations
+    global MODEL_REFRESH_INTERVAL, MODEL_CHANGE_POLL_INTERVAL, SOURCE_WATCHER, WATCH_DEBOUNCE, ACCOUNT_LOAD_WORKERS
+    global ACCOUNT_LOAD_TIMEOUT, SIMULATE_SLOW_ACCOUNTS, RENDER_CACHE, HTTP_COMPRESSION, COMPRESSION_MIN_SIZE
+    global CARD_PAGE_SIZE, SERVER_THREADS
     global submarine_plans, retainer_plans, item_values
     global SHOW_CLASSES, SHOW_CURRENCIES, SHOW_MSQ_PROGRESSION, DEFAULT_THEME
     global HIGHLIGHT_IDLE_RETAINERS, HIGHLIGHT_IDLE_SUBS, HIGHLIGHT_READY_ITEMS, HIGHLIGHT_MAX_MB, HIGHLIGHT_POTENTIAL_RETAINER, HIGHLIGHT_POTENTIAL_SUBS
@@ -937,7 +1097,7 @@ def load_external_config():
     global HIGHLIGHT_COLOR_IDLE_RETAINERS, HIGHLIGHT_COLOR_IDLE_SUBS, HIGHLIGHT_COLOR_MAX_MB, HIGHLIGHT_COLOR_POTENTIAL_RETAINER, HIGHLIGHT_COLOR_POTENTIAL_SUBS
     global BUILD_GIL_RATES, BUILD_CONSUMPTION_RATES
     global CERULEUM_TANK_COST, REPAIR_KIT_COST
-    global USE_AAR_DB
+    global USE_AAR_DB, USE_SQLITE_JSON_SCAN, SNAPSHOT_MIN_INTERVAL
     
     config_path = Path(__file__).parent / CONFIG_FILE
     if not config_path.exists():
@@ -950,7 +1110,21 @@ def load_external_config():
         HOST = config.get("HOST", HOST)
         PORT = config.get("PORT", PORT)
         DEBUG = config.get("DEBUG", DEBUG)
+        SERVER_THREADS = config.get("SERVER_THREADS", SERVER_THREADS)
         AUTO_REFRESH = config.get("AUTO_REFRESH", AUTO_REFRESH)
+        LIVE_UPDATES = config.get("LIVE_UPDATES", LIVE_UPDATES)
+        EVENTS_KEEPALIVE = config.get("EVENTS_KEEPALIVE", EVENTS_KEEPALIVE)
+        MODEL_REFRESH_INTERVAL = config.get("MODEL_REFRESH_INTERVAL", MODEL_REFRESH_INTERVAL)
+        MODEL_CHANGE_POLL_INTERVAL = config.get("MODEL_CHANGE_POLL_INTERVAL", MODEL_CHANGE_POLL_INTERVAL)
+        SOURCE_WATCHER = config.get("SOURCE_WATCHER", SOURCE_WATCHER)
+        WATCH_DEBOUNCE = config.get("WATCH_DEBOUNCE", WATCH_DEBOUNCE)
+        ACCOUNT_LOAD_WORKERS = config.get("ACCOUNT_LOAD_WORKERS", ACCOUNT_LOAD_WORKERS)
+        ACCOUNT_LOAD_TIMEOUT = config.get("ACCOUNT_LOAD_TIMEOUT", ACCOUNT_LOAD_TIMEOUT)
+        SIMULATE_SLOW_ACCOUNTS = config.get("SIMULATE_SLOW_ACCOUNTS", SIMULATE_SLOW_ACCOUNTS)
+        RENDER_CACHE = config.get("RENDER_CACHE", RENDER_CACHE)
+        CARD_PAGE_SIZE = config.get("CARD_PAGE_SIZE", CARD_PAGE_SIZE)
+        HTTP_COMPRESSION = config.get("HTTP_COMPRESSION", HTTP_COMPRESSION)
+        COMPRESSION_MIN_SIZE = config.get("COMPRESSION_MIN_SIZE", COMPRESSION_MIN_SIZE)
         SHOW_CLASSES = config.get("SHOW_CLASSES", SHOW_CLASSES)
         SHOW_CURRENCIES = config.get("SHOW_CURRENCIES", SHOW_CURRENCIES)
         SHOW_MSQ_PROGRESSION = config.get("SHOW_MSQ_PROGRESSION", SHOW_MSQ_PROGRESSION)
@@ -1004,17 +1178,149 @@ def load_external_config():
         
         # Load XA Database integration settings
         USE_AAR_DB = config.get("USE_AAR_DB", USE_AAR_DB)
+        USE_SQLITE_JSON_SCAN = config.get("USE_SQLITE_JSON_SCAN", USE_SQLITE_JSON_SCAN)
+        SNAPSHOT_MIN_INTERVAL = config.get("SNAPSHOT_MIN_INTERVAL", SNAPSHOT_MIN_INTERVAL)
         
         print(f"[CONFIG] Loaded configuration from {config_path}")
     except Exception as e:
         print(f"[CONFIG] Error loading config: {e}")
 
 
+# ===============================================
+# SQLite Connections (per-thread pool + schema cache)
+# ===============================================
+# xa.db belongs to the XA Database plugin: it is opened read-only (mode=ro + query_only) with a
+# busy timeout so dashboard reads never take write locks or fail instantly while the plugin commits.
+# Connections are kept per thread (account loads run on long-lived pool threads) and reopened if
+# the file is replaced. Table/column introspection is cached until PRAGMA schema_version changes.
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+_sqlite_local = threading.local()  # .connections: {(path, readonly): {"identity": (...), "conn": Connection}}
+_sqlite_schema_cache = {}  # path -> {"identity": (...), "schema_version": int, "tables": {table: frozenset(columns)}}
+_sqlite_pool_lock = threading.Lock()
+sqlite_pool_stats = {"opened": 0, "reused": 0, "schema_reads": 0}
+
+
+def _sqlite_uri(db_path, mode):
+    uri_path = os.path.abspath(db_path).replace("\\", "/")
+    if not uri_path.startswith("/"):
+        uri_path = "/" + uri_path  # Drive letter paths: /C:/...
+    return f"file://{urllib.parse.quote(uri_path)}?mode={mode}"
+
+
+def connect_sqlite_readonly(db_path):
+    """
+    Open a SQLite file read-only with query_only and a busy timeout.
+    Falls back to a normal connection (still query_only) if read-only mode can't open the file,
+    e.g. a WAL database whose -shm file doesn't exist yet.
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(_sqlite_uri(db_path, "ro"), uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_MS)}")
+        conn.execute("PRAGMA schema_version").fetchone()
+    except sqlite3.Error:
+        if conn is not None:
+            conn.close()
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_MS)}")
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def _sqlite_file_identity(db_path):
+    """Identify the file behind a path so a replaced database gets a fresh connection (None if missing)"""
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    if st.st_ino:
+        return (st.st_dev, st.st_ino)
+    return (st.st_dev, st.st_ctime_ns)  # Filesystems without inode numbers (some network shares)
+
+
+def get_sqlite_connection(db_path, readonly=True):
+    """
+    Return this thread's pooled connection to db_path (opened on first use).
+    readonly=True opens via connect_sqlite_readonly(); readonly=False opens a normal read/write connection.
+    Returns None if a read-only database doesn't exist.
+    """
+    db_path = str(db_path)
+    connections = getattr(_sqlite_local, "connections", None)
+    if connections is None:
+        connections = _sqlite_local.connections = {}
+    key = (db_path, readonly)
+    identity = _sqlite_file_identity(db_path)
+    pooled = connections.get(key)
+    if pooled is not None:
+        if pooled["identity"] == identity and identity is not None:
+            with _sqlite_pool_lock:
+                sqlite_pool_stats["reused"] += 1
+            return pooled["conn"]
+        close_sqlite_connection(db_path, readonly)
+    if readonly:
+        if identity is None:
+            return None
+        conn = connect_sqlite_readonly(db_path)
+    else:
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn.execute(f"PRAGMA busy_timeout = {int(SQLITE_BUSY_TIMEOUT_MS)}")
+        identity = _sqlite_file_identity(db_path)
+    connections[key] = {"identity": identity, "conn": conn}
+    with _sqlite_pool_lock:
+        sqlite_pool_stats["opened"] += 1
+    return conn
+
+
+def close_sqlite_connection(db_path, readonly=True):
+    """Close this thread's pooled connection to db_path, if any"""
+    connections = getattr(_sqlite_local, "connections", {})
+    pooled = connections.pop((str(db_path), readonly), None)
+    if pooled is not None:
+        try:
+            pooled["conn"].close()
+        except Exception:
+            pass
+
+
+def rollback_sqlite_connection(db_path, readonly=False):
+    """Roll back any open transaction on this thread's pooled connection (after a failed write)"""
+    pooled = getattr(_sqlite_local, "connections", {}).get((str(db_path), readonly))
+    if pooled is not None:
+        try:
+            pooled["conn"].rollback()
+        except Exception:
+            close_sqlite_connection(db_path, readonly)
+
+
+def get_sqlite_schema(conn, db_path):
+    """
+    Return {table: frozenset(columns)} for the database behind conn.
+    Cached per file until PRAGMA schema_version changes (or the file is replaced), so
+    sqlite_master and PRAGMA table_info are only read again after a schema change.
+    """
+    db_path = str(db_path)
+    identity = _sqlite_file_identity(db_path)
+    schema_version = conn.execute("PRAGMA schema_version").fetchone()[0]
+    with _sqlite_pool_lock:
+        cached = _sqlite_schema_cache.get(db_path)
+        if cached is not None and cached["identity"] == identity and cached["schema_version"] == schema_version:
+            return cached["tables"]
+    tables = {}
+    for (table,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+        quoted = table.replace('"', '""')
+        tables[table] = frozenset(row[1] for row in conn.execute(f'PRAGMA table_info("{quoted}")').fetchall())
+    with _sqlite_pool_lock:
+        _sqlite_schema_cache[db_path] = {"identity": identity, "schema_version": schema_version, "tables": tables}
+        sqlite_pool_stats["schema_reads"] += 1
+    return tables
+
+
 # ===============================================
 # Sublord DB Functions (local historical snapshots for /charts/)
 # ===============================================
 # Landing Page creates and maintains sublord.db in its own directory.
-# Each page load, live data from xa.db files is aggregated into a daily snapshot.
+# Each model rebuild, live data from xa.db files is aggregated into a daily snapshot.
 # The charts page reads historical snapshots from sublord.db.
 
 SUBLORD_DB_NAME = "sublord.db"
@@ -1027,7 +1333,7 @@ def init_sublord_db():
     """Create sublord.db tables if they don't exist."""
     db_path = get_sublord_db_path()
     try:
-        conn = sqlite3.connect(str(db_path))
+        conn = get_sqlite_connection(db_path, readonly=False)
         c = conn.cursor()
         c.execute("""CREATE TABLE IF NOT EXISTS daily_snapshots (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1058,7 +1364,7 @@ def init_sublord_db():
             total_gil_overall INTEGER DEFAULT 0,
             total_supply_cost_overall INTEGER DEFAULT 0
         )""")
-        snapshot_columns = {row[1] for row in c.execute("PRAGMA table_info(daily_snapshots)").fetchall()}
+        snapshot_columns = get_sqlite_schema(conn, db_path)["daily_snapshots"]
         if "total_fc_chest_gil" not in snapshot_columns:
             c.execute("ALTER TABLE daily_snapshots ADD COLUMN total_fc_chest_gil INTEGER DEFAULT 0")
         if "total_fc_points" not in snapshot_columns:
@@ -1071,12 +1377,12 @@ def init_sublord_db():
             c.execute("UPDATE daily_snapshots SET max_days_until_restocking = days_until_restocking WHERE max_days_until_restocking IS NULL")
         c.execute("INSERT OR IGNORE INTO cumulative_totals (id, total_gil_overall, total_supply_cost_overall) VALUES (1, 0, 0)")
         conn.commit()
-        conn.close()
     except Exception as e:
+        rollback_sqlite_connection(db_path)
         print(f"[SUBLORD-DB] Error initializing database: {e}")
 
-def _get_xa_gil_totals():
-    """Read character, retainer, FC chest Gil, and FC points from all xa.db files."""
+def read_xa_gil_totals(db_path):
+    """Read character, retainer, FC chest Gil, and FC points totals from one xa.db (uncached, see scan_xa_gil_totals)."""
     def _read_fc_chest_gil(raw_value):
         if not raw_value or raw_value == "null":
             return 0
@@ -1101,121 +1407,118 @@ def _get_xa_gil_totals():
             return total
         return 0
 
+    total_char_gil = 0
+    total_ret_gil = 0
+    total_fc_chest_gil = 0
+    total_fc_points = 0
+    try:
+        conn = get_sqlite_connection(db_path)
+        if conn is None:
+            return 0, 0, 0, 0
+        c = conn.cursor()
+        tables = get_sqlite_schema(conn, db_path)
+        fc_points_read = False
+        if "free_companies" in tables:
+            fc_columns = tables["free_companies"]
+            if "fc_points" in fc_columns:
+                if "fc_id" in fc_columns:
+                    fc_rows = c.execute("""
+                        SELECT fc_id, MAX(COALESCE(fc_points, 0)) AS fc_points
+                        FROM free_companies
+                        WHERE fc_id IS NOT NULL AND fc_id != 0
+                        GROUP BY fc_id
+                    """).fetchall()
+                    total_fc_points += sum(row[1] or 0 for row in fc_rows)
+                else:
+                    total_fc_points += c.execute("SELECT SUM(COALESCE(fc_points, 0)) FROM free_companies").fetchone()[0] or 0
+                fc_points_read = True
+
+        if "xa_characters" in tables:
+            xa_character_columns = tables["xa_characters"]
+            select_parts = [
+                "COALESCE(gil, 0)",
+                "COALESCE(retainer_gil, 0)",
+                "free_company_json" if "free_company_json" in xa_character_columns else "NULL AS free_company_json",
+                "COALESCE(fc_points, 0)" if "fc_points" in xa_character_columns and not fc_points_read else "0 AS fc_points",
+            ]
+            for char_gil, ret_gil, free_company_json, fc_points in c.execute(
+                f"SELECT {', '.join(select_parts)} FROM xa_characters"
+            ).fetchall():
+                total_char_gil += char_gil or 0
+                total_ret_gil += ret_gil or 0
+                total_fc_chest_gil += _read_fc_chest_gil(free_company_json)
+                total_fc_points += fc_points or 0
+        else:
+            for row in c.execute("SELECT amount FROM currency_balances WHERE currency_name = 'Gil'").fetchall():
+                total_char_gil += row[0] or 0
+            for row in c.execute("SELECT gil FROM retainers").fetchall():
+                total_ret_gil += row[0] or 0
+    except Exception:
+        pass
+    return total_char_gil, total_ret_gil, total_fc_chest_gil, total_fc_points
+
+def _get_xa_gil_totals():
+    """Read character, retainer, FC chest Gil, and FC points from all xa.db files."""
     total_char_gil = 0
     total_ret_gil = 0
     total_fc_chest_gil = 0
     total_fc_points = 0
     for account in account_locations:
-        db_path = Path(account.get("xa_db_path", ""))
-        if not db_path or not db_path.exists():
+        db_path = account.get("xa_db_path", "")
+        if not db_path or not os.path.isfile(db_path):
             continue
-        try:
-            conn = sqlite3.connect(str(db_path))
-            c = conn.cursor()
-            tables = {row[0] for row in c.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()}
-            fc_points_read = False
-            if "free_companies" in tables:
-                fc_columns = {row[1] for row in c.execute("PRAGMA table_info(free_companies)").fetchall()}
-                if "fc_points" in fc_columns:
-                    if "fc_id" in fc_columns:
-                        fc_rows = c.execute("""
-                            SELECT fc_id, MAX(COALESCE(fc_points, 0)) AS fc_points
-                            FROM free_companies
-                            WHERE fc_id IS NOT NULL AND fc_id != 0
-                            GROUP BY fc_id
-                        """).fetchall()
-                        total_fc_points += sum(row[1] or 0 for row in fc_rows)
-                    else:
-                        total_fc_points += c.execute("SELECT SUM(COALESCE(fc_points, 0)) FROM free_companies").fetchone()[0] or 0
-                    fc_points_read = True
-
-            if "xa_characters" in tables:
-                xa_character_columns = {row[1] for row in c.execute("PRAGMA table_info(xa_characters)").fetchall()}
-                select_parts = [
-                    "COALESCE(gil, 0)",
-                    "COALESCE(retainer_gil, 0)",
-                    "free_company_json" if "free_company_json" in xa_character_columns else "NULL AS free_company_json",
-                    "COALESCE(fc_points, 0)" if "fc_points" in xa_character_columns and not fc_points_read else "0 AS fc_points",
-                ]
-                for char_gil, ret_gil, free_company_json, fc_points in c.execute(
-                    f"SELECT {', '.join(select_parts)} FROM xa_characters"
-                ).fetchall():
-                    total_char_gil += char_gil or 0
-                    total_ret_gil += ret_gil or 0
-                    total_fc_chest_gil += _read_fc_chest_gil(free_company_json)
-                    total_fc_points += fc_points or 0
-            else:
-                for row in c.execute("SELECT amount FROM currency_balances WHERE currency_name = 'Gil'").fetchall():
-                    total_char_gil += row[0] or 0
-                for row in c.execute("SELECT gil FROM retainers").fetchall():
-                    total_ret_gil += row[0] or 0
-            conn.close()
-        except Exception:
-            pass
+        char_gil, ret_gil, fc_chest_gil, fc_points = scan_xa_gil_totals(db_path)
+        total_char_gil += char_gil
+        total_ret_gil += ret_gil
+        total_fc_chest_gil += fc_chest_gil
+        total_fc_points += fc_points
     return total_char_gil, total_ret_gil, total_fc_chest_gil, total_fc_points
 
-def write_daily_snapshot(summary):
+# Snapshot writes are coalesced: at most one per SNAPSHOT_MIN_INTERVAL (the first write of a new
+# day always goes through), and skipped when today's stored row already holds the same values.
+SNAPSHOT_VALUE_COLUMNS = (
+    "total_character_gil", "total_retainer_gil", "total_fc_chest_gil",
+    "total_treasure_value", "total_gil_plus_treasure", "total_subs", "total_subs_farming", "total_subs_leveling",
+    "total_gil_per_day", "total_supply_cost_per_day", "total_net_per_day",
+    "total_fc_points",
+    "ceruleum_tank_inventory", "repair_kit_inventory", "days_until_restocking",
+    "min_days_until_restocking", "max_days_until_restocking",
+    "total_tanks_per_day", "total_kits_per_day",
+)
+_snapshot_lock = threading.Lock()
+_last_snapshot_write = {"date": None, "monotonic": None}
+snapshot_write_stats = {"written": 0, "unchanged": 0, "throttled": 0}
+
+def write_daily_snapshot(summary, gil_totals=None):
     """
     Write a daily snapshot to sublord.db from dashboard summary data + xa.db live Gil.
-    Called after get_all_data() computes the dashboard summary.
-    Only writes once per day (INSERT OR REPLACE on date).
+    Called after get_all_data() computes the dashboard summary (by the model refresher).
+    One row per day (upsert on date); skipped when SNAPSHOT_MIN_INTERVAL hasn't passed since
+    today's last write, or when the stored row already has identical values.
+    gil_totals: (char, retainer, fc chest, fc points) from _get_xa_gil_totals(), read if None.
+    Returns True if a row was written.
     """
     if not USE_AAR_DB:
-        return
+        return False
     
     db_path = get_sublord_db_path()
     today = datetime.datetime.now().strftime("%Y-%m-%d")
     timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Get character/retainer/FC chest Gil split plus FC points from xa.db files
-    char_gil, ret_gil, fc_chest_gil, fc_points = _get_xa_gil_totals()
-    treasure = summary.get("total_treasure", 0)
-    min_restock_days = summary.get("min_restock_days")
-    max_restock_days = summary.get("max_restock_days")
-    
-    # Check if this is a new day (for cumulative tracking)
-    is_new_day = False
-    
-    try:
-        conn = sqlite3.connect(str(db_path))
-        c = conn.cursor()
+    with _snapshot_lock:
+        last_write = _last_snapshot_write["monotonic"]
+        if (_last_snapshot_write["date"] == today and last_write is not None
+                and time.monotonic() - last_write < SNAPSHOT_MIN_INTERVAL):
+            snapshot_write_stats["throttled"] += 1
+            return False
         
-        # Check if we already have a snapshot for today
-        existing = c.execute("SELECT id FROM daily_snapshots WHERE date = ?", (today,)).fetchone()
-        is_new_day = existing is None
-        
-        c.execute("""INSERT INTO daily_snapshots (date, timestamp, total_character_gil, total_retainer_gil,
-            total_fc_chest_gil,
-            total_treasure_value, total_gil_plus_treasure, total_subs, total_subs_farming, total_subs_leveling,
-            total_gil_per_day, total_supply_cost_per_day, total_net_per_day,
-            total_fc_points,
-            ceruleum_tank_inventory, repair_kit_inventory, days_until_restocking,
-            min_days_until_restocking, max_days_until_restocking,
-            total_tanks_per_day, total_kits_per_day)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(date) DO UPDATE SET
-            timestamp=excluded.timestamp,
-            total_character_gil=excluded.total_character_gil,
-            total_retainer_gil=excluded.total_retainer_gil,
-            total_fc_chest_gil=excluded.total_fc_chest_gil,
-            total_treasure_value=excluded.total_treasure_value,
-            total_gil_plus_treasure=excluded.total_gil_plus_treasure,
-            total_subs=excluded.total_subs,
-            total_subs_farming=excluded.total_subs_farming,
-            total_subs_leveling=excluded.total_subs_leveling,
-            total_gil_per_day=excluded.total_gil_per_day,
-            total_supply_cost_per_day=excluded.total_supply_cost_per_day,
-            total_net_per_day=excluded.total_net_per_day,
-            total_fc_points=excluded.total_fc_points,
-            ceruleum_tank_inventory=excluded.ceruleum_tank_inventory,
-            repair_kit_inventory=excluded.repair_kit_inventory,
-            days_until_restocking=excluded.days_until_restocking,
-            min_days_until_restocking=excluded.min_days_until_restocking,
-            max_days_until_restocking=excluded.max_days_until_restocking,
-            total_tanks_per_day=excluded.total_tanks_per_day,
-            total_kits_per_day=excluded.total_kits_per_day
-        """, (
-            today, timestamp, char_gil, ret_gil, fc_chest_gil,
+        # Get character/retainer/FC chest Gil split plus FC points from xa.db files
+        char_gil, ret_gil, fc_chest_gil, fc_points = gil_totals if gil_totals is not None else _get_xa_gil_totals()
+        treasure = summary.get("total_treasure", 0)
+        min_restock_days = summary.get("min_restock_days")
+        max_restock_days = summary.get("max_restock_days")
+        values = (
+            char_gil, ret_gil, fc_chest_gil,
             treasure, char_gil + ret_gil + fc_chest_gil + treasure,
             summary.get("enabled_subs", 0),
             summary.get("subs_farming", 0),
@@ -1231,22 +1534,47 @@ def write_daily_snapshot(summary):
             max_restock_days,
             summary.get("total_tanks_per_day", 0),
             summary.get("total_kits_per_day", 0),
-        ))
-        
-        # Update cumulative totals only on first snapshot of the day
-        if is_new_day:
-            c.execute("""UPDATE cumulative_totals SET
-                total_gil_overall = total_gil_overall + ?,
-                total_supply_cost_overall = total_supply_cost_overall + ?
-                WHERE id = 1""", (
-                int(summary.get("daily_income", 0)),
-                int(summary.get("daily_cost", 0)),
-            ))
+        )
         
-        conn.commit()
-        conn.close()
-    except Exception as e:
-        print(f"[SUBLORD-DB] Error writing snapshot: {e}")
+        try:
+            conn = get_sqlite_connection(db_path, readonly=False)
+            c = conn.cursor()
+            
+            # Check if we already have a snapshot for today (and whether it already matches)
+            existing = c.execute(
+                f"SELECT {', '.join(SNAPSHOT_VALUE_COLUMNS)} FROM daily_snapshots WHERE date = ?", (today,)
+            ).fetchone()
+            is_new_day = existing is None
+            if existing is not None and tuple(existing) == values:
+                _last_snapshot_write.update(date=today, monotonic=time.monotonic())
+                snapshot_write_stats["unchanged"] += 1
+                return False
+            
+            c.execute(f"""INSERT INTO daily_snapshots (date, timestamp, {', '.join(SNAPSHOT_VALUE_COLUMNS)})
+                VALUES ({', '.join('?' * (len(SNAPSHOT_VALUE_COLUMNS) + 2))})
+                ON CONFLICT(date) DO UPDATE SET
+                timestamp=excluded.timestamp,
+                {', '.join(f"{column}=excluded.{column}" for column in SNAPSHOT_VALUE_COLUMNS)}
+            """, (today, timestamp) + values)
+            
+            # Update cumulative totals only on first snapshot of the day
+            if is_new_day:
+                c.execute("""UPDATE cumulative_totals SET
+                    total_gil_overall = total_gil_overall + ?,
+                    total_supply_cost_overall = total_supply_cost_overall + ?
+                    WHERE id = 1""", (
+                    int(summary.get("daily_income", 0)),
+                    int(summary.get("daily_cost", 0)),
+                ))
+            
+            conn.commit()
+            _last_snapshot_write.update(date=today, monotonic=time.monotonic())
+            snapshot_write_stats["written"] += 1
+            return True
+        except Exception as e:
+            rollback_sqlite_connection(db_path)
+            print(f"[SUBLORD-DB] Error writing snapshot: {e}")
+            return False
 
 def write_startup_daily_snapshot():
     """Record today's chart snapshot at script startup without requiring a browser page load."""
@@ -1261,8 +1589,10 @@ def write_startup_daily_snapshot():
             print("  [SUBLORD-DB] Startup chart snapshot skipped: no dashboard summary data")
             return False
 
-        write_daily_snapshot(data["summary"])
-        print(f"  [SUBLORD-DB] Startup chart snapshot written for {today}")
+        if write_daily_snapshot(data["summary"]):
+            print(f"  [SUBLORD-DB] Startup chart snapshot written for {today}")
+        else:
+            print(f"  [SUBLORD-DB] Startup chart snapshot unchanged for {today}")
         return True
     except Exception as e:
         print(f"  [SUBLORD-DB] Startup chart snapshot failed: {e}")
@@ -1281,9 +1611,9 @@ def read_sublord_data():
         return None
     
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
+        conn = get_sqlite_connection(db_path, readonly=False)
         c = conn.cursor()
+        c.row_factory = sqlite3.Row
         
         c.execute("SELECT * FROM daily_snapshots ORDER BY date ASC")
         snapshots = [dict(row) for row in c.fetchall()]
@@ -1292,8 +1622,6 @@ def read_sublord_data():
         cum_row = c.fetchone()
         cumulative = dict(cum_row) if cum_row else {}
         
-        conn.close()
-        
         if not snapshots:
             return {"daily_snapshots": [], "cumulative": cumulative}
         
@@ -1319,29 +1647,32 @@ def check_xa_db_status():
     return found, missing
 
 
-def build_plan_name_lookup(data):
-    """Build GUID to plan name lookup from AutoRetainer config"""
-    global submarine_plan_names
-    submarine_plan_names = {}
+def extract_plan_names(data):
+    """Extract GUID to plan name lookup from AutoRetainer config"""
+    plan_names = {}
     
     # SubmarinePointPlans
     for plan in data.get("SubmarinePointPlans", []):
         guid = plan.get("GUID", "")
         name = plan.get("Name", "")
         if guid and name:
-            submarine_plan_names[guid] = name
+            plan_names[guid] = name
     
     # SubmarineUnlockPlans
     for plan in data.get("SubmarineUnlockPlans", []):
         guid = plan.get("GUID", "")
         name = plan.get("Name", "")
         if guid and name:
-            submarine_plan_names[guid] = name
+            plan_names[guid] = name
+    
+    return plan_names
 
 
-def get_submarine_plan_info(sub_data, build=""):
+def get_submarine_plan_info(sub_data, build="", plan_names=None):
     """
     Determine submarine leveling/farming status and earnings based on plan name.
+    plan_names is the account's GUID -> plan name lookup (extract_plan_names()); it is passed
+    in rather than kept in a global so accounts can be parsed on concurrent threads.
     Returns: (is_leveling, is_farming, plan_name, plan_earnings)
     """
     vessel_behavior = sub_data.get("VesselBehavior", 0)
@@ -1366,7 +1697,7 @@ def get_submarine_plan_info(sub_data, build=""):
         plan_guid = selected_unlock_plan
     
     # Get plan name from GUID lookup
-    plan_name = submarine_plan_names.get(plan_guid, "")
+    plan_name = (plan_names or {}).get(plan_guid, "")
     
     # Check if plan name matches config leveling or farming plans
     leveling_plans = submarine_plans.get("leveling", [])
@@ -1515,18 +1846,29 @@ MSQ_POSITION_MAP = {qid: pos for pos, (qid, name) in enumerate(MSQ_QUEST_DATA, 1
 MSQ_NAME_MAP = {qid: name for qid, name in MSQ_QUEST_DATA}
 
 # Load quest level requirements from cache (for validation)
+QUEST_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quest_cache.json')
 MSQ_LEVEL_MAP = {}
-try:
-    import json as _json
-    _cache_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quest_cache.json')
-    if os.path.exists(_cache_path):
-        with open(_cache_path, 'r', encoding='utf-8') as _f:
-            _cache = _json.load(_f)
-            for qid, _ in MSQ_QUEST_DATA:
-                _quest = _cache.get(str(qid), {})
-                MSQ_LEVEL_MAP[qid] = _quest.get('class_level', 0)
-except Exception:
-    pass
+
+
+def load_quest_levels():
+    """(Re)load MSQ_LEVEL_MAP from the optional quest_cache.json next to the script"""
+    levels = {}
+    try:
+        if os.path.exists(QUEST_CACHE_PATH):
+            with open(QUEST_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+                for qid, _ in MSQ_QUEST_DATA:
+                    quest = cache.get(str(qid), {})
+                    levels[qid] = quest.get('class_level', 0)
+    except Exception:
+        pass
+    # Updated in place without clearing first: a model build on another thread never sees it empty
+    for qid in set(MSQ_LEVEL_MAP) - set(levels):
+        MSQ_LEVEL_MAP.pop(qid, None)
+    MSQ_LEVEL_MAP.update(levels)
+
+
+load_quest_levels()
 
 
 def calculate_msq_progress(quest_ids, max_job_level=100):
@@ -1572,10 +1914,372 @@ def calculate_msq_progress(quest_ids, max_job_level=100):
     return percentage, highest_pos, total_msq, highest_name
 
 
-def scan_xa_db(db_path):
+def _xa_load_json_list(raw_value):
+    """Parse a JSON array column, returning [] for null/invalid/non-list values"""
+    if not raw_value or raw_value == "null":
+        return []
+    try:
+        parsed = json.loads(raw_value)
+    except Exception:
+        return []
+    return parsed if isinstance(parsed, list) else []
+
+
+def _xa_read_int(entry, *keys):
+    """Read the first present integer value from a JSON object using PascalCase/snake_case keys"""
+    for key in keys:
+        if key in entry and entry[key] is not None:
+            try:
+                return int(entry[key])
+            except Exception:
+                continue
+    return 0
+
+
+def _xa_read_bool(entry, *keys):
+    for key in keys:
+        if key in entry:
+            return bool(entry[key])
+    return False
+
+
+def _xa_read_text(entry, *keys):
+    for key in keys:
+        value = entry.get(key)
+        if value is not None:
+            return str(value)
+    return ""
+
+
+def _xa_read_fc_gil(raw_value):
+    """Read FC chest gil from free_company_json (single FC object or list of FCs)"""
+    if not raw_value or raw_value == "null":
+        return 0
+    try:
+        parsed = json.loads(raw_value)
+    except Exception:
+        return 0
+    if isinstance(parsed, dict):
+        return _xa_read_int(parsed, "FcGil", "fc_gil")
+    if isinstance(parsed, list):
+        total = 0
+        for entry in parsed:
+            if isinstance(entry, dict):
+                total += _xa_read_int(entry, "FcGil", "fc_gil")
+        return total
+    return 0
+
+
+def _xa_tally_item(r, item_id, qty, is_marketboard=False):
+    """Process a single item for treasure/coffer/dye tracking."""
+    if item_id in TREASURE_IDS:
+        r["treasure_value"] += qty * TREASURE_VALUES[item_id]
+    if item_id in COFFER_DYE_IDS:
+        if item_id == 32161:  # Venture Coffer
+            r["coffer_dye_value"] += qty * item_values.get("venture_coffer", COFFER_DYE_VALUES[item_id])
+            r["coffer_count"] += qty
+        elif item_id == 13114:  # Pure White Dye
+            r["coffer_dye_value"] += qty * item_values.get("pure_white_dye", COFFER_DYE_VALUES[item_id])
+            r["dye_count"] += qty
+            r["dye_pure_white"] += qty
+            if is_marketboard:
+                r["mb_dye_count"] += qty
+        elif item_id == 13115:  # Jet Black Dye
+            r["coffer_dye_value"] += qty * item_values.get("jet_black_dye", COFFER_DYE_VALUES[item_id])
+            r["dye_count"] += qty
+            r["dye_jet_black"] += qty
+            if is_marketboard:
+                r["mb_dye_count"] += qty
+        elif item_id == 13708:  # Pastel Pink Dye
+            r["coffer_dye_value"] += qty * item_values.get("pastel_pink_dye", COFFER_DYE_VALUES[item_id])
+            r["dye_count"] += qty
+            r["dye_pastel_pink"] += qty
+            if is_marketboard:
+                r["mb_dye_count"] += qty
+        else:
+            r["coffer_dye_value"] += qty * COFFER_DYE_VALUES.get(item_id, 0)
+
+
+def _xa_add_job(r, name, abbr, level):
+    """Record a job level and update highest/lowest job tracking"""
+    job_key = XA_JOB_NAME_TO_KEY.get(name, name)
+    r["all_jobs"][job_key] = level
+    if level > r["highest_level"]:
+        r["highest_level"] = level
+        r["highest_job"] = abbr
+    if r["lowest_level"] == 0 or level < r["lowest_level"]:
+        r["lowest_level"] = level
+        r["lowest_job"] = abbr
+
+
+# Field groups for read_xa_db/scan_xa_db(fields=...): only the columns/JSON blobs behind the
+# requested groups are selected and decoded. The shared per-build account load reads every group.
+XA_SCAN_FIELDS = ("treasure", "currencies", "levels", "msq", "housing", "fc")
+XA_SCAN_FIELD_KEYS = {
+    "treasure": ("treasure_value", "coffer_dye_value", "coffer_count", "dye_count", "dye_pure_white",
+                 "dye_jet_black", "dye_pastel_pink", "mb_dye_count"),
+    "currencies": ("venture_coins", "all_currencies"),
+    "levels": ("current_job", "current_level", "highest_job", "highest_level",
+               "lowest_job", "lowest_level", "all_jobs"),
+    "msq": ("completed_quests",),
+    "housing": ("personal_estate", "fc_estate"),
+    "fc": ("fc_gil", "fc_points"),
+}
+
+
+def normalize_xa_fields(fields=None):
+    """Return fields as a frozenset of XA_SCAN_FIELDS groups (None = all groups)"""
+    if fields is None:
+        return frozenset(XA_SCAN_FIELDS)
+    fields = frozenset(fields)
+    unknown = fields.difference(XA_SCAN_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown XA scan fields: {', '.join(sorted(unknown))}")
+    return fields
+
+
+def _new_xa_entry(fields=XA_SCAN_FIELDS, fc_points=0, personal_estate="", fc_estate=""):
+    entry = {}
+    if "treasure" in fields:
+        entry.update({
+            "treasure_value": 0, "coffer_dye_value": 0, "coffer_count": 0,
+            "dye_count": 0, "dye_pure_white": 0, "dye_jet_black": 0,
+            "dye_pastel_pink": 0, "mb_dye_count": 0,
+        })
+    if "currencies" in fields:
+        entry.update({"venture_coins": 0, "all_currencies": {}})
+    if "levels" in fields:
+        entry.update({
+            "current_job": "", "current_level": 0,
+            "highest_job": "", "highest_level": 0,
+            "lowest_job": "", "lowest_level": 0,
+            "all_jobs": {},
+        })
+    if "msq" in fields:
+        entry["completed_quests"] = []
+    if "housing" in fields:
+        entry.update({"personal_estate": personal_estate, "fc_estate": fc_estate})
+    if "fc" in fields:
+        entry.update({"fc_gil": 0, "fc_points": fc_points})
+    return entry
+
+
+def _xa_character_base_select(xa_character_columns, fields):
+    """SELECT list for the per-character scalar columns shared by both xa_characters scan paths"""
+    select_parts = ["content_id"]
+    if "housing" in fields:
+        select_parts += [
+            "personal_estate" if "personal_estate" in xa_character_columns else "'' AS personal_estate",
+            "fc_estate" if "fc_estate" in xa_character_columns else "'' AS fc_estate",
+        ]
+    if "fc" in fields:
+        select_parts += [
+            "free_company_json" if "free_company_json" in xa_character_columns else "'null' AS free_company_json",
+            "COALESCE(fc_points, 0)" if "fc_points" in xa_character_columns else "0 AS fc_points",
+        ]
+    return select_parts
+
+
+def _new_xa_entry_from_base_row(row, fields):
+    """Build a result entry from a row selected with _xa_character_base_select; returns (cid, entry, next column index)"""
+    cid, pos = row[0], 1
+    personal_estate = fc_estate = ""
+    if "housing" in fields:
+        personal_estate, fc_estate = row[pos] or "", row[pos + 1] or ""
+        pos += 2
+    free_company_json, fc_points = None, 0
+    if "fc" in fields:
+        free_company_json, fc_points = row[pos], int(row[pos + 1] or 0)
+        pos += 2
+    entry = _new_xa_entry(fields, fc_points, personal_estate, fc_estate)
+    if "fc" in fields:
+        entry["fc_gil"] = _xa_read_fc_gil(free_company_json)
+    return cid, entry, pos
+
+
+def _scan_xa_characters_python(c, xa_character_columns, fields=XA_SCAN_FIELDS):
+    """Scan the xa_characters snapshot layout by decoding each JSON blob in Python"""
+    result = {}
+    json_columns = []
+    if "treasure" in fields:
+        json_columns += ["items_json", "retainer_items_json", "listings_json"]
+    if "currencies" in fields:
+        json_columns.append("currencies_json")
+    if "levels" in fields:
+        json_columns.append("jobs_json")
+    if "msq" in fields:
+        json_columns.append("msq_milestones_json")
+    select_parts = _xa_character_base_select(xa_character_columns, fields) + json_columns
+    rows = c.execute(f"SELECT {', '.join(select_parts)} FROM xa_characters").fetchall()
+    for row in rows:
+        cid, r, pos = _new_xa_entry_from_base_row(row, fields)
+        result[cid] = r
+        blobs = dict(zip(json_columns, row[pos:]))
+
+        if "treasure" in fields:
+            for column, is_marketboard in (("items_json", False), ("retainer_items_json", False), ("listings_json", True)):
+                for item in _xa_load_json_list(blobs[column]):
+                    item_id = _xa_read_int(item, "ItemId", "item_id")
+                    qty = _xa_read_int(item, "Quantity", "quantity")
+                    if item_id > 0 and qty > 0:
+                        _xa_tally_item(r, item_id, qty, is_marketboard=is_marketboard)
+
+        if "currencies" in fields:
+            for currency in _xa_load_json_list(blobs["currencies_json"]):
+                name = _xa_read_text(currency, "Name", "currency_name")
+                amount = _xa_read_int(currency, "Amount", "amount")
+                if not name or amount <= 0:
+                    continue
+                r["all_currencies"][name] = amount
+                if name == "Venture Coins":
+                    r["venture_coins"] = amount
+
+        if "levels" in fields:
+            for job in _xa_load_json_list(blobs["jobs_json"]):
+                level = _xa_read_int(job, "Level", "level")
+                if level <= 0:
+                    continue
+                _xa_add_job(r, _xa_read_text(job, "Name", "name"), _xa_read_text(job, "Abbreviation", "abbreviation"), level)
+            if r["highest_job"]:
+                r["current_job"] = r["highest_job"]
+                r["current_level"] = r["highest_level"]
+
+        if "msq" in fields:
+            for milestone in _xa_load_json_list(blobs["msq_milestones_json"]):
+                if not _xa_read_bool(milestone, "IsComplete", "is_complete"):
+                    continue
+                quest_id = _xa_read_int(milestone, "QuestRowId", "quest_row_id")
+                if quest_id > 0:
+                    r["completed_quests"].append(quest_id)
+    return result
+
+
+# ===============================================
+# XA Database JSON1 Scan (SQLite-side JSON decoding)
+# ===============================================
+# The snapshot layout stores inventories as JSON arrays. Instead of json.loads() on every
+# blob, this path lets SQLite's JSON1 functions (json_each/json_extract) walk the arrays,
+# filter to treasure/coffer/dye item IDs and GROUP BY character, so Python only sees a few
+# pre-aggregated rows per character. Falls back to _scan_xa_characters_python when the
+# SQLite build has no JSON1 support or USE_SQLITE_JSON_SCAN is disabled.
+# Off by default: older SQLite JSON parsers (e.g. 3.40) are slower than Python's json module
+# on these blobs. `python "Landing Page.py" --benchmark` compares both paths on this machine.
+
+
+def _xa_json_array(column):
+    """SQL expression that yields column when it holds a valid JSON array, else an empty array"""
+    return f"(CASE WHEN json_valid({column}) AND json_type({column}) = 'array' THEN {column} ELSE '[]' END)"
+
+
+def _xa_json_int(*keys):
+    """SQL expression reading the first non-null integer key from json_each's current value"""
+    return "CAST(COALESCE(" + ", ".join(f"json_extract(j.value, '$.{key}')" for key in keys) + ") AS INTEGER)"
+
+
+def _xa_json_text(*keys):
+    return "CAST(COALESCE(" + ", ".join(f"json_extract(j.value, '$.{key}')" for key in keys) + ", '') AS TEXT)"
+
+
+def sqlite_has_json1(conn):
+    """Return True if this SQLite build supports the JSON1 functions"""
+    try:
+        conn.execute("SELECT json_valid('[]'), json_extract('{\"a\": 1}', '$.a')").fetchone()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def _scan_xa_characters_json1(c, xa_character_columns, fields=XA_SCAN_FIELDS):
+    """Scan the xa_characters snapshot layout with JSON1 aggregates (same result as the Python path)"""
+    result = {}
+    for row in c.execute(
+        f"SELECT {', '.join(_xa_character_base_select(xa_character_columns, fields))} FROM xa_characters"
+    ).fetchall():
+        cid, entry, _ = _new_xa_entry_from_base_row(row, fields)
+        result[cid] = entry
+
+    if "treasure" in fields:
+        # Treasure / coffer / dye tallies: only tracked item IDs leave SQLite, already summed per character.
+        # MATERIALIZED keeps SQLite from re-evaluating the json_extract() calls in both WHERE and SUM.
+        tracked_ids = ", ".join(str(int(item_id)) for item_id in sorted(TREASURE_IDS | COFFER_DYE_IDS))
+        item_sources = " UNION ALL ".join(
+            f"""SELECT x.content_id AS content_id, {_xa_json_int('ItemId', 'item_id')} AS item_id,
+                       {_xa_json_int('Quantity', 'quantity')} AS qty, {is_marketboard} AS is_mb
+                FROM xa_characters x, json_each({_xa_json_array('x.' + column)}) j
+                WHERE j.type = 'object'"""
+            for column, is_marketboard in (("items_json", 0), ("retainer_items_json", 0), ("listings_json", 1))
+        )
+        for cid, item_id, is_mb, qty in c.execute(f"""
+            WITH item_rows AS MATERIALIZED ({item_sources})
+            SELECT content_id, item_id, is_mb, SUM(qty) FROM item_rows
+            WHERE item_id IN ({tracked_ids}) AND qty > 0
+            GROUP BY content_id, item_id, is_mb
+        """).fetchall():
+            if cid in result:
+                _xa_tally_item(result[cid], item_id, qty, is_marketboard=bool(is_mb))
+
+    if "currencies" in fields:
+        # Currencies (array order kept so duplicate names resolve the same way as the Python path)
+        for cid, name, amount in c.execute(f"""
+            SELECT cid, name, amount FROM (
+                SELECT x.rowid AS rid, j.key AS k, x.content_id AS cid,
+                       {_xa_json_text('Name', 'currency_name')} AS name, {_xa_json_int('Amount', 'amount')} AS amount
+                FROM xa_characters x, json_each({_xa_json_array('x.currencies_json')}) j
+                WHERE j.type = 'object'
+            ) WHERE name != '' AND amount > 0
+            ORDER BY rid, k
+        """).fetchall():
+            r = result.get(cid)
+            if r is None:
+                continue
+            r["all_currencies"][name] = amount
+            if name == "Venture Coins":
+                r["venture_coins"] = amount
+
+    if "levels" in fields:
+        for cid, name, abbr, level in c.execute(f"""
+            SELECT cid, name, abbr, level FROM (
+                SELECT x.rowid AS rid, j.key AS k, x.content_id AS cid,
+                       {_xa_json_text('Name', 'name')} AS name, {_xa_json_text('Abbreviation', 'abbreviation')} AS abbr,
+                       {_xa_json_int('Level', 'level')} AS level
+                FROM xa_characters x, json_each({_xa_json_array('x.jobs_json')}) j
+                WHERE j.type = 'object'
+            ) WHERE level > 0
+            ORDER BY rid, k
+        """).fetchall():
+            if cid in result:
+                _xa_add_job(result[cid], name, abbr, level)
+
+        for r in result.values():
+            if r["highest_job"]:
+                r["current_job"] = r["highest_job"]
+                r["current_level"] = r["highest_level"]
+
+    if "msq" in fields:
+        # Completed MSQ milestones (first present key decides, like _xa_read_bool)
+        for cid, quest_id in c.execute(f"""
+            SELECT cid, quest_id FROM (
+                SELECT x.rowid AS rid, j.key AS k, x.content_id AS cid,
+                       {_xa_json_int('QuestRowId', 'quest_row_id')} AS quest_id,
+                       CASE WHEN json_type(j.value, '$.IsComplete') IS NOT NULL
+                            THEN COALESCE(json_extract(j.value, '$.IsComplete'), 0)
+                            ELSE COALESCE(json_extract(j.value, '$.is_complete'), 0) END AS is_complete
+                FROM xa_characters x, json_each({_xa_json_array('x.msq_milestones_json')}) j
+                WHERE j.type = 'object'
+            ) WHERE is_complete AND quest_id > 0
+            ORDER BY rid, k
+        """).fetchall():
+            if cid in result:
+                result[cid]["completed_quests"].append(quest_id)
+    return result
+
+
+def read_xa_db(db_path, fields=None, use_json1=None):
     """
-    Scan XA Database (xa.db) and return comprehensive character data.
+    Scan XA Database (xa.db) and return comprehensive character data (uncached, see scan_xa_db).
     Replaces Altoholic - reads from pluginConfigs/XADatabase/xa.db.
+    fields: XA_SCAN_FIELDS groups to read (None = all); entries only contain those groups' keys.
+    use_json1: None = USE_SQLITE_JSON_SCAN setting, True/False forces the JSON1/Python path.
     Returns: { content_id: {
         "treasure_value": int, "coffer_dye_value": int, "coffer_count": int,
         "dye_count": int, "dye_pure_white": int, "dye_jet_black": int,
@@ -1584,280 +2288,270 @@ def scan_xa_db(db_path):
         "highest_job": str, "highest_level": int,
         "lowest_job": str, "lowest_level": int,
         "all_jobs": dict, "all_currencies": dict, "completed_quests": list,
+        "personal_estate": str, "fc_estate": str,
     }}
     """
     result = {}
     if not os.path.isfile(db_path):
         return result
+    fields = normalize_xa_fields(fields)
+    if use_json1 is None:
+        use_json1 = USE_SQLITE_JSON_SCAN
 
-    def _load_json_list(raw_value):
-        if not raw_value or raw_value == "null":
-            return []
-        try:
-            parsed = json.loads(raw_value)
-        except Exception:
-            return []
-        return parsed if isinstance(parsed, list) else []
-
-    def _read_fc_gil(raw_value):
-        if not raw_value or raw_value == "null":
-            return 0
-        try:
-            parsed = json.loads(raw_value)
-        except Exception:
-            return 0
-        if isinstance(parsed, dict):
-            return _read_int(parsed, "FcGil", "fc_gil")
-        if isinstance(parsed, list):
-            total = 0
-            for entry in parsed:
-                if isinstance(entry, dict):
-                    total += _read_int(entry, "FcGil", "fc_gil")
-            return total
-        return 0
-
-    def _read_int(entry, *keys):
-        for key in keys:
-            if key in entry and entry[key] is not None:
-                try:
-                    return int(entry[key])
-                except Exception:
-                    continue
-        return 0
-
-    def _read_bool(entry, *keys):
-        for key in keys:
-            if key in entry:
-                return bool(entry[key])
-        return False
-
-    def _read_text(entry, *keys):
-        for key in keys:
-            value = entry.get(key)
-            if value is not None:
-                return str(value)
-        return ""
-    
-    def _tally_item(r, item_id, qty, is_marketboard=False):
-        """Process a single item for treasure/coffer/dye tracking."""
-        if item_id in TREASURE_IDS:
-            r["treasure_value"] += qty * TREASURE_VALUES[item_id]
-        if item_id in COFFER_DYE_IDS:
-            if item_id == 32161:  # Venture Coffer
-                r["coffer_dye_value"] += qty * item_values.get("venture_coffer", COFFER_DYE_VALUES[item_id])
-                r["coffer_count"] += qty
-            elif item_id == 13114:  # Pure White Dye
-                r["coffer_dye_value"] += qty * item_values.get("pure_white_dye", COFFER_DYE_VALUES[item_id])
-                r["dye_count"] += qty
-                r["dye_pure_white"] += qty
-                if is_marketboard:
-                    r["mb_dye_count"] += qty
-            elif item_id == 13115:  # Jet Black Dye
-                r["coffer_dye_value"] += qty * item_values.get("jet_black_dye", COFFER_DYE_VALUES[item_id])
-                r["dye_count"] += qty
-                r["dye_jet_black"] += qty
-                if is_marketboard:
-                    r["mb_dye_count"] += qty
-            elif item_id == 13708:  # Pastel Pink Dye
-                r["coffer_dye_value"] += qty * item_values.get("pastel_pink_dye", COFFER_DYE_VALUES[item_id])
-                r["dye_count"] += qty
-                r["dye_pastel_pink"] += qty
-                if is_marketboard:
-                    r["mb_dye_count"] += qty
-            else:
-                r["coffer_dye_value"] += qty * COFFER_DYE_VALUES.get(item_id, 0)
-    
     try:
-        conn = sqlite3.connect(db_path)
+        conn = get_sqlite_connection(db_path)
+        if conn is None:
+            return result
         c = conn.cursor()
-        tables = {row[0] for row in c.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()}
+        tables = get_sqlite_schema(conn, db_path)
 
         if "xa_characters" in tables:
-            xa_character_columns = {row[1] for row in c.execute("PRAGMA table_info(xa_characters)").fetchall()}
-            select_parts = [
-                "content_id",
-                "currencies_json",
-                "jobs_json",
-                "items_json",
-                "listings_json",
-                "retainer_items_json",
-                "msq_milestones_json",
-                "personal_estate" if "personal_estate" in xa_character_columns else "'' AS personal_estate",
-                "fc_estate" if "fc_estate" in xa_character_columns else "'' AS fc_estate",
-                "free_company_json" if "free_company_json" in xa_character_columns else "'null' AS free_company_json",
-                "COALESCE(fc_points, 0)" if "fc_points" in xa_character_columns else "0 AS fc_points",
-            ]
-            rows = c.execute(f"SELECT {', '.join(select_parts)} FROM xa_characters").fetchall()
-            for row in rows:
-                cid = row[0]
-                result[cid] = {
-                    "treasure_value": 0, "coffer_dye_value": 0, "coffer_count": 0,
-                    "dye_count": 0, "dye_pure_white": 0, "dye_jet_black": 0,
-                    "dye_pastel_pink": 0, "mb_dye_count": 0, "venture_coins": 0, "fc_gil": 0,
-                    "fc_points": int(row[10] or 0),
-                    "current_job": "", "current_level": 0,
-                    "highest_job": "", "highest_level": 0,
-                    "lowest_job": "", "lowest_level": 0,
-                    "all_jobs": {}, "all_currencies": {}, "completed_quests": [],
-                    "personal_estate": row[7] or "",
-                    "fc_estate": row[8] or "",
-                }
-                result[cid]["fc_gil"] = _read_fc_gil(row[9])
-
-                for item in _load_json_list(row[3]):
-                    item_id = _read_int(item, "ItemId", "item_id")
-                    qty = _read_int(item, "Quantity", "quantity")
-                    if item_id > 0 and qty > 0:
-                        _tally_item(result[cid], item_id, qty)
-
-                for item in _load_json_list(row[5]):
-                    item_id = _read_int(item, "ItemId", "item_id")
-                    qty = _read_int(item, "Quantity", "quantity")
-                    if item_id > 0 and qty > 0:
-                        _tally_item(result[cid], item_id, qty)
-
-                for item in _load_json_list(row[4]):
-                    item_id = _read_int(item, "ItemId", "item_id")
-                    qty = _read_int(item, "Quantity", "quantity")
-                    if item_id > 0 and qty > 0:
-                        _tally_item(result[cid], item_id, qty, is_marketboard=True)
-
-                for currency in _load_json_list(row[1]):
-                    name = _read_text(currency, "Name", "currency_name")
-                    amount = _read_int(currency, "Amount", "amount")
-                    if not name or amount <= 0:
-                        continue
-                    result[cid]["all_currencies"][name] = amount
-                    if name == "Venture Coins":
-                        result[cid]["venture_coins"] = amount
-
-                for job in _load_json_list(row[2]):
-                    level = _read_int(job, "Level", "level")
-                    if level <= 0:
-                        continue
-                    abbr = _read_text(job, "Abbreviation", "abbreviation")
-                    name = _read_text(job, "Name", "name")
-                    r = result[cid]
-                    job_key = XA_JOB_NAME_TO_KEY.get(name, name)
-                    r["all_jobs"][job_key] = level
-                    if level > r["highest_level"]:
-                        r["highest_level"] = level
-                        r["highest_job"] = abbr
-                    if r["lowest_level"] == 0 or level < r["lowest_level"]:
-                        r["lowest_level"] = level
-                        r["lowest_job"] = abbr
-
-                if result[cid]["highest_job"]:
-                    result[cid]["current_job"] = result[cid]["highest_job"]
-                    result[cid]["current_level"] = result[cid]["highest_level"]
-
-                for milestone in _load_json_list(row[6]):
-                    if not _read_bool(milestone, "IsComplete", "is_complete"):
-                        continue
-                    quest_id = _read_int(milestone, "QuestRowId", "quest_row_id")
-                    if quest_id > 0:
-                        result[cid]["completed_quests"].append(quest_id)
-
-            conn.close()
+            xa_character_columns = tables["xa_characters"]
+            result = None
+            if use_json1 and sqlite_has_json1(conn):
+                try:
+                    result = _scan_xa_characters_json1(c, xa_character_columns, fields)
+                except sqlite3.Error as e:
+                    print(f"[XA-DB] JSON1 scan failed for '{db_path}', using Python scan: {e}")
+            if result is None:
+                result = _scan_xa_characters_python(c, xa_character_columns, fields)
             return result
-        
+
         # Get all character content_ids
         char_rows = c.execute("SELECT content_id FROM characters").fetchall()
         for (cid,) in char_rows:
-            result[cid] = {
-                "treasure_value": 0, "coffer_dye_value": 0, "coffer_count": 0,
-                "dye_count": 0, "dye_pure_white": 0, "dye_jet_black": 0,
-                "dye_pastel_pink": 0, "mb_dye_count": 0, "venture_coins": 0, "fc_gil": 0, "fc_points": 0,
-                "current_job": "", "current_level": 0,
-                "highest_job": "", "highest_level": 0,
-                "lowest_job": "", "lowest_level": 0,
-                "all_jobs": {}, "all_currencies": {}, "completed_quests": [],
-                "personal_estate": "", "fc_estate": "",
-            }
+            result[cid] = _new_xa_entry(fields)
 
-        if "free_companies" in tables:
-            fc_columns = {row[1] for row in c.execute("PRAGMA table_info(free_companies)").fetchall()}
+        if "fc" in fields and "free_companies" in tables:
+            fc_columns = tables["free_companies"]
             if {"content_id", "fc_points"}.issubset(fc_columns):
                 for cid, fc_points in c.execute("SELECT content_id, COALESCE(fc_points, 0) FROM free_companies").fetchall():
                     if cid in result:
                         result[cid]["fc_points"] = max(result[cid].get("fc_points", 0), fc_points or 0)
-        
-        # Build retainer_id -> content_id map
-        retainer_map = {}
-        for row in c.execute("SELECT retainer_id, content_id FROM retainers").fetchall():
-            retainer_map[row[0]] = row[1]
-        
-        # Scan container_items (character inventory, saddlebag, armory)
-        for row in c.execute("SELECT content_id, item_id, quantity FROM container_items").fetchall():
-            cid, item_id, qty = row[0], row[1], row[2]
-            if cid in result:
-                _tally_item(result[cid], item_id, qty)
-        
-        # Scan retainer_items (retainer inventory - not on MB)
-        for row in c.execute("SELECT retainer_id, item_id, quantity FROM retainer_items").fetchall():
-            cid = retainer_map.get(row[0])
-            if cid and cid in result:
-                _tally_item(result[cid], row[1], row[2])
-        
-        # Scan retainer_listings (items listed on marketboard)
-        for row in c.execute("SELECT retainer_id, item_id, quantity FROM retainer_listings").fetchall():
-            cid = retainer_map.get(row[0])
-            if cid and cid in result:
-                _tally_item(result[cid], row[1], row[2], is_marketboard=True)
-        
-        # Currency balances (Gil, Venture Coins, Tomestones, etc.)
-        for row in c.execute("SELECT content_id, currency_name, amount FROM currency_balances WHERE amount > 0").fetchall():
-            cid, name, amount = row[0], row[1], row[2]
-            if cid in result:
-                result[cid]["all_currencies"][name] = amount
-                if name == "Venture Coins":
-                    result[cid]["venture_coins"] = amount
-        
-        # Job levels (all jobs with level > 0)
-        for row in c.execute("SELECT content_id, abbreviation, name, level FROM job_levels WHERE level > 0").fetchall():
-            cid, abbr, name, level = row[0], row[1], row[2], row[3]
-            if cid in result:
-                r = result[cid]
-                job_key = XA_JOB_NAME_TO_KEY.get(name, name)
-                r["all_jobs"][job_key] = level
-                if level > r["highest_level"]:
-                    r["highest_level"] = level
-                    r["highest_job"] = abbr
-                if r["lowest_level"] == 0 or level < r["lowest_level"]:
-                    r["lowest_level"] = level
-                    r["lowest_job"] = abbr
-        
-        # Set current_job/current_level to highest (xa.db doesn't track "last played" like Altoholic)
-        for cid, r in result.items():
-            if r["highest_job"]:
-                r["current_job"] = r["highest_job"]
-                r["current_level"] = r["highest_level"]
-        
-        # MSQ milestones (completed quests)
-        for row in c.execute("SELECT content_id, quest_row_id FROM msq_milestones WHERE is_complete = 1").fetchall():
-            cid, quest_id = row[0], row[1]
-            if cid in result:
-                result[cid]["completed_quests"].append(quest_id)
-        
-        conn.close()
+
+        if "treasure" in fields:
+            # Build retainer_id -> content_id map
+            retainer_map = {}
+            for row in c.execute("SELECT retainer_id, content_id FROM retainers").fetchall():
+                retainer_map[row[0]] = row[1]
+
+            # Scan container_items (character inventory, saddlebag, armory)
+            for row in c.execute("SELECT content_id, item_id, quantity FROM container_items").fetchall():
+                cid, item_id, qty = row[0], row[1], row[2]
+                if cid in result:
+                    _xa_tally_item(result[cid], item_id, qty)
+
+            # Scan retainer_items (retainer inventory - not on MB)
+            for row in c.execute("SELECT retainer_id, item_id, quantity FROM retainer_items").fetchall():
+                cid = retainer_map.get(row[0])
+                if cid and cid in result:
+                    _xa_tally_item(result[cid], row[1], row[2])
+
+            # Scan retainer_listings (items listed on marketboard)
+            for row in c.execute("SELECT retainer_id, item_id, quantity FROM retainer_listings").fetchall():
+                cid = retainer_map.get(row[0])
+                if cid and cid in result:
+                    _xa_tally_item(result[cid], row[1], row[2], is_marketboard=True)
+
+        if "currencies" in fields:
+            # Currency balances (Gil, Venture Coins, Tomestones, etc.)
+            for row in c.execute("SELECT content_id, currency_name, amount FROM currency_balances WHERE amount > 0").fetchall():
+                cid, name, amount = row[0], row[1], row[2]
+                if cid in result:
+                    result[cid]["all_currencies"][name] = amount
+                    if name == "Venture Coins":
+                        result[cid]["venture_coins"] = amount
+
+        if "levels" in fields:
+            # Job levels (all jobs with level > 0)
+            for row in c.execute("SELECT content_id, abbreviation, name, level FROM job_levels WHERE level > 0").fetchall():
+                cid, abbr, name, level = row[0], row[1], row[2], row[3]
+                if cid in result:
+                    _xa_add_job(result[cid], name, abbr, level)
+
+            # Set current_job/current_level to highest (xa.db doesn't track "last played" like Altoholic)
+            for cid, r in result.items():
+                if r["highest_job"]:
+                    r["current_job"] = r["highest_job"]
+                    r["current_level"] = r["highest_level"]
+
+        if "msq" in fields:
+            # MSQ milestones (completed quests)
+            for row in c.execute("SELECT content_id, quest_row_id FROM msq_milestones WHERE is_complete = 1").fetchall():
+                cid, quest_id = row[0], row[1]
+                if cid in result:
+                    result[cid]["completed_quests"].append(quest_id)
     except Exception as e:
         print(f"[WARNING] Failed to scan XA Database '{db_path}': {e}")
+
+    return result
+
+
+# ===============================================
+# XA Database Scan Cache
+# ===============================================
+# XA Database writes in WAL mode, so a commit may only touch xa.db-wal (and a reused WAL
+# can keep the same size). A scan is reused until the xa.db or xa.db-wal signature changes
+# or SQLite's PRAGMA data_version reports a commit from another connection.
+# Results are cached per field group ("parts"), so a /map/ scan of {"housing", "levels"} and a
+# later full scan share the groups they have in common; merged views are cached per field set.
+_xa_scan_cache = {}  # db_path -> {"signature": (...), "parts": {group: {content_id: {...}}}, "views": {frozenset: {...}}}
+_xa_scan_probes = {}  # db_path -> {"db_signature": (mtime_ns, size), "conn": sqlite3.Connection}
+_xa_scan_cache_lock = threading.Lock()
+xa_scan_cache_stats = {"hits": 0, "misses": 0, "partial_hits": 0}
+
+
+def _read_xa_data_version(db_path, db_signature):
+    """Read PRAGMA data_version from a long-lived probe connection (caller holds _xa_scan_cache_lock)"""
+    probe = _xa_scan_probes.get(db_path)
+    # Reopen when xa.db itself changed so a replaced file isn't probed through a stale handle
+    if probe is None or probe["db_signature"] != db_signature:
+        if probe is not None:
+            try:
+                probe["conn"].close()
+            except Exception:
+                pass
+        try:
+            probe = {"db_signature": db_signature, "conn": connect_sqlite_readonly(db_path)}
+        except sqlite3.Error:
+            _xa_scan_probes.pop(db_path, None)
+            return None
+        _xa_scan_probes[db_path] = probe
+    try:
+        return probe["conn"].execute("PRAGMA data_version").fetchone()[0]
+    except sqlite3.Error:
+        return None
+
+
+def get_xa_db_signature(db_path):
+    """Return a change signature for xa.db: (xa.db stat, xa.db-wal stat, data_version), or None if missing"""
+    db_signature = get_file_signature(db_path)
+    if db_signature is None:
+        return None
+    wal_signature = get_file_signature(db_path + "-wal")
+    with _xa_scan_cache_lock:
+        data_version = _read_xa_data_version(db_path, db_signature)
+    return (db_signature, wal_signature, data_version)
+
+
+def _merge_xa_parts(parts, fields):
+    """Combine cached per-group maps into one { content_id: {...} } map for the requested fields"""
+    merged = {}
+    for group in XA_SCAN_FIELDS:
+        if group not in fields:
+            continue
+        for cid, values in parts[group].items():
+            entry = merged.get(cid)
+            if entry is None:
+                entry = merged[cid] = {}
+            entry.update(values)
+    return merged
+
+
+def _split_xa_parts(result, fields):
+    """Split a read_xa_db() result into per-group maps for the scan cache"""
+    return {
+        group: {cid: {key: entry[key] for key in XA_SCAN_FIELD_KEYS[group]} for cid, entry in result.items()}
+        for group in fields
+    }
+
+
+def _get_xa_cache_entry(db_path, signature):
+    """Return the cache entry for db_path, resetting it if the signature moved on (caller holds _xa_scan_cache_lock)"""
+    entry = _xa_scan_cache.get(db_path)
+    if entry is None or entry["signature"] != signature:
+        entry = _xa_scan_cache[db_path] = {"signature": signature, "parts": {}, "views": {}}
+    return entry
+
+
+def scan_xa_db(db_path, fields=None):
+    """
+    Cached read_xa_db(): returns the same { content_id: {...} } map, only re-scanning xa.db
+    when xa.db, xa.db-wal or PRAGMA data_version changed since the last scan.
+    fields: XA_SCAN_FIELDS groups the caller needs (None = all). Only groups that aren't
+    cached yet for this file generation are read from disk.
+    The returned map is shared between callers and must be treated as read-only.
+    """
+    fields = normalize_xa_fields(fields)
+    signature = get_xa_db_signature(db_path)
+    if signature is None:
+        return {}
+    
+    with _xa_scan_cache_lock:
+        entry = _xa_scan_cache.get(db_path)
+        cached_parts = {}
+        if entry and entry["signature"] == signature:
+            view = entry["views"].get(fields)
+            if view is not None:
+                xa_scan_cache_stats["hits"] += 1
+                return view
+            cached_parts = {group: entry["parts"][group] for group in fields if group in entry["parts"]}
+            if len(cached_parts) == len(fields):
+                view = entry["views"][fields] = _merge_xa_parts(cached_parts, fields)
+                xa_scan_cache_stats["hits"] += 1
+                return view
     
+    missing = fields.difference(cached_parts)
+    result = read_xa_db(db_path, fields=missing)
+    new_parts = _split_xa_parts(result, missing)
+    # Re-check after the scan: if the database changed mid-scan, don't cache a torn result
+    # (and don't mix groups read from two different generations)
+    if get_xa_db_signature(db_path) == signature:
+        with _xa_scan_cache_lock:
+            entry = _get_xa_cache_entry(db_path, signature)
+            entry["parts"].update(new_parts)
+            parts = dict(cached_parts, **new_parts)
+            result = entry["views"][fields] = _merge_xa_parts(parts, fields)
+            xa_scan_cache_stats["partial_hits" if cached_parts else "misses"] += 1
+        return result
+    if cached_parts:
+        result = read_xa_db(db_path, fields=fields)
+    with _xa_scan_cache_lock:
+        xa_scan_cache_stats["misses"] += 1
     return result
 
 
-def extract_fc_data(full_data):
-    """Extract Free Company data from AutoRetainer config"""
+def scan_xa_gil_totals(db_path):
+    """Cached read_xa_gil_totals(): re-reads only when xa.db changed (shares scan_xa_db's change detection)"""
+    signature = get_xa_db_signature(db_path)
+    if signature is None:
+        return (0, 0, 0, 0)
+    
+    with _xa_scan_cache_lock:
+        entry = _xa_scan_cache.get(db_path)
+        if entry and entry["signature"] == signature and "gil_totals" in entry["parts"]:
+            xa_scan_cache_stats["hits"] += 1
+            return entry["parts"]["gil_totals"]
+    
+    totals = read_xa_gil_totals(db_path)
+    unchanged = get_xa_db_signature(db_path) == signature
+    with _xa_scan_cache_lock:
+        if unchanged:
+            _get_xa_cache_entry(db_path, signature)["parts"]["gil_totals"] = totals
+        xa_scan_cache_stats["misses"] += 1
+    return totals
+
+
+def _fc_entry(obj):
+    """FC record kept per holder character: name and FC points"""
+    return {
+        "Name": obj.get("Name", "Unknown FC"),
+        "FCPoints": obj.get("FCPoints", 0)
+    }
+
+
+def extract_fc_data_full_walk(full_data):
+    """
+    Extract Free Company data by walking the entire AutoRetainer config for any
+    dict carrying "HolderChara". Slow on large configs; used as the fallback for
+    extract_fc_data when the FCData section isn't where we expect it.
+    """
     fc_data = {}
     
     def recursive_search(obj):
         if isinstance(obj, dict):
             if "HolderChara" in obj:
-                holder_id = obj["HolderChara"]
-                fc_data[holder_id] = {
-                    "Name": obj.get("Name", "Unknown FC"),
-                    "FCPoints": obj.get("FCPoints", 0)
-                }
+                fc_data[obj["HolderChara"]] = _fc_entry(obj)
             for v in obj.values():
                 recursive_search(v)
         elif isinstance(obj, list):
@@ -1868,6 +2562,33 @@ def extract_fc_data(full_data):
     return fc_data
 
 
+def extract_fc_data(full_data):
+    """
+    Extract Free Company data from AutoRetainer config.
+    AutoRetainer keeps FCs in the top-level "FCData" section ({FC ID: {"HolderChara", "Name",
+    "FCPoints", ...}}), so that section is read directly instead of walking the whole file.
+    If the section is missing or doesn't look like FC records (a config layout change),
+    falls back to the full walk so FCs aren't silently dropped.
+    """
+    section = full_data.get("FCData") if isinstance(full_data, dict) else None
+    if isinstance(section, dict):
+        entries = list(section.values())
+    elif isinstance(section, list):
+        entries = section
+    else:
+        print("[FC] No FCData section in config, falling back to full config walk")
+        return extract_fc_data_full_walk(full_data)
+    
+    fc_data = {}
+    for obj in entries:
+        if not isinstance(obj, dict) or "HolderChara" not in obj:
+            # Unrecognised entry shape - don't trust the targeted read
+            print("[FC] FCData entries missing HolderChara, falling back to full config walk")
+            return extract_fc_data_full_walk(full_data)
+        fc_data[obj["HolderChara"]] = _fc_entry(obj)
+    return fc_data
+
+
 def collect_characters(full_data, account_nickname):
     """Extract characters from AutoRetainer JSON data"""
     all_chars = []
@@ -1885,8 +2606,475 @@ def collect_characters(full_data, account_nickname):
     return all_chars
 
 
-def parse_submarine_data(char_data):
-    """Parse submarine data from character"""
+# ===============================================
+# AutoRetainer Config Cache
+# ===============================================
+# DefaultConfig.json can be tens of MB per account (often on network shares) and every
+# page needs it. Parsed results are cached process-wide and only re-read when the
+# file's (mtime_ns, size) signature changes.
+_ar_config_cache = {}  # auto_path -> {"signature": (mtime_ns, size), "characters": [...], "fc_data": {...}, "plan_names": {...}}
+_ar_config_cache_lock = threading.Lock()
+ar_config_cache_stats = {"hits": 0, "misses": 0}
+
+
+def get_file_signature(path):
+    """Return (mtime_ns, size) for a file, or None if it can't be stat'd"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def load_autoretainer_config(auto_path, account_nickname):
+    """
+    Load an AutoRetainer DefaultConfig.json with characters, FC data and plan names pre-extracted.
+    Unchanged files are served from the cache without being re-read.
+    Returns: {"characters": list, "fc_data": dict, "plan_names": dict}
+    Raises OSError/ValueError if the file can't be read or parsed (same as json.load).
+    The returned structures are shared between callers and must be treated as read-only.
+    """
+    signature = get_file_signature(auto_path)
+    if signature is None:
+        raise FileNotFoundError(f"Config not found: {auto_path}")
+    
+    with _ar_config_cache_lock:
+        entry = _ar_config_cache.get(auto_path)
+        if entry and entry["signature"] == signature and entry["nickname"] == account_nickname:
+            ar_config_cache_stats["hits"] += 1
+            return entry
+    
+    # Parse outside the lock so one slow share doesn't block other accounts
+    with open(auto_path, 'r', encoding='utf-8-sig') as f:
+        data = json.load(f)
+    
+    entry = {
+        "signature": signature,
+        "nickname": account_nickname,
+        "characters": collect_characters(data, account_nickname),
+        "fc_data": extract_fc_data(data),
+        "plan_names": extract_plan_names(data),
+    }
+    with _ar_config_cache_lock:
+        ar_config_cache_stats["misses"] += 1
+        _ar_config_cache[auto_path] = entry
+    return entry
+
+
+# Lifestream configs are small but are read for every account on every build; the parsed
+# housing map is kept until the file's signature changes, like DefaultConfig.json above.
+_lifestream_cache = {}  # lfstrm_path -> {"signature": (mtime_ns, size), "housing_map": {...}}
+_lifestream_cache_lock = threading.Lock()
+lifestream_cache_stats = {"hits": 0, "misses": 0}
+
+
+def load_lifestream_cached(lfstrm_path):
+    """
+    Return load_lifestream_data(lfstrm_path), re-reading the file only when its signature changes.
+    The returned housing map is shared between callers and must be treated as read-only.
+    """
+    signature = get_file_signature(lfstrm_path)
+    if signature is None:
+        return {}
+    with _lifestream_cache_lock:
+        entry = _lifestream_cache.get(lfstrm_path)
+        if entry and entry["signature"] == signature:
+            lifestream_cache_stats["hits"] += 1
+            return entry["housing_map"]
+    
+    housing_map = load_lifestream_data(lfstrm_path)
+    with _lifestream_cache_lock:
+        lifestream_cache_stats["misses"] += 1
+        _lifestream_cache[lfstrm_path] = {"signature": signature, "housing_map": housing_map}
+    return housing_map
+
+
+# ===============================================
+# Parallel Account Loading
+# ===============================================
+# Loading an account is almost entirely I/O wait on network shares (DefaultConfig.json,
+# xa.db, Lifestream config), so accounts are loaded on a bounded thread pool and then
+# merged serially in account_locations order so totals and ordering match a serial run.
+# open()/sqlite3.connect() on a hung UNC share never time out, so each account gets a
+# deadline (ACCOUNT_LOAD_TIMEOUT). A late account is served from its last good load,
+# marked stale with its age, while the hung read keeps running in the background.
+# Each account has at most one read (load or signature stat) outstanding, so an account
+# stuck on a hung share ties up a single worker and the other accounts keep loading.
+account_load_stats = {"accounts": 0, "workers": 0, "wall_seconds": 0.0, "serial_seconds": 0.0, "stale_accounts": 0}
+_account_executor = None
+_account_executor_lock = threading.Lock()
+_account_inflight = {}  # auto_path -> (kind, Future, start time) of the account's outstanding read
+_last_good_account_sources = {}  # auto_path -> sources dict from the last load that finished in time
+_last_account_signatures = {}  # auto_path -> last signature read within the deadline
+
+
+def _get_account_executor():
+    """Return the shared account loader pool (long-lived so hung reads never block a request)"""
+    global _account_executor
+    with _account_executor_lock:
+        if _account_executor is None:
+            _account_executor = ThreadPoolExecutor(
+                max_workers=max(1, int(ACCOUNT_LOAD_WORKERS or 1)),
+                thread_name_prefix="account-loader",
+            )
+        return _account_executor
+
+
+def submit_account_read(account, kind, fn, *args):
+    """
+    Run fn(*args) for an account on the loader pool unless one of its reads is still running.
+    kind names what fn returns ("load" = sources dict, "signature" = get_account_signature()).
+    Returns the account's outstanding read as (kind, future, started): the new one, or an earlier
+    one still running, which may be of the other kind.
+    """
+    executor = _get_account_executor()
+    with _account_executor_lock:
+        read = _account_inflight.get(account["auto_path"])
+        if read is not None and not read[1].done():
+            return read
+        read = (kind, executor.submit(fn, *args), time.perf_counter())
+        _account_inflight[account["auto_path"]] = read
+        return read
+
+
+def account_read_timeout(started):
+    """Seconds left before a read started at `started` misses ACCOUNT_LOAD_TIMEOUT (None = no deadline)"""
+    if not ACCOUNT_LOAD_TIMEOUT or ACCOUNT_LOAD_TIMEOUT <= 0:
+        return None
+    return max(0.0, started + ACCOUNT_LOAD_TIMEOUT - time.perf_counter())
+
+
+def format_age(seconds):
+    """Format an age in seconds as a short string (45s, 12m, 3h 5m, 2d 4h)"""
+    seconds = int(max(0, seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes = seconds // 60
+    if minutes < 60:
+        return f"{minutes}m"
+    hours = minutes // 60
+    if hours < 24:
+        return f"{hours}h {minutes % 60}m"
+    return f"{hours // 24}d {hours % 24}h"
+
+
+def load_account_sources(account):
+    """
+    Load everything one account needs from disk (every xa.db field group and housing).
+    Returns: {"account": dict, "ar_config": dict|None, "error": str|None,
+              "alto_map": dict, "housing_map": dict, "signatures": tuple, "load_seconds": float,
+              "loaded_at": float, "stale": bool, "stale_seconds": float}
+    """
+    started = time.perf_counter()
+    sources = {
+        "account": account,
+        "ar_config": None,
+        "error": None,
+        "alto_map": {},
+        "housing_map": {},
+        "stale": False,
+        "stale_seconds": 0,
+    }
+    simulated_delay = SIMULATE_SLOW_ACCOUNTS.get(account["nickname"], 0)
+    if simulated_delay:
+        time.sleep(simulated_delay)
+    
+    # Taken before reading, so a write that lands mid-load shows up as a change next build
+    sources["signatures"] = get_account_signature(account)
+    
+    auto_path = account["auto_path"]
+    if not os.path.isfile(auto_path):
+        sources["error"] = f"Config not found: {auto_path}"
+    else:
+        try:
+            sources["ar_config"] = load_autoretainer_config(auto_path, account["nickname"])
+        except Exception as e:
+            sources["error"] = f"Failed to load: {e}"
+    
+    if sources["ar_config"] is not None:
+        xa_db_path = account.get("xa_db_path", "")
+        if xa_db_path:
+            sources["alto_map"] = scan_xa_db(xa_db_path)
+        lfstrm_path = account.get("lfstrm_path", "")
+        if lfstrm_path:
+            sources["housing_map"] = load_lifestream_cached(lfstrm_path)
+    
+    sources["load_seconds"] = time.perf_counter() - started
+    sources["loaded_at"] = time.time()
+    return sources
+
+
+def _stale_account_sources(key, account):
+    """Return the last good sources for an account that missed its deadline, marked stale"""
+    last_good = _last_good_account_sources.get(key)
+    if last_good is None:
+        return {
+            "account": account,
+            "ar_config": None,
+            "error": f"Timed out after {ACCOUNT_LOAD_TIMEOUT}s reading account files (no earlier data to show yet)",
+            "alto_map": {},
+            "housing_map": {},
+            "signatures": None,
+            "load_seconds": 0,
+            "loaded_at": None,
+            "stale": True,
+            "stale_seconds": 0,
+        }
+    stale = dict(last_good)
+    stale["stale"] = True
+    stale["stale_seconds"] = time.time() - last_good["loaded_at"]
+    return stale
+
+
+def load_all_account_sources():
+    """
+    Load all configured accounts on a bounded thread pool; results keep account_locations order.
+    Load once per model build and pass the result to the views. Accounts that miss ACCOUNT_LOAD_TIMEOUT are returned from their last good load with
+    stale=True; a read still hanging from an earlier build isn't waited on again.
+    """
+    accounts = list(account_locations)
+    started = time.perf_counter()
+    reads = [submit_account_read(account, "load", load_account_sources, account) for account in accounts]
+    # Accounts still busy with a signature stat get their load once it finishes; all of them are
+    # submitted before any load is waited on, so their deadlines run in parallel
+    for i, account in enumerate(accounts):
+        try:
+            while reads[i][0] != "load":
+                reads[i][1].result(timeout=account_read_timeout(reads[i][2]))
+                reads[i] = submit_account_read(account, "load", load_account_sources, account)
+        except FutureTimeoutError:
+            pass
+    
+    results = []
+    for account, (kind, future, read_started) in zip(accounts, reads):
+        key = account["auto_path"]
+        try:
+            if kind != "load":
+                # The stat hung: this account's share isn't answering
+                raise FutureTimeoutError()
+            sources = future.result(timeout=account_read_timeout(read_started))
+        except FutureTimeoutError:
+            sources = _stale_account_sources(key, account)
+            print(f"[ACCOUNTS] {account['nickname']} missed the {ACCOUNT_LOAD_TIMEOUT}s deadline, "
+                  f"serving {'last good data' if sources['loaded_at'] else 'an error'}")
+        else:
+            if not sources["error"]:
+                _last_good_account_sources[key] = sources
+        results.append(sources)
+    
+    wall_seconds = time.perf_counter() - started
+    serial_seconds = sum(r["load_seconds"] for r in results if not r["stale"])
+    workers = max(1, int(ACCOUNT_LOAD_WORKERS or 1))
+    account_load_stats.update({
+        "accounts": len(accounts),
+        "workers": workers,
+        "wall_seconds": round(wall_seconds, 4),
+        "serial_seconds": round(serial_seconds, 4),
+        "stale_accounts": sum(1 for r in results if r["stale"]),
+    })
+    if DEBUG:
+        print(f"[ACCOUNTS] Loaded {len(accounts)} accounts in {wall_seconds:.3f}s "
+              f"with {workers} workers (sum of per-account load times: {serial_seconds:.3f}s)")
+    return results
+
+
+def get_account_signature(account):
+    """Return change signatures for one account's AutoRetainer, Lifestream and XA Database files"""
+    return (
+        get_file_signature(account["auto_path"]),
+        get_file_signature(account["lfstrm_path"]) if account.get("lfstrm_path") else None,
+        get_xa_db_signature(account["xa_db_path"]) if account.get("xa_db_path") else None,
+    )
+
+
+def get_account_signatures():
+    """
+    Stat every account's files on the loader pool under the same deadline as loads.
+    An account whose load is running answers with the signature that load took. An account
+    whose read doesn't finish in time keeps its previous signature (no change seen); a read
+    still hanging from an earlier check isn't waited on again.
+    """
+    reads = [(account, submit_account_read(account, "signature", get_account_signature, account))
+             for account in list(account_locations)]
+    signatures = []
+    for account, (kind, future, started) in reads:
+        try:
+            result = future.result(timeout=account_read_timeout(started))
+            signature = result["signatures"] if kind == "load" else result
+            _last_account_signatures[account["auto_path"]] = signature
+        except FutureTimeoutError:
+            signature = _last_account_signatures.get(account["auto_path"])
+        signatures.append(signature)
+    return signatures
+
+
+# ===============================================
+# Per-Account Artifacts (incremental model builds)
+# ===============================================
+# Each view is built as a per-account partial derived only from that account's files,
+# followed by a cheap reduce over all partials into the global aggregates:
+#
+#   DefaultConfig.json ─┬─> main partial ─> summary, FC/personal plot counts, MSQ stats
+#   Lifestream config ──┤
+#   xa.db ──────────────┼─> map partial ──> FC managers, FC plot dedup, region capacity, Sub Planner
+#                       └─> subs partial ─> subs totals, per-FC point dedup
+#
+# Partials are cached against the signatures of the files they read, so when one account's
+# file changes only that account is recomputed. Partials also hold clock-derived fields
+# (ready flags, countdown text, ETAs): they expire at the account's next submarine return
+# or venture end, and a clock tick (scheduled refresh or /api/refresh) invalidates them all.
+ACCOUNT_SOURCE_KINDS = ("auto", "lifestream", "xa")  # Order of get_account_signature()
+ACCOUNT_ARTIFACT_SOURCES = {
+    "main": ("auto", "lifestream", "xa"),
+    "map": ("auto", "lifestream", "xa"),
+    "subs": ("auto", "xa"),
+}
+_account_artifact_cache = {}  # (artifact, auto_path) -> {"signature", "clock", "expires_at", "value"}
+_account_artifact_lock = threading.Lock()
+_artifact_clock = {"tick": 0}
+account_artifact_stats = {"hits": 0, "misses": 0, "expired": 0}
+
+
+def advance_artifact_clock():
+    """Invalidate every cached partial's clock-derived fields (the next build recomputes all accounts)"""
+    with _account_artifact_lock:
+        _artifact_clock["tick"] += 1
+
+
+def clear_account_artifacts():
+    """Drop all cached per-account partials"""
+    with _account_artifact_lock:
+        _account_artifact_cache.clear()
+
+
+def next_clock_change(characters, now_ts):
+    """Return the earliest submarine return / venture end after now_ts among AR characters, or None"""
+    upcoming = None
+    for char in characters:
+        for sub in char.get("OfflineSubmarineData", []):
+            if isinstance(sub, dict):
+                ts = sub.get("ReturnTime", 0)
+                if ts and ts > now_ts and (upcoming is None or ts < upcoming):
+                    upcoming = ts
+        for ret in char.get("RetainerData", []):
+            if isinstance(ret, dict):
+                ts = ret.get("VentureEndsAt", 0)
+                if ts and ts > now_ts and (upcoming is None or ts < upcoming):
+                    upcoming = ts
+    return upcoming
+
+
+def get_account_artifact(name, sources, build):
+    """
+    Return build(sources) for one account's `name` partial, reusing the cached one while the
+    files it depends on (ACCOUNT_ARTIFACT_SOURCES) are unchanged and it hasn't expired.
+    Failed and stale loads are built fresh and never cached.
+    """
+    if sources["error"] or sources["stale"] or sources.get("signatures") is None:
+        return build(sources)
+    signature = tuple(sources["signatures"][ACCOUNT_SOURCE_KINDS.index(kind)] for kind in ACCOUNT_ARTIFACT_SOURCES[name])
+    key = (name, sources["account"]["auto_path"])
+    now_ts = time.time()
+    with _account_artifact_lock:
+        tick = _artifact_clock["tick"]
+        entry = _account_artifact_cache.get(key)
+        if entry and entry["signature"] == signature and entry["clock"] == tick:
+            if entry["expires_at"] is None or entry["expires_at"] > now_ts:
+                account_artifact_stats["hits"] += 1
+                return entry["value"]
+            account_artifact_stats["expired"] += 1
+    
+    value = build(sources)
+    expires_at = next_clock_change(sources["ar_config"]["characters"], now_ts)
+    with _account_artifact_lock:
+        account_artifact_stats["misses"] += 1
+        _account_artifact_cache[key] = {"signature": signature, "clock": tick, "expires_at": expires_at, "value": value}
+    return value
+
+
+def account_source_paths(account):
+    """Return {path: source kind} for the files an account is built from (xa.db's -wal counts as xa)"""
+    paths = {account["auto_path"]: "auto"}
+    if account.get("lfstrm_path"):
+        paths[account["lfstrm_path"]] = "lifestream"
+    if account.get("xa_db_path"):
+        paths[account["xa_db_path"]] = "xa"
+        paths[account["xa_db_path"] + "-wal"] = "xa"
+    return paths
+
+
+def invalidate_changed_sources(paths):
+    """
+    Drop everything cached from the given changed files (source watcher subscriber).
+    Caches re-validate against file signatures anyway; this also catches rewrites that keep the
+    same mtime/size (coarse mtime on network shares) and frees the old data straight away.
+    """
+    paths = set(paths)
+    if QUEST_CACHE_PATH in paths:
+        # Quest levels feed MSQ progress on the main page only
+        load_quest_levels()
+        with _account_artifact_lock:
+            for key in [key for key in _account_artifact_cache if key[0] == "main"]:
+                del _account_artifact_cache[key]
+    for account in list(account_locations):
+        kinds = {kind for path, kind in account_source_paths(account).items() if path in paths}
+        if not kinds:
+            continue
+        if "auto" in kinds:
+            with _ar_config_cache_lock:
+                _ar_config_cache.pop(account["auto_path"], None)
+        if "lifestream" in kinds:
+            with _lifestream_cache_lock:
+                _lifestream_cache.pop(account["lfstrm_path"], None)
+        if "xa" in kinds:
+            with _xa_scan_cache_lock:
+                _xa_scan_cache.pop(account["xa_db_path"], None)
+        with _account_artifact_lock:
+            for name, kinds_used in ACCOUNT_ARTIFACT_SOURCES.items():
+                if kinds & set(kinds_used):
+                    _account_artifact_cache.pop((name, account["auto_path"]), None)
+
+
+def get_cache_stats():
+    """Return hit/miss counters for the data source caches"""
+    with _ar_config_cache_lock:
+        ar_config = dict(ar_config_cache_stats, entries=len(_ar_config_cache))
+    with _lifestream_cache_lock:
+        lifestream = dict(lifestream_cache_stats, entries=len(_lifestream_cache))
+    with _xa_scan_cache_lock:
+        xa_scan = dict(xa_scan_cache_stats, entries=len(_xa_scan_cache))
+    with _account_artifact_lock:
+        artifacts = dict(account_artifact_stats, entries=len(_account_artifact_cache), clock=_artifact_clock["tick"])
+    with _sqlite_pool_lock:
+        sqlite_pool = dict(sqlite_pool_stats, schemas=len(_sqlite_schema_cache))
+    with _snapshot_lock:
+        snapshots = dict(snapshot_write_stats, last_write_date=_last_snapshot_write["date"])
+    with _render_lock:
+        render = {name: dict(stats) for name, stats in render_stats.items()}
+    with _event_stream_lock:
+        events = dict(event_stream_stats, limit=event_stream_limit["max"])
+    with _compressed_cache_lock:
+        http = dict(http_cache_stats, cached_bodies=len(_compressed_cache), cached_fragments=len(_fragment_cache))
+    watcher = source_watcher.get_stats()
+    model = model_refresher.get_stats()
+    return {
+        "ar_config": ar_config,
+        "lifestream": lifestream,
+        "xa_scan": xa_scan,
+        "artifacts": artifacts,
+        "account_load": dict(account_load_stats),
+        "sqlite": sqlite_pool,
+        "snapshots": snapshots,
+        "render": render,
+        "events": events,
+        "http": http,
+        "watcher": watcher,
+        "model": model,
+    }
+
+
+def parse_submarine_data(char_data, plan_names=None):
+    """Parse submarine data from character (plan_names: the account's GUID -> plan name lookup)"""
     submarines = []
     
     # Get offline submarine data for return times
@@ -1916,7 +3104,7 @@ def parse_submarine_data(char_data):
         vessel_behavior = sub_data.get("VesselBehavior", 0)
         
         # Get plan info from config-based detection
-        is_leveling, is_farming, plan_name, plan_earnings = get_submarine_plan_info(sub_data, build)
+        is_leveling, is_farming, plan_name, plan_earnings = get_submarine_plan_info(sub_data, build, plan_names)
         
         # If no plan match and no VesselBehavior detection, use level/build fallbacks
         if not plan_name and vessel_behavior == 0:
@@ -1947,24 +3135,24 @@ def parse_submarine_data(char_data):
         
         consumption = BUILD_CONSUMPTION_RATES.get(build, DEFAULT_CONSUMPTION)
         
-        submarines.append({
-            "name": name,
-            "level": level,
-            "build": build if build else "Leveling",
-            "plan_name": plan_name,
-            "return_time": return_time,
-            "return_formatted": format_time_remaining(return_time) if return_time else "Docked",
-            "is_ready": is_ready,
-            "is_leveling": is_leveling,
-            "is_farming": is_farming,
-            "vessel_behavior": vessel_behavior,
-            "daily_gil": gil_rate,
-            "monthly_gil": gil_rate * 30,
-            "tanks_per_day": consumption["tanks_per_day"],
-            "kits_per_day": consumption["kits_per_day"],
-            "daily_cost": (consumption["tanks_per_day"] * CERULEUM_TANK_COST) + 
-                         (consumption["kits_per_day"] * REPAIR_KIT_COST),
-        })
+        submarines.append(Submarine(
+            name=name,
+            level=level,
+            build=build if build else "Leveling",
+            plan_name=plan_name,
+            return_time=return_time,
+            return_formatted=format_time_remaining(return_time) if return_time else "Docked",
+            is_ready=is_ready,
+            is_leveling=is_leveling,
+            is_farming=is_farming,
+            vessel_behavior=vessel_behavior,
+            daily_gil=gil_rate,
+            monthly_gil=gil_rate * 30,
+            tanks_per_day=consumption["tanks_per_day"],
+            kits_per_day=consumption["kits_per_day"],
+            daily_cost=(consumption["tanks_per_day"] * CERULEUM_TANK_COST) + 
+                       (consumption["kits_per_day"] * REPAIR_KIT_COST),
+        ))
     
     return submarines
 
@@ -1984,23 +3172,803 @@ def parse_retainer_data(char_data):
         now_ts = datetime.datetime.now().timestamp()
         is_ready = (not venture_ends) or (venture_ends <= now_ts)
         
-        retainers.append({
-            "name": ret.get("Name", "Unknown"),
-            "level": ret.get("Level", 0),
-            "job": ret.get("Job", 0),
-            "gil": ret.get("Gil", 0),
-            "mb_items": ret.get("MBItems", 0),
-            "has_venture": ret.get("HasVenture", False),
-            "venture_ends": venture_ends,
-            "venture_formatted": format_time_remaining(venture_ends) if venture_ends else "None",
-            "is_ready": is_ready,
-        })
+        retainers.append(Retainer(
+            name=ret.get("Name", "Unknown"),
+            level=ret.get("Level", 0),
+            job=ret.get("Job", 0),
+            gil=ret.get("Gil", 0),
+            mb_items=ret.get("MBItems", 0),
+            has_venture=ret.get("HasVenture", False),
+            venture_ends=venture_ends,
+            venture_formatted=format_time_remaining(venture_ends) if venture_ends else "None",
+            is_ready=is_ready,
+        ))
     
     return retainers
 
 
-def get_all_data():
-    """Load and parse all account data"""
+def tally_fleet(submarines, retainers, now_ts=None):
+    """
+    Walk a character's parsed submarines and retainers once and return every counter the
+    dashboard, Sub Planner and map pages need from them. Exclusions are applied by the callers.
+    """
+    if now_ts is None:
+        now_ts = datetime.datetime.now().timestamp()
+    
+    daily_gil = daily_cost = tanks_per_day = kits_per_day = 0
+    subs_leveling = subs_farming = idle_subs = ready_subs = 0
+    max_sub_level = min_sub_level = None
+    min_sub_return = 999999  # No subs = sort last
+    for s in submarines:
+        daily_gil += s["daily_gil"]
+        daily_cost += s["daily_cost"]
+        tanks_per_day += s.get("tanks_per_day", 0)
+        kits_per_day += s.get("kits_per_day", 0)
+        is_leveling = s.get("is_leveling", False)
+        is_farming = s.get("is_farming", False)
+        if is_leveling:
+            subs_leveling += 1
+        if is_farming:
+            subs_farming += 1
+        if not s.get("plan_name") and not is_farming and not is_leveling:
+            idle_subs += 1
+        level = s["level"]
+        if max_sub_level is None or level > max_sub_level:
+            max_sub_level = level
+        if min_sub_level is None or level < min_sub_level:
+            min_sub_level = level
+        # Seconds until return for sorting: 0 when ready, 999999 when not on a voyage
+        if s["is_ready"]:
+            ready_subs += 1
+            seconds = 0
+        elif s["return_time"] and s["return_time"] > 0:
+            seconds = max(0, s["return_time"] - now_ts)
+        else:
+            seconds = 999999
+        if seconds < min_sub_return:
+            min_sub_return = seconds
+    
+    retainer_gil = mb_items = max_mb_count = 0
+    retainers_leveling = retainers_farming = idle_retainers = ready_retainers = 0
+    max_retainer_level = min_retainer_level = None
+    min_retainer_return = 999999  # No retainers = sort last
+    for r in retainers:
+        retainer_gil += r["gil"]
+        mb_items += r["mb_items"]
+        if r["mb_items"] >= 20:
+            max_mb_count += 1
+        level = r["level"]
+        if level < 100:
+            retainers_leveling += 1
+        else:
+            retainers_farming += 1
+        if not r["has_venture"]:
+            idle_retainers += 1
+        if max_retainer_level is None or level > max_retainer_level:
+            max_retainer_level = level
+        if min_retainer_level is None or level < min_retainer_level:
+            min_retainer_level = level
+        if r["is_ready"]:
+            ready_retainers += 1
+            seconds = 0
+        elif r["venture_ends"] and r["venture_ends"] > 0:
+            seconds = max(0, r["venture_ends"] - now_ts)
+        else:
+            seconds = 999999
+        if seconds < min_retainer_return:
+            min_retainer_return = seconds
+    
+    return {
+        "sub_daily_gil": daily_gil,
+        "sub_daily_cost": daily_cost,
+        "tanks_per_day": tanks_per_day,
+        "kits_per_day": kits_per_day,
+        "subs_leveling": subs_leveling,
+        "subs_farming": subs_farming,
+        "idle_subs": idle_subs,
+        "ready_subs": ready_subs,
+        "max_sub_level": max_sub_level or 0,
+        "min_sub_level": min_sub_level or 0,
+        "min_sub_return": min_sub_return,
+        "retainer_gil": retainer_gil,
+        "mb_items": mb_items,
+        "max_mb_count": max_mb_count,
+        # Every retainer is at the 20 listing cap
+        "all_max_mb": len(retainers) > 0 and max_mb_count == len(retainers),
+        "retainers_leveling": retainers_leveling,
+        "retainers_farming": retainers_farming,
+        "idle_retainers": idle_retainers,
+        "ready_retainers": ready_retainers,
+        "max_retainer_level": max_retainer_level or 0,
+        "min_retainer_level": min_retainer_level or 0,
+        "min_retainer_return": min_retainer_return,
+    }
+
+
+def estimate_restock_days(ceruleum, repair_kits, tanks_per_day, kits_per_day):
+    """Days until tanks or kits run out at the subs' combined usage (None if nothing is used)"""
+    if tanks_per_day > 0 and kits_per_day > 0:
+        days_from_tanks = ceruleum / tanks_per_day if ceruleum > 0 else 0
+        days_from_kits = repair_kits / kits_per_day if repair_kits > 0 else 0
+        return int(min(days_from_tanks, days_from_kits))
+    return None
+
+
+# ===============================================
+# Fleet Table (columnar submarine data)
+# ===============================================
+# Summary totals, group-bys and restock projections work on columns: one row per submarine
+# and one per character. With NumPy installed the columns are arrays and each aggregate is a
+# masked sum or bincount; without it the same methods loop over plain lists.
+FLEET_GROUP_KEYS = ("account", "region", "build")
+
+
+def _fleet_column(values, dtype=None):
+    """NumPy array for a fleet column (empty columns default to integers, like Python's sum())"""
+    if not values:
+        return numpy.zeros(0, dtype=dtype or numpy.int64)
+    return numpy.asarray(values, dtype=dtype)
+
+
+class FleetTable:
+    """Columnar submarine/character data from get_all_data()'s accounts"""
+    
+    def __init__(self, accounts, use_numpy=None):
+        self.use_numpy = numpy is not None and use_numpy is not False
+        self.nicknames = [account["nickname"] for account in accounts]
+        chars = {"account": [], "region": [], "ceruleum": [], "repair_kits": [], "excluded": []}
+        subs = {"character": [], "build": [], "level": [], "return_time": [], "daily_gil": [],
+                "daily_cost": [], "tanks_per_day": [], "kits_per_day": []}
+        for account_index, account in enumerate(accounts):
+            for char in account["characters"]:
+                char_index = len(chars["account"])
+                chars["account"].append(account_index)
+                chars["region"].append(char["region"])
+                chars["ceruleum"].append(char["ceruleum"])
+                chars["repair_kits"].append(char["repair_kits"])
+                chars["excluded"].append(bool(char["exclude_workshop"]))
+                for sub in char["submarines"]:
+                    subs["character"].append(char_index)
+                    subs["build"].append(sub["build"])
+                    subs["level"].append(sub["level"])
+                    subs["return_time"].append(sub["return_time"] or 0)
+                    subs["daily_gil"].append(sub["daily_gil"])
+                    subs["daily_cost"].append(sub["daily_cost"])
+                    subs["tanks_per_day"].append(sub.get("tanks_per_day", 0))
+                    subs["kits_per_day"].append(sub.get("kits_per_day", 0))
+        if self.use_numpy:
+            chars = {
+                "account": _fleet_column(chars["account"], numpy.int64),
+                "region": numpy.array(chars["region"], dtype=str),
+                "ceruleum": _fleet_column(chars["ceruleum"], numpy.float64),
+                "repair_kits": _fleet_column(chars["repair_kits"], numpy.float64),
+                "excluded": _fleet_column(chars["excluded"], bool),
+            }
+            subs = {
+                "character": _fleet_column(subs["character"], numpy.int64),
+                "build": numpy.array(subs["build"], dtype=str),
+                "level": _fleet_column(subs["level"], numpy.float64),
+                "return_time": _fleet_column(subs["return_time"], numpy.float64),
+                "daily_gil": _fleet_column(subs["daily_gil"]),
+                "daily_cost": _fleet_column(subs["daily_cost"]),
+                "tanks_per_day": _fleet_column(subs["tanks_per_day"], numpy.float64),
+                "kits_per_day": _fleet_column(subs["kits_per_day"], numpy.float64),
+            }
+        self.chars = chars
+        self.subs = subs
+    
+    def __len__(self):
+        return len(self.subs["character"])
+    
+    def totals(self):
+        """Subs, daily gil/cost, tank/kit use (per day, 2 decimals) and stock of characters whose workshop isn't excluded"""
+        chars, subs = self.chars, self.subs
+        if self.use_numpy:
+            active_chars = ~chars["excluded"]
+            active = active_chars[subs["character"]]
+            return {
+                "subs": int(active.sum()),
+                "daily_income": subs["daily_gil"][active].sum().item(),
+                "daily_cost": subs["daily_cost"][active].sum().item(),
+                "tanks_per_day": round(float(subs["tanks_per_day"][active].sum()), 2),
+                "kits_per_day": round(float(subs["kits_per_day"][active].sum()), 2),
+                "ceruleum": int(chars["ceruleum"][active_chars].sum()),
+                "repair_kits": int(chars["repair_kits"][active_chars].sum()),
+            }
+        totals = {"subs": 0, "daily_income": 0, "daily_cost": 0, "tanks_per_day": 0.0, "kits_per_day": 0.0,
+                  "ceruleum": 0, "repair_kits": 0}
+        for row, char_index in enumerate(subs["character"]):
+            if chars["excluded"][char_index]:
+                continue
+            totals["subs"] += 1
+            totals["daily_income"] += subs["daily_gil"][row]
+            totals["daily_cost"] += subs["daily_cost"][row]
+            totals["tanks_per_day"] += subs["tanks_per_day"][row]
+            totals["kits_per_day"] += subs["kits_per_day"][row]
+        for char_index, excluded in enumerate(chars["excluded"]):
+            if not excluded:
+                totals["ceruleum"] += chars["ceruleum"][char_index]
+                totals["repair_kits"] += chars["repair_kits"][char_index]
+        totals["tanks_per_day"] = round(totals["tanks_per_day"], 2)
+        totals["kits_per_day"] = round(totals["kits_per_day"], 2)
+        return totals
+    
+    def _character_usage(self):
+        """Per-character (tanks per day, kits per day) of all its subs"""
+        chars, subs = self.chars, self.subs
+        if self.use_numpy:
+            count = len(chars["account"])
+            return (numpy.bincount(subs["character"], weights=subs["tanks_per_day"], minlength=count),
+                    numpy.bincount(subs["character"], weights=subs["kits_per_day"], minlength=count))
+        tanks = [0] * len(chars["account"])
+        kits = [0] * len(chars["account"])
+        for row, char_index in enumerate(subs["character"]):
+            tanks[char_index] += subs["tanks_per_day"][row]
+            kits[char_index] += subs["kits_per_day"][row]
+        return tanks, kits
+    
+    def restock_state(self):
+        """
+        Per-character restock days (see estimate_restock_days) and a mask of characters using supplies.
+        Compute it once and pass it to restock_range()/restock_projection() when calling both.
+        """
+        chars = self.chars
+        tanks, kits = self._character_usage()
+        if self.use_numpy:
+            used = (tanks > 0) & (kits > 0)
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                from_tanks = numpy.where(chars["ceruleum"] > 0, chars["ceruleum"] / tanks, 0)
+                from_kits = numpy.where(chars["repair_kits"] > 0, chars["repair_kits"] / kits, 0)
+            days = numpy.where(used, numpy.minimum(from_tanks, from_kits), 0).astype(numpy.int64)
+            return days, used
+        days = [estimate_restock_days(chars["ceruleum"][i], chars["repair_kits"][i], tanks[i], kits[i])
+                for i in range(len(tanks))]
+        return days, [d is not None for d in days]
+    
+    def restock_days(self):
+        """Days until each character's tanks or kits run out (None if its subs use nothing)"""
+        days, used = self.restock_state()
+        return [int(d) if u else None for d, u in zip(days, used)]
+    
+    def restock_range(self, state=None):
+        """(lowest, highest) restock days over characters with more than 0 days left, or (None, None)"""
+        days, used = state if state is not None else self.restock_state()
+        if self.use_numpy:
+            positive = days[used & (days > 0)]
+            if not len(positive):
+                return None, None
+            return int(positive.min()), int(positive.max())
+        positive = [d for d in days if d is not None and d > 0]
+        return (min(positive), max(positive)) if positive else (None, None)
+    
+    def group_by(self, key, now_ts=None):
+        """
+        Per account, region or build: subs, ready subs, average level, daily gil/cost/profit and
+        tank/kit use. Characters whose workshop is excluded are skipped, as in totals().
+        """
+        if key not in FLEET_GROUP_KEYS:
+            raise ValueError(f"Unknown fleet group: {key}")
+        if now_ts is None:
+            now_ts = datetime.datetime.now().timestamp()
+        chars, subs = self.chars, self.subs
+        if self.use_numpy:
+            active = ~chars["excluded"][subs["character"]]
+            if key == "build":
+                labels = subs["build"][active]
+            else:
+                labels = chars[key][subs["character"][active]]
+            names, inverse = numpy.unique(labels, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            
+            def per_group(column):
+                return numpy.bincount(inverse, weights=column[active], minlength=len(names))
+            
+            counts = numpy.bincount(inverse, minlength=len(names))
+            ready = numpy.bincount(inverse, weights=(subs["return_time"][active] <= now_ts).astype(numpy.float64), minlength=len(names))
+            level_sums = per_group(subs["level"])
+            sums = {column: per_group(subs[column]) for column in ("daily_gil", "daily_cost", "tanks_per_day", "kits_per_day")}
+            groups = []
+            for i, name in enumerate(names.tolist()):
+                groups.append({
+                    key: self.nicknames[name] if key == "account" else name,
+                    "subs": int(counts[i]),
+                    "ready": int(ready[i]),
+                    "avg_level": round(float(level_sums[i]) / int(counts[i]), 1),
+                    "daily_gil": float(sums["daily_gil"][i]),
+                    "daily_cost": float(sums["daily_cost"][i]),
+                    "daily_profit": float(sums["daily_gil"][i] - sums["daily_cost"][i]),
+                    "tanks_per_day": round(float(sums["tanks_per_day"][i]), 2),
+                    "kits_per_day": round(float(sums["kits_per_day"][i]), 2),
+                })
+            return groups
+        
+        grouped = {}
+        for row, char_index in enumerate(subs["character"]):
+            if chars["excluded"][char_index]:
+                continue
+            name = subs["build"][row] if key == "build" else chars[key][char_index]
+            group = grouped.get(name)
+            if group is None:
+                group = grouped[name] = {"subs": 0, "ready": 0, "level": 0.0, "daily_gil": 0.0, "daily_cost": 0.0,
+                                         "tanks_per_day": 0.0, "kits_per_day": 0.0}
+            group["subs"] += 1
+            group["ready"] += subs["return_time"][row] <= now_ts
+            group["level"] += subs["level"][row]
+            for column in ("daily_gil", "daily_cost", "tanks_per_day", "kits_per_day"):
+                group[column] += subs[column][row]
+        return [{
+            key: self.nicknames[name] if key == "account" else name,
+            "subs": group["subs"],
+            "ready": group["ready"],
+            "avg_level": round(group["level"] / group["subs"], 1),
+            "daily_gil": group["daily_gil"],
+            "daily_cost": group["daily_cost"],
+            "daily_profit": group["daily_gil"] - group["daily_cost"],
+            "tanks_per_day": round(group["tanks_per_day"], 2),
+            "kits_per_day": round(group["kits_per_day"], 2),
+        } for name, group in sorted(grouped.items())]
+    
+    def restock_projection(self, days=30, state=None):
+        """
+        Per account: tanks and kits to buy so every (non-excluded) character's subs can keep
+        running for `days` more days, their gil cost, and the lowest restock days of those
+        characters. state: a restock_state() result to reuse.
+        """
+        chars = self.chars
+        tanks, kits = self._character_usage()
+        restock, used = state if state is not None else self.restock_state()
+        count = len(self.nicknames)
+        if self.use_numpy:
+            active = ~chars["excluded"]
+            tanks_needed = numpy.ceil(numpy.maximum(0, days * tanks - chars["ceruleum"]))
+            kits_needed = numpy.ceil(numpy.maximum(0, days * kits - chars["repair_kits"]))
+            tanks_per_account = numpy.bincount(chars["account"][active], weights=tanks_needed[active], minlength=count)
+            kits_per_account = numpy.bincount(chars["account"][active], weights=kits_needed[active], minlength=count)
+            lowest = [None] * count
+            counted = active & used & (restock > 0)
+            for account_index, value in zip(chars["account"][counted].tolist(), restock[counted].tolist()):
+                if lowest[account_index] is None or value < lowest[account_index]:
+                    lowest[account_index] = value
+            tanks_per_account = [int(v) for v in tanks_per_account]
+            kits_per_account = [int(v) for v in kits_per_account]
+        else:
+            tanks_per_account = [0] * count
+            kits_per_account = [0] * count
+            lowest = [None] * count
+            for i, account_index in enumerate(chars["account"]):
+                if not chars["excluded"][i]:
+                    tanks_per_account[account_index] += math.ceil(max(0, days * tanks[i] - chars["ceruleum"][i]))
+                    kits_per_account[account_index] += math.ceil(max(0, days * kits[i] - chars["repair_kits"][i]))
+                if restock[i] is not None and restock[i] > 0 and not chars["excluded"][i]:
+                    if lowest[account_index] is None or restock[i] < lowest[account_index]:
+                        lowest[account_index] = restock[i]
+        return [{
+            "account": nickname,
+            "days": days,
+            "tanks_needed": tanks_per_account[i],
+            "kits_needed": kits_per_account[i],
+            "cost": tanks_per_account[i] * CERULEUM_TANK_COST + kits_per_account[i] * REPAIR_KIT_COST,
+            "min_restock_days": lowest[i],
+        } for i, nickname in enumerate(self.nicknames)]
+
+
+def build_main_account(sources):
+    """
+    Build one account's main-page data: the account card with its characters and totals, plus
+    the summary-only counters (MSQ percentages, level counts, plot keys) get_all_data() reduces.
+    Returns: {"account": dict, "msq_percents": list, "chars_lv25_plus": int, "chars_lv100": int,
+              "personal_plots": set, "fc_plots": set}
+    """
+    account = sources["account"]
+    account_data = {
+        "nickname": account["nickname"],
+        "characters": [],
+        "total_gil": 0,
+        "total_subs": 0,
+        "total_retainers": 0,
+        "ready_subs": 0,
+        "ready_retainers": 0,
+        "total_mb_items": 0,
+        "total_treasure": 0,
+        "total_coffer_dye_value": 0,
+        "total_coffer_count": 0,
+        "total_dye_count": 0,
+        "total_mb_dye_count": 0,
+        "total_venture_coins": 0,
+        "total_fc_points": 0,
+        "subs_leveling": 0,
+        "subs_farming": 0,
+        "idle_subs": 0,
+        "has_idle_sub": False,
+        "retainers_leveling": 0,
+        "retainers_farming": 0,
+        "idle_retainers": 0,
+        "has_idle_retainer": False,
+        "msq_100_count": 0,
+        "msq_90_count": 0,
+        "msq_50_count": 0,
+        "characters_with_msq": 0,
+        "has_max_mb_retainer": False,  # Track if any character has ALL retainers with 20 MB items
+        "max_mb_retainer_count": 0,  # Count of retainers with 20 MB items
+        "all_max_mb_count": 0,  # Count of characters with ALL retainers maxed
+        "excluded_retainers": 0,  # Count of excluded retainers
+        "excluded_subs": 0,  # Count of excluded submarines
+        "sleeping_retainers": 0,  # Count of sleeping (disabled) retainers
+        "sleeping_subs": 0,  # Count of sleeping (disabled) submarines
+        "has_sleeping_retainer": False,
+        "has_sleeping_sub": False,
+        "potential_subs_count": 0,  # Count of characters with potential subs (lv 25+ not in FC)
+        "enabled_retainers": 0,  # Count of enabled retainers (not excluded, not sleeping)
+        "enabled_subs": 0,  # Count of enabled subs (not excluded, not sleeping)
+        "stale": sources["stale"],  # Files missed ACCOUNT_LOAD_TIMEOUT, showing last good data
+        "stale_age": format_age(sources["stale_seconds"]) if sources["stale"] else "",
+    }
+    
+    partial = {
+        "account": account_data,
+        "msq_percents": [],
+        "chars_lv25_plus": 0,
+        "chars_lv100": 0,
+        "personal_plots": set(),
+        "fc_plots": set(),
+    }
+    if sources["error"]:
+        account_data["error"] = sources["error"]
+        return partial
+    
+    ar_config = sources["ar_config"]
+    plan_names = ar_config["plan_names"]
+    
+    fc_data = ar_config["fc_data"]
+    characters = ar_config["characters"]
+    
+    # XA Database data (treasure values, currencies, jobs, MSQ) and Lifestream housing data
+    alto_map = sources["alto_map"]
+    housing_map = sources["housing_map"]
+    
+    for char in characters:
+        cid = char.get("CID", 0)
+        char_gil = char.get("Gil", 0)
+        
+        # Check AR exclusion settings for this character
+        exclude_retainer = char.get("ExcludeRetainer", False) if HONOR_AR_EXCLUSIONS else False
+        exclude_workshop = char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False
+        
+        # Check AR enabled/disabled (sleeping) settings for this character
+        # Enabled=false means retainers are sleeping (not rotating)
+        # WorkshopEnabled=false means subs are sleeping (not rotating)
+        retainers_sleeping = not char.get("Enabled", True)  # Default True = enabled
+        subs_sleeping = not char.get("WorkshopEnabled", True)  # Default True = enabled
+        
+        # Parse submarines and retainers (always parse, but hide in display if excluded)
+        submarines = parse_submarine_data(char, plan_names)
+        retainers = parse_retainer_data(char)
+        fleet = tally_fleet(submarines, retainers)
+        sub_daily_income = fleet["sub_daily_gil"] if not exclude_workshop else 0
+        sub_daily_cost = fleet["sub_daily_cost"] if not exclude_workshop else 0
+        
+        # Calculate days until restocking needed
+        total_tanks_per_day = fleet["tanks_per_day"]
+        total_kits_per_day = fleet["kits_per_day"]
+        ceruleum = char.get("Ceruleum", 0)
+        repair_kits = char.get("RepairKits", 0)
+        days_until_restock = estimate_restock_days(ceruleum, repair_kits, total_tanks_per_day, total_kits_per_day)
+        
+        # Count leveling vs farming submarines
+        char_subs_leveling = fleet["subs_leveling"]
+        char_subs_farming = fleet["subs_farming"]
+        
+        # Count idle submarines (no plan, not leveling, not farming)
+        char_idle_subs = fleet["idle_subs"]
+        # Idle sub = has idle subs AND not excluded AND not sleeping (must be enabled)
+        has_idle_sub = char_idle_subs > 0 and not exclude_workshop and not subs_sleeping
+        
+        retainer_gil = fleet["retainer_gil"] if not exclude_retainer else 0
+        mb_items = fleet["mb_items"] if not exclude_retainer else 0
+        # Override max MB highlight if excluded
+        # Only highlight if ALL retainers have max MB items (20)
+        has_max_mb_retainer = fleet["all_max_mb"] and not exclude_retainer
+        # Count retainers with max MB items (for summary)
+        char_max_mb_count = fleet["max_mb_count"] if not exclude_retainer else 0
+        
+        # Count leveling vs farming retainers (< 100 = leveling, 100 = farming)
+        char_retainers_leveling = fleet["retainers_leveling"]
+        char_retainers_farming = fleet["retainers_farming"]
+        
+        # Count idle retainers (no venture assigned)
+        char_idle_retainers = fleet["idle_retainers"]
+        # Idle retainer = has idle retainers AND not excluded AND not sleeping (must be enabled)
+        has_idle_retainer = char_idle_retainers > 0 and not exclude_retainer and not retainers_sleeping
+        
+        # Get FC info and FC points
+        fc_name = ""
+        fc_points = 0
+        fc_gil = 0
+        if cid in fc_data:
+            fc_name = fc_data[cid].get("Name", "")
+            fc_points = fc_data[cid].get("FCPoints", 0)
+        
+        # Get XA Database data (treasure, coffers, dyes, job, etc.)
+        treasure_value = 0
+        coffer_dye_value = 0
+        coffer_count = 0
+        dye_count = 0
+        dye_pure_white = 0
+        dye_jet_black = 0
+        dye_pastel_pink = 0
+        mb_dye_count = 0
+        venture_coins = 0
+        current_job = ""
+        current_level = 0
+        highest_job = ""
+        highest_level = 0
+        lowest_job = ""
+        lowest_level = 0
+        all_jobs = {}
+        all_currencies = {}
+        completed_quests = []
+        if cid in alto_map:
+            treasure_value = alto_map[cid].get("treasure_value", 0)
+            coffer_dye_value = alto_map[cid].get("coffer_dye_value", 0)
+            coffer_count = alto_map[cid].get("coffer_count", 0)
+            dye_count = alto_map[cid].get("dye_count", 0)
+            dye_pure_white = alto_map[cid].get("dye_pure_white", 0)
+            dye_jet_black = alto_map[cid].get("dye_jet_black", 0)
+            dye_pastel_pink = alto_map[cid].get("dye_pastel_pink", 0)
+            mb_dye_count = alto_map[cid].get("mb_dye_count", 0)
+            venture_coins = alto_map[cid].get("venture_coins", 0)
+            fc_gil = alto_map[cid].get("fc_gil", 0)
+            current_job = alto_map[cid].get("current_job", "")
+            current_level = alto_map[cid].get("current_level", 0)
+            highest_job = alto_map[cid].get("highest_job", "")
+            highest_level = alto_map[cid].get("highest_level", 0)
+            lowest_job = alto_map[cid].get("lowest_job", "")
+            lowest_level = alto_map[cid].get("lowest_level", 0)
+            all_jobs = alto_map[cid].get("all_jobs", {})
+            all_currencies = alto_map[cid].get("all_currencies", {})
+            completed_quests = alto_map[cid].get("completed_quests", [])
+        
+        # Get venture coffers from AutoRetainer if XA Database doesn't have it
+        venture_coffers_ar = char.get("VentureCoffers", 0)
+        if coffer_count == 0 and venture_coffers_ar > 0:
+            coffer_count = venture_coffers_ar
+            coffer_dye_value += venture_coffers_ar * COFFER_DYE_VALUES.get(32161, 18000)
+        
+        # Get housing data from Lifestream
+        private_house = None
+        fc_house = None
+        if cid in housing_map:
+            private_data = housing_map[cid].get('private')
+            fc_data_house = housing_map[cid].get('fc')
+            if private_data:
+                private_house = f"{private_data['district']} W{private_data['ward']} P{private_data['plot']}"
+            if fc_data_house:
+                fc_house = f"{fc_data_house['district']} W{fc_data_house['ward']} P{fc_data_house['plot']}"
+        
+        char_data = {
+            "cid": cid,
+            "name": char.get("Name", "Unknown"),
+            "world": char.get("World", "Unknown"),
+            "region": region_from_world(char.get("World", "")),
+            "gil": char_gil,
+            "retainer_gil": retainer_gil,
+            "fc_gil": fc_gil,
+            "total_gil": char_gil + retainer_gil + fc_gil,
+            "treasure_value": treasure_value,
+            "coffer_dye_value": coffer_dye_value,
+            "coffer_count": coffer_count,
+            "dye_count": dye_count,
+            "dye_pure_white": dye_pure_white,
+            "dye_jet_black": dye_jet_black,
+            "dye_pastel_pink": dye_pastel_pink,
+            "mb_dye_count": mb_dye_count,
+            "venture_coins": venture_coins,
+            "total_with_treasure": char_gil + retainer_gil + fc_gil + treasure_value,
+            "submarines": submarines,
+            "retainers": retainers,
+            "fc_name": fc_name,
+            "fc_points": fc_points,
+            "ceruleum": char.get("Ceruleum", 0),
+            "repair_kits": char.get("RepairKits", 0),
+            "ventures": char.get("Ventures", 0),
+            "inventory_space": char.get("InventorySpace", 0),
+            "gc_seals": char.get("GCSeals", 0),
+            "daily_income": sub_daily_income,
+            "monthly_income": sub_daily_income * 30,
+            "daily_cost": sub_daily_cost,
+            "mb_items": mb_items,
+            "current_job": current_job,
+            "current_level": current_level,
+            "subs_leveling": char_subs_leveling,
+            "subs_farming": char_subs_farming,
+            "idle_subs": char_idle_subs,
+            "has_idle_sub": has_idle_sub,
+            "retainers_leveling": char_retainers_leveling,
+            "retainers_farming": char_retainers_farming,
+            "idle_retainers": char_idle_retainers,
+            "has_idle_retainer": has_idle_retainer,
+            "days_until_restock": days_until_restock,
+            "private_house": private_house,
+            "fc_house": fc_house,
+            "all_jobs": all_jobs,
+            "all_currencies": all_currencies,
+            "categorized_currencies": categorize_currencies(all_currencies) if all_currencies else {},
+        }
+        
+        # Add highest/lowest job (already extracted from alto_map)
+        char_data["highest_job"] = highest_job
+        char_data["highest_level"] = highest_level
+        char_data["lowest_job"] = lowest_job
+        char_data["lowest_level"] = lowest_level
+        
+        # Calculate MSQ progress (returns percentage, position, total, quest_name)
+        # Get max COMBAT job level for validation (MSQ requires combat jobs, not crafters)
+        max_combat_level = max((lv for job, lv in all_jobs.items() if job in COMBAT_JOBS), default=0) if all_jobs else 0
+        # Fallback to current_level only if it's a combat job
+        if max_combat_level == 0 and current_job in COMBAT_JOBS:
+            max_combat_level = current_level
+        msq_pct, msq_pos, msq_total, msq_quest_name = calculate_msq_progress(completed_quests, max_combat_level)
+        char_data["msq_percent"] = msq_pct
+        char_data["msq_completed"] = msq_pos
+        char_data["msq_total"] = msq_total
+        char_data["msq_quest_name"] = msq_quest_name
+        
+        # Count ready submarines and retainers
+        char_ready_subs = fleet["ready_subs"]
+        char_ready_retainers = fleet["ready_retainers"]
+        
+        # Max/min levels and soonest return (seconds, 0 = ready) for sorting
+        max_retainer_level = fleet["max_retainer_level"]
+        max_sub_level = fleet["max_sub_level"]
+        min_retainer_level = fleet["min_retainer_level"]
+        min_sub_level = fleet["min_sub_level"]
+        min_retainer_return = fleet["min_retainer_return"]
+        min_sub_return = fleet["min_sub_return"]
+        
+        # Add ready counts and max levels to character data
+        char_data["ready_subs"] = char_ready_subs
+        char_data["total_subs"] = len(submarines)
+        char_data["ready_retainers"] = char_ready_retainers
+        char_data["total_retainers"] = len(retainers)
+        char_data["max_retainer_level"] = max_retainer_level
+        char_data["max_sub_level"] = max_sub_level
+        char_data["min_retainer_level"] = min_retainer_level
+        char_data["min_sub_level"] = min_sub_level
+        char_data["min_retainer_return"] = int(min_retainer_return)
+        char_data["min_sub_return"] = int(min_sub_return)
+        char_data["has_max_mb_retainer"] = has_max_mb_retainer
+        
+        # Add exclusion flags for template display
+        char_data["exclude_retainer"] = exclude_retainer
+        char_data["exclude_workshop"] = exclude_workshop
+        
+        # Add sleeping flags for template display
+        char_data["retainers_sleeping"] = retainers_sleeping
+        char_data["subs_sleeping"] = subs_sleeping
+        # Add processing flag - character is processing if Enabled=true OR WorkshopEnabled=true
+        char_data["is_processing"] = not retainers_sleeping or not subs_sleeping
+        # Count sleeping retainers/subs for this character
+        char_sleeping_retainers = len(retainers) if retainers_sleeping else 0
+        char_sleeping_subs = len(submarines) if subs_sleeping else 0
+        char_data["sleeping_retainer_count"] = char_sleeping_retainers
+        char_data["sleeping_sub_count"] = char_sleeping_subs
+        
+        # Check if character has potential for retainers (MSQ 66060 completed but 0 retainers)
+        # Override if retainers are excluded
+        # Only set if SHOW_MSQ_PROGRESSION is enabled (otherwise we can't determine MSQ status)
+        char_data["has_potential_retainer"] = SHOW_MSQ_PROGRESSION and (66060 in completed_quests) and (len(retainers) == 0) and not exclude_retainer
+        
+        # Check if character has potential for subs (Lv 25+ but not in FC)
+        # Use highest_level to check if any job is 25+
+        char_data["has_potential_subs"] = highest_level >= 25 and not fc_name
+        
+        # Track max MB count for this character
+        char_data["max_mb_count"] = char_max_mb_count
+        
+        # Track idle flags for asterisk descriptions
+        char_data["has_idle_retainer"] = has_idle_retainer
+        char_data["has_idle_sub"] = has_idle_sub
+        
+        account_data["characters"].append(Character(**char_data))
+        account_data["total_gil"] += char_data["total_gil"]
+        # Don't count excluded subs/retainers in account totals
+        account_data["total_subs"] += len(submarines) if not exclude_workshop else 0
+        account_data["total_retainers"] += len(retainers) if not exclude_retainer else 0
+        # Don't count sleeping or excluded subs/retainers as ready
+        account_data["ready_subs"] += char_ready_subs if not exclude_workshop and not subs_sleeping else 0
+        account_data["ready_retainers"] += char_ready_retainers if not exclude_retainer and not retainers_sleeping else 0
+        # Track excluded counts
+        if exclude_retainer and len(retainers) > 0:
+            account_data["excluded_retainers"] += len(retainers)
+        if exclude_workshop and len(submarines) > 0:
+            account_data["excluded_subs"] += len(submarines)
+        # Track sleeping counts (Enabled=false or WorkshopEnabled=false)
+        # Don't count excluded retainers/subs in sleeping totals
+        if char_sleeping_retainers > 0 and not exclude_retainer:
+            account_data["sleeping_retainers"] += char_sleeping_retainers
+            account_data["has_sleeping_retainer"] = True
+        if char_sleeping_subs > 0 and not exclude_workshop:
+            account_data["sleeping_subs"] += char_sleeping_subs
+            account_data["has_sleeping_sub"] = True
+        account_data["total_mb_items"] += mb_items
+        account_data["total_treasure"] += treasure_value
+        account_data["total_coffer_dye_value"] += coffer_dye_value
+        account_data["total_coffer_count"] += coffer_count
+        account_data["total_dye_count"] += dye_count
+        account_data["total_mb_dye_count"] += mb_dye_count
+        account_data["total_venture_coins"] += venture_coins
+        account_data["total_fc_points"] += fc_points
+        
+        account_data["subs_leveling"] += char_subs_leveling
+        account_data["subs_farming"] += char_subs_farming
+        # Only count idle subs if not excluded AND not sleeping (must be enabled)
+        if not exclude_workshop and not subs_sleeping:
+            account_data["idle_subs"] += char_idle_subs
+        if has_idle_sub:
+            account_data["has_idle_sub"] = True
+        account_data["retainers_leveling"] += char_retainers_leveling
+        account_data["retainers_farming"] += char_retainers_farming
+        # Only count idle retainers if not excluded AND not sleeping (must be enabled)
+        if not exclude_retainer and not retainers_sleeping:
+            account_data["idle_retainers"] += char_idle_retainers
+        if has_idle_retainer:
+            account_data["has_idle_retainer"] = True
+        
+        # Track max MB retainers (only when ALL retainers are maxed)
+        if has_max_mb_retainer:
+            account_data["has_max_mb_retainer"] = True
+            account_data["all_max_mb_count"] += 1  # Count characters with ALL retainers maxed
+        # Count individual retainers at max MB (for summary)
+        account_data["max_mb_retainer_count"] += char_max_mb_count
+        
+        # Track potential subs (lv 25+ not in FC)
+        if char_data["has_potential_subs"]:
+            account_data["potential_subs_count"] += 1
+        
+        # Track enabled retainers/subs (not excluded, not sleeping)
+        if not exclude_retainer and not retainers_sleeping:
+            account_data["enabled_retainers"] += len(retainers)
+        if not exclude_workshop and not subs_sleeping:
+            account_data["enabled_subs"] += len(submarines)
+        
+        # Track MSQ progress stats
+        if char_data["msq_percent"] > 0:
+            account_data["characters_with_msq"] += 1
+            partial["msq_percents"].append(char_data["msq_percent"])
+            if char_data["msq_percent"] >= 100:
+                account_data["msq_100_count"] += 1
+            if char_data["msq_percent"] >= 90:
+                account_data["msq_90_count"] += 1
+            if char_data["msq_percent"] >= 50:
+                account_data["msq_50_count"] += 1
+        
+        # Track character level stats and housing plots
+        if highest_level >= 25:
+            partial["chars_lv25_plus"] += 1
+        if highest_level >= 100:
+            partial["chars_lv100"] += 1
+        # Track unique plots (world+location to avoid counting shared houses)
+        char_world = char.get("World", "")
+        if cid in housing_map:
+            private_data = housing_map[cid].get('private')
+            fc_data_house = housing_map[cid].get('fc')
+            if private_data:
+                plot_key = f"{char_world}_{private_data['district']}_W{private_data['ward']}_P{private_data['plot']}"
+                partial["personal_plots"].add(plot_key)
+            if fc_data_house:
+                plot_key = f"{char_world}_{fc_data_house['district']}_W{fc_data_house['ward']}_P{fc_data_house['plot']}"
+                partial["fc_plots"].add(plot_key)
+    
+    # Calculate max MB items for this account (20 per retainer)
+    account_data["max_mb_items"] = account_data["total_retainers"] * 20
+    return partial
+
+
+def get_all_data(account_sources=None):
+    """
+    Load and parse all account data (per-account partials come from the artifact cache).
+    account_sources: load_all_account_sources() result shared by the views of one model build.
+    """
     all_accounts = []
     total_gil = 0
     total_subs = 0
@@ -2008,8 +3976,6 @@ def get_all_data():
     ready_subs = 0
     ready_retainers = 0
     total_mb_items = 0
-    total_daily_income = 0
-    total_daily_cost = 0
     total_treasure = 0
     total_coffer_dye_value = 0
     total_coffer_count = 0
@@ -2031,12 +3997,6 @@ def get_all_data():
     total_enabled_retainers = 0  # Enabled retainers (not excluded, not sleeping)
     total_enabled_subs = 0  # Enabled subs (not excluded, not sleeping)
     total_all_max_mb = 0  # Characters with ALL retainers maxed
-    min_restock_days = None  # Track lowest restock days across all accounts (excluding 0)
-    restock_day_values = []  # Track all non-zero restock values for min/max charting
-    total_ceruleum = 0  # Total ceruleum tanks across all accounts
-    total_repair_kits = 0  # Total repair kits across all accounts
-    total_tanks_per_day_all = 0.0  # Total tank consumption per day
-    total_kits_per_day_all = 0.0  # Total kit consumption per day
     
     # Character stats tracking
     total_chars_lv25_plus = 0
@@ -2045,506 +4005,69 @@ def get_all_data():
     unique_fc_plots = set()  # Track unique FC plots by world+district+ward+plot
     
     # MSQ Progress tracking
-    total_characters_with_msq = 0
+    msq_percents = []  # MSQ % of every character with progress (for the average)
     msq_100_count = 0  # Characters at 100% MSQ
     msq_90_count = 0   # Characters at 90%+ MSQ
     msq_50_count = 0   # Characters at 50%+ MSQ
-    total_msq_percent = 0  # For calculating average
     
-    for account in account_locations:
-        account_data = {
-            "nickname": account["nickname"],
-            "characters": [],
-            "total_gil": 0,
-            "total_subs": 0,
-            "total_retainers": 0,
-            "ready_subs": 0,
-            "ready_retainers": 0,
-            "total_mb_items": 0,
-            "total_treasure": 0,
-            "total_coffer_dye_value": 0,
-            "total_coffer_count": 0,
-            "total_dye_count": 0,
-            "total_mb_dye_count": 0,
-            "total_venture_coins": 0,
-            "total_fc_points": 0,
-            "subs_leveling": 0,
-            "subs_farming": 0,
-            "idle_subs": 0,
-            "has_idle_sub": False,
-            "retainers_leveling": 0,
-            "retainers_farming": 0,
-            "idle_retainers": 0,
-            "has_idle_retainer": False,
-            "msq_100_count": 0,
-            "msq_90_count": 0,
-            "msq_50_count": 0,
-            "characters_with_msq": 0,
-            "has_max_mb_retainer": False,  # Track if any character has ALL retainers with 20 MB items
-            "max_mb_retainer_count": 0,  # Count of retainers with 20 MB items
-            "all_max_mb_count": 0,  # Count of characters with ALL retainers maxed
-            "excluded_retainers": 0,  # Count of excluded retainers
-            "excluded_subs": 0,  # Count of excluded submarines
-            "sleeping_retainers": 0,  # Count of sleeping (disabled) retainers
-            "sleeping_subs": 0,  # Count of sleeping (disabled) submarines
-            "has_sleeping_retainer": False,
-            "has_sleeping_sub": False,
-            "potential_subs_count": 0,  # Count of characters with potential subs (lv 25+ not in FC)
-            "enabled_retainers": 0,  # Count of enabled retainers (not excluded, not sleeping)
-            "enabled_subs": 0,  # Count of enabled subs (not excluded, not sleeping)
-        }
-        
-        auto_path = account["auto_path"]
-        
-        if not os.path.isfile(auto_path):
-            account_data["error"] = f"Config not found: {auto_path}"
+    if account_sources is None:
+        account_sources = load_all_account_sources()
+    for sources in account_sources:
+        partial = get_account_artifact("main", sources, build_main_account)
+        account_data = partial["account"]
+        if "error" in account_data:
             all_accounts.append(account_data)
             continue
         
-        try:
-            with open(auto_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
-        except Exception as e:
-            account_data["error"] = f"Failed to load: {e}"
-            all_accounts.append(account_data)
-            continue
-        
-        # Build plan name lookup from this config
-        build_plan_name_lookup(data)
-        
-        fc_data = extract_fc_data(data)
-        characters = collect_characters(data, account["nickname"])
-        
-        # Scan XA Database for treasure values, currencies, jobs, MSQ
-        alto_map = {}
-        xa_db_path = account.get("xa_db_path", "")
-        if xa_db_path:
-            alto_map = scan_xa_db(xa_db_path)
+        msq_percents.extend(partial["msq_percents"])
+        msq_100_count += account_data["msq_100_count"]
+        msq_90_count += account_data["msq_90_count"]
+        msq_50_count += account_data["msq_50_count"]
+        total_chars_lv25_plus += partial["chars_lv25_plus"]
+        total_chars_lv100 += partial["chars_lv100"]
+        unique_personal_plots.update(partial["personal_plots"])
+        unique_fc_plots.update(partial["fc_plots"])
         
-        # Load Lifestream housing data
-        housing_map = {}
-        lfstrm_path = account.get("lfstrm_path", "")
-        if lfstrm_path:
-            housing_map = load_lifestream_data(lfstrm_path)
-        
-        for char in characters:
-            cid = char.get("CID", 0)
-            char_gil = char.get("Gil", 0)
-            
-            # Check AR exclusion settings for this character
-            exclude_retainer = char.get("ExcludeRetainer", False) if HONOR_AR_EXCLUSIONS else False
-            exclude_workshop = char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False
-            
-            # Check AR enabled/disabled (sleeping) settings for this character
-            # Enabled=false means retainers are sleeping (not rotating)
-            # WorkshopEnabled=false means subs are sleeping (not rotating)
-            retainers_sleeping = not char.get("Enabled", True)  # Default True = enabled
-            subs_sleeping = not char.get("WorkshopEnabled", True)  # Default True = enabled
-            
-            # Parse submarines (always parse, but hide in display if excluded)
-            submarines = parse_submarine_data(char)
-            sub_daily_income = sum(s["daily_gil"] for s in submarines) if not exclude_workshop else 0
-            sub_daily_cost = sum(s["daily_cost"] for s in submarines) if not exclude_workshop else 0
-            
-            # Calculate days until restocking needed
-            total_tanks_per_day = sum(s.get("tanks_per_day", 0) for s in submarines)
-            total_kits_per_day = sum(s.get("kits_per_day", 0) for s in submarines)
-            ceruleum = char.get("Ceruleum", 0)
-            repair_kits = char.get("RepairKits", 0)
-            
-            days_until_restock = None
-            if submarines and total_tanks_per_day > 0 and total_kits_per_day > 0:
-                days_from_tanks = ceruleum / total_tanks_per_day if ceruleum > 0 else 0
-                days_from_kits = repair_kits / total_kits_per_day if repair_kits > 0 else 0
-                days_until_restock = int(min(days_from_tanks, days_from_kits))
-            
-            # Accumulate supply totals for sublord snapshot
-            if not exclude_workshop:
-                total_ceruleum += ceruleum
-                total_repair_kits += repair_kits
-                total_tanks_per_day_all += total_tanks_per_day
-                total_kits_per_day_all += total_kits_per_day
-            
-            # Count leveling vs farming submarines
-            char_subs_leveling = sum(1 for s in submarines if s.get("is_leveling", False))
-            char_subs_farming = sum(1 for s in submarines if s.get("is_farming", False))
-            
-            # Count idle submarines (no plan, not leveling, not farming)
-            char_idle_subs = sum(1 for s in submarines if not s.get("plan_name") and not s.get("is_farming", False) and not s.get("is_leveling", False))
-            # Idle sub = has idle subs AND not excluded AND not sleeping (must be enabled)
-            has_idle_sub = char_idle_subs > 0 and not exclude_workshop and not subs_sleeping
-            
-            # Parse retainers (always parse, but hide in display if excluded)
-            retainers = parse_retainer_data(char)
-            retainer_gil = sum(r["gil"] for r in retainers) if not exclude_retainer else 0
-            mb_items = sum(r["mb_items"] for r in retainers) if not exclude_retainer else 0
-            # Override max MB highlight if excluded
-            # Only highlight if ALL retainers have max MB items (20)
-            has_max_mb_retainer = len(retainers) > 0 and all(r["mb_items"] >= 20 for r in retainers) and not exclude_retainer
-            # Count retainers with max MB items (for summary)
-            char_max_mb_count = sum(1 for r in retainers if r["mb_items"] >= 20) if not exclude_retainer else 0
-            
-            # Count leveling vs farming retainers (< 100 = leveling, 100 = farming)
-            char_retainers_leveling = sum(1 for r in retainers if r["level"] < 100)
-            char_retainers_farming = sum(1 for r in retainers if r["level"] >= 100)
-            
-            # Count idle retainers (no venture assigned)
-            char_idle_retainers = sum(1 for r in retainers if not r["has_venture"])
-            # Idle retainer = has idle retainers AND not excluded AND not sleeping (must be enabled)
-            has_idle_retainer = char_idle_retainers > 0 and not exclude_retainer and not retainers_sleeping
-            
-            # Get FC info and FC points
-            fc_name = ""
-            fc_points = 0
-            fc_gil = 0
-            if cid in fc_data:
-                fc_name = fc_data[cid].get("Name", "")
-                fc_points = fc_data[cid].get("FCPoints", 0)
-            
-            # Get XA Database data (treasure, coffers, dyes, job, etc.)
-            treasure_value = 0
-            coffer_dye_value = 0
-            coffer_count = 0
-            dye_count = 0
-            dye_pure_white = 0
-            dye_jet_black = 0
-            dye_pastel_pink = 0
-            mb_dye_count = 0
-            venture_coins = 0
-            current_job = ""
-            current_level = 0
-            highest_job = ""
-            highest_level = 0
-            lowest_job = ""
-            lowest_level = 0
-            all_jobs = {}
-            all_currencies = {}
-            completed_quests = []
-            if cid in alto_map:
-                treasure_value = alto_map[cid].get("treasure_value", 0)
-                coffer_dye_value = alto_map[cid].get("coffer_dye_value", 0)
-                coffer_count = alto_map[cid].get("coffer_count", 0)
-                dye_count = alto_map[cid].get("dye_count", 0)
-                dye_pure_white = alto_map[cid].get("dye_pure_white", 0)
-                dye_jet_black = alto_map[cid].get("dye_jet_black", 0)
-                dye_pastel_pink = alto_map[cid].get("dye_pastel_pink", 0)
-                mb_dye_count = alto_map[cid].get("mb_dye_count", 0)
-                venture_coins = alto_map[cid].get("venture_coins", 0)
-                fc_gil = alto_map[cid].get("fc_gil", 0)
-                current_job = alto_map[cid].get("current_job", "")
-                current_level = alto_map[cid].get("current_level", 0)
-                highest_job = alto_map[cid].get("highest_job", "")
-                highest_level = alto_map[cid].get("highest_level", 0)
-                lowest_job = alto_map[cid].get("lowest_job", "")
-                lowest_level = alto_map[cid].get("lowest_level", 0)
-                all_jobs = alto_map[cid].get("all_jobs", {})
-                all_currencies = alto_map[cid].get("all_currencies", {})
-                completed_quests = alto_map[cid].get("completed_quests", [])
-            
-            # Get venture coffers from AutoRetainer if XA Database doesn't have it
-            venture_coffers_ar = char.get("VentureCoffers", 0)
-            if coffer_count == 0 and venture_coffers_ar > 0:
-                coffer_count = venture_coffers_ar
-                coffer_dye_value += venture_coffers_ar * COFFER_DYE_VALUES.get(32161, 18000)
-            
-            # Get housing data from Lifestream
-            private_house = None
-            fc_house = None
-            if cid in housing_map:
-                private_data = housing_map[cid].get('private')
-                fc_data_house = housing_map[cid].get('fc')
-                if private_data:
-                    private_house = f"{private_data['district']} W{private_data['ward']} P{private_data['plot']}"
-                if fc_data_house:
-                    fc_house = f"{fc_data_house['district']} W{fc_data_house['ward']} P{fc_data_house['plot']}"
-            
-            char_data = {
-                "cid": cid,
-                "name": char.get("Name", "Unknown"),
-                "world": char.get("World", "Unknown"),
-                "region": region_from_world(char.get("World", "")),
-                "gil": char_gil,
-                "retainer_gil": retainer_gil,
-                "fc_gil": fc_gil,
-                "total_gil": char_gil + retainer_gil + fc_gil,
-                "treasure_value": treasure_value,
-                "coffer_dye_value": coffer_dye_value,
-                "coffer_count": coffer_count,
-                "dye_count": dye_count,
-                "dye_pure_white": dye_pure_white,
-                "dye_jet_black": dye_jet_black,
-                "dye_pastel_pink": dye_pastel_pink,
-                "mb_dye_count": mb_dye_count,
-                "venture_coins": venture_coins,
-                "total_with_treasure": char_gil + retainer_gil + fc_gil + treasure_value,
-                "submarines": submarines,
-                "retainers": retainers,
-                "fc_name": fc_name,
-                "fc_points": fc_points,
-                "ceruleum": char.get("Ceruleum", 0),
-                "repair_kits": char.get("RepairKits", 0),
-                "ventures": char.get("Ventures", 0),
-                "inventory_space": char.get("InventorySpace", 0),
-                "gc_seals": char.get("GCSeals", 0),
-                "daily_income": sub_daily_income,
-                "monthly_income": sub_daily_income * 30,
-                "daily_cost": sub_daily_cost,
-                "mb_items": mb_items,
-                "current_job": current_job,
-                "current_level": current_level,
-                "subs_leveling": char_subs_leveling,
-                "subs_farming": char_subs_farming,
-                "idle_subs": char_idle_subs,
-                "has_idle_sub": has_idle_sub,
-                "retainers_leveling": char_retainers_leveling,
-                "retainers_farming": char_retainers_farming,
-                "idle_retainers": char_idle_retainers,
-                "has_idle_retainer": has_idle_retainer,
-                "days_until_restock": days_until_restock,
-                "private_house": private_house,
-                "fc_house": fc_house,
-                "all_jobs": all_jobs,
-                "all_currencies": all_currencies,
-                "categorized_currencies": categorize_currencies(all_currencies) if all_currencies else {},
-            }
-            
-            # Add highest/lowest job (already extracted from alto_map)
-            char_data["highest_job"] = highest_job
-            char_data["highest_level"] = highest_level
-            char_data["lowest_job"] = lowest_job
-            char_data["lowest_level"] = lowest_level
-            
-            # Calculate MSQ progress (returns percentage, position, total, quest_name)
-            # Get max COMBAT job level for validation (MSQ requires combat jobs, not crafters)
-            max_combat_level = max((lv for job, lv in all_jobs.items() if job in COMBAT_JOBS), default=0) if all_jobs else 0
-            # Fallback to current_level only if it's a combat job
-            if max_combat_level == 0 and current_job in COMBAT_JOBS:
-                max_combat_level = current_level
-            msq_pct, msq_pos, msq_total, msq_quest_name = calculate_msq_progress(completed_quests, max_combat_level)
-            char_data["msq_percent"] = msq_pct
-            char_data["msq_completed"] = msq_pos
-            char_data["msq_total"] = msq_total
-            char_data["msq_quest_name"] = msq_quest_name
-            
-            # Count ready submarines and retainers
-            char_ready_subs = sum(1 for s in submarines if s["is_ready"])
-            char_ready_retainers = sum(1 for r in retainers if r["is_ready"])
-            
-            # Get max levels for sorting
-            max_retainer_level = max((r["level"] for r in retainers), default=0)
-            max_sub_level = max((s["level"] for s in submarines), default=0)
-            # Get min levels for sorting (lowest level sub/retainer)
-            min_retainer_level = min((r["level"] for r in retainers), default=0)
-            min_sub_level = min((s["level"] for s in submarines), default=0)
-            
-            # Get minimum return time in seconds for sorting (soonest return first)
-            # For ready items, use 0 (already ready). For non-ready, use seconds until return.
-            # VentureEndsAt and ReturnTime are Unix timestamps (integers)
-            now_ts = datetime.datetime.now().timestamp()
-            retainer_return_times = []
-            for r in retainers:
-                if r["is_ready"]:
-                    retainer_return_times.append(0)
-                elif r["venture_ends"] and r["venture_ends"] > 0:
-                    # venture_ends is Unix timestamp, subtract current timestamp
-                    delta = r["venture_ends"] - now_ts
-                    retainer_return_times.append(max(0, delta))
-                else:
-                    retainer_return_times.append(999999)  # No venture = sort last
-            min_retainer_return = min(retainer_return_times) if retainer_return_times else 999999
-            
-            sub_return_times = []
-            for s in submarines:
-                if s["is_ready"]:
-                    sub_return_times.append(0)
-                elif s["return_time"] and s["return_time"] > 0:
-                    # return_time is Unix timestamp, subtract current timestamp
-                    delta = s["return_time"] - now_ts
-                    sub_return_times.append(max(0, delta))
-                else:
-                    sub_return_times.append(999999)  # No voyage = sort last
-            min_sub_return = min(sub_return_times) if sub_return_times else 999999
-            
-            # Add ready counts and max levels to character data
-            char_data["ready_subs"] = char_ready_subs
-            char_data["total_subs"] = len(submarines)
-            char_data["ready_retainers"] = char_ready_retainers
-            char_data["total_retainers"] = len(retainers)
-            char_data["max_retainer_level"] = max_retainer_level
-            char_data["max_sub_level"] = max_sub_level
-            char_data["min_retainer_level"] = min_retainer_level
-            char_data["min_sub_level"] = min_sub_level
-            char_data["min_retainer_return"] = int(min_retainer_return)
-            char_data["min_sub_return"] = int(min_sub_return)
-            char_data["has_max_mb_retainer"] = has_max_mb_retainer
-            
-            # Add exclusion flags for template display
-            char_data["exclude_retainer"] = exclude_retainer
-            char_data["exclude_workshop"] = exclude_workshop
-            
-            # Add sleeping flags for template display
-            char_data["retainers_sleeping"] = retainers_sleeping
-            char_data["subs_sleeping"] = subs_sleeping
-            # Add processing flag - character is processing if Enabled=true OR WorkshopEnabled=true
-            char_data["is_processing"] = not retainers_sleeping or not subs_sleeping
-            # Count sleeping retainers/subs for this character
-            char_sleeping_retainers = len(retainers) if retainers_sleeping else 0
-            char_sleeping_subs = len(submarines) if subs_sleeping else 0
-            char_data["sleeping_retainer_count"] = char_sleeping_retainers
-            char_data["sleeping_sub_count"] = char_sleeping_subs
-            
-            # Check if character has potential for retainers (MSQ 66060 completed but 0 retainers)
-            # Override if retainers are excluded
-            # Only set if SHOW_MSQ_PROGRESSION is enabled (otherwise we can't determine MSQ status)
-            char_data["has_potential_retainer"] = SHOW_MSQ_PROGRESSION and (66060 in completed_quests) and (len(retainers) == 0) and not exclude_retainer
-            
-            # Check if character has potential for subs (Lv 25+ but not in FC)
-            # Use highest_level to check if any job is 25+
-            char_data["has_potential_subs"] = highest_level >= 25 and not fc_name
-            
-            # Track max MB count for this character
-            char_data["max_mb_count"] = char_max_mb_count
-            
-            # Track idle flags for asterisk descriptions
-            char_data["has_idle_retainer"] = has_idle_retainer
-            char_data["has_idle_sub"] = has_idle_sub
-            
-            account_data["characters"].append(char_data)
-            account_data["total_gil"] += char_data["total_gil"]
-            # Don't count excluded subs/retainers in account totals
-            account_data["total_subs"] += len(submarines) if not exclude_workshop else 0
-            account_data["total_retainers"] += len(retainers) if not exclude_retainer else 0
-            # Don't count sleeping or excluded subs/retainers as ready
-            account_data["ready_subs"] += char_ready_subs if not exclude_workshop and not subs_sleeping else 0
-            account_data["ready_retainers"] += char_ready_retainers if not exclude_retainer and not retainers_sleeping else 0
-            # Track excluded counts
-            if exclude_retainer and len(retainers) > 0:
-                account_data["excluded_retainers"] += len(retainers)
-            if exclude_workshop and len(submarines) > 0:
-                account_data["excluded_subs"] += len(submarines)
-            # Track sleeping counts (Enabled=false or WorkshopEnabled=false)
-            # Don't count excluded retainers/subs in sleeping totals
-            if char_sleeping_retainers > 0 and not exclude_retainer:
-                account_data["sleeping_retainers"] += char_sleeping_retainers
-                account_data["has_sleeping_retainer"] = True
-            if char_sleeping_subs > 0 and not exclude_workshop:
-                account_data["sleeping_subs"] += char_sleeping_subs
-                account_data["has_sleeping_sub"] = True
-            account_data["total_mb_items"] += mb_items
-            account_data["total_treasure"] += treasure_value
-            account_data["total_coffer_dye_value"] += coffer_dye_value
-            account_data["total_coffer_count"] += coffer_count
-            account_data["total_dye_count"] += dye_count
-            account_data["total_mb_dye_count"] += mb_dye_count
-            account_data["total_venture_coins"] += venture_coins
-            account_data["total_fc_points"] += fc_points
-            
-            # Track minimum restock days (excluding 0 and None)
-            if days_until_restock is not None and days_until_restock > 0:
-                restock_day_values.append(days_until_restock)
-                if min_restock_days is None or days_until_restock < min_restock_days:
-                    min_restock_days = days_until_restock
-            
-            account_data["subs_leveling"] += char_subs_leveling
-            account_data["subs_farming"] += char_subs_farming
-            # Only count idle subs if not excluded AND not sleeping (must be enabled)
-            if not exclude_workshop and not subs_sleeping:
-                account_data["idle_subs"] += char_idle_subs
-            if has_idle_sub:
-                account_data["has_idle_sub"] = True
-            account_data["retainers_leveling"] += char_retainers_leveling
-            account_data["retainers_farming"] += char_retainers_farming
-            # Only count idle retainers if not excluded AND not sleeping (must be enabled)
-            if not exclude_retainer and not retainers_sleeping:
-                account_data["idle_retainers"] += char_idle_retainers
-            if has_idle_retainer:
-                account_data["has_idle_retainer"] = True
-            
-            # Track max MB retainers (only when ALL retainers are maxed)
-            if has_max_mb_retainer:
-                account_data["has_max_mb_retainer"] = True
-                account_data["all_max_mb_count"] += 1  # Count characters with ALL retainers maxed
-            # Count individual retainers at max MB (for summary)
-            account_data["max_mb_retainer_count"] += char_max_mb_count
-            
-            # Track potential subs (lv 25+ not in FC)
-            if char_data["has_potential_subs"]:
-                account_data["potential_subs_count"] += 1
-            
-            # Track enabled retainers/subs (not excluded, not sleeping)
-            if not exclude_retainer and not retainers_sleeping:
-                account_data["enabled_retainers"] += len(retainers)
-            if not exclude_workshop and not subs_sleeping:
-                account_data["enabled_subs"] += len(submarines)
-            
-            # Track MSQ progress stats
-            if char_data["msq_percent"] > 0:
-                account_data["characters_with_msq"] += 1
-                total_characters_with_msq += 1
-                total_msq_percent += char_data["msq_percent"]
-                if char_data["msq_percent"] >= 100:
-                    account_data["msq_100_count"] += 1
-                    msq_100_count += 1
-                if char_data["msq_percent"] >= 90:
-                    account_data["msq_90_count"] += 1
-                    msq_90_count += 1
-                if char_data["msq_percent"] >= 50:
-                    account_data["msq_50_count"] += 1
-                    msq_50_count += 1
-            
-            # Track character level stats and housing plots
-            if highest_level >= 25:
-                total_chars_lv25_plus += 1
-            if highest_level >= 100:
-                total_chars_lv100 += 1
-            # Track unique plots (world+location to avoid counting shared houses)
-            char_world = char.get("World", "")
-            if cid in housing_map:
-                private_data = housing_map[cid].get('private')
-                fc_data_house = housing_map[cid].get('fc')
-                if private_data:
-                    plot_key = f"{char_world}_{private_data['district']}_W{private_data['ward']}_P{private_data['plot']}"
-                    unique_personal_plots.add(plot_key)
-                if fc_data_house:
-                    plot_key = f"{char_world}_{fc_data_house['district']}_W{fc_data_house['ward']}_P{fc_data_house['plot']}"
-                    unique_fc_plots.add(plot_key)
-            
-            total_daily_income += sub_daily_income
-            total_daily_cost += sub_daily_cost
-        
-        # Calculate max MB items for this account (20 per retainer)
-        account_data["max_mb_items"] = account_data["total_retainers"] * 20
-        
-        total_gil += account_data["total_gil"]
-        total_subs += account_data["total_subs"]
-        total_retainers += account_data["total_retainers"]
-        ready_subs += account_data["ready_subs"]
-        ready_retainers += account_data["ready_retainers"]
-        total_mb_items += account_data["total_mb_items"]
-        total_treasure += account_data["total_treasure"]
-        total_coffer_dye_value += account_data["total_coffer_dye_value"]
-        total_coffer_count += account_data["total_coffer_count"]
-        total_dye_count += account_data["total_dye_count"]
-        total_mb_dye_count += account_data["total_mb_dye_count"]
-        total_venture_coins += account_data["total_venture_coins"]
-        total_fc_points += account_data["total_fc_points"]
-        total_subs_leveling += account_data["subs_leveling"]
-        total_subs_farming += account_data["subs_farming"]
-        total_idle_subs += account_data["idle_subs"]
-        total_retainers_leveling += account_data["retainers_leveling"]
-        total_retainers_farming += account_data["retainers_farming"]
-        total_idle_retainers += account_data["idle_retainers"]
-        total_excluded_retainers += account_data["excluded_retainers"]
-        total_excluded_subs += account_data["excluded_subs"]
-        total_sleeping_retainers += account_data["sleeping_retainers"]
-        total_sleeping_subs += account_data["sleeping_subs"]
-        total_potential_subs += account_data["potential_subs_count"]
-        total_enabled_retainers += account_data["enabled_retainers"]
-        total_enabled_subs += account_data["enabled_subs"]
-        total_all_max_mb += account_data["all_max_mb_count"]
+        total_gil += account_data["total_gil"]
+        total_subs += account_data["total_subs"]
+        total_retainers += account_data["total_retainers"]
+        ready_subs += account_data["ready_subs"]
+        ready_retainers += account_data["ready_retainers"]
+        total_mb_items += account_data["total_mb_items"]
+        total_treasure += account_data["total_treasure"]
+        total_coffer_dye_value += account_data["total_coffer_dye_value"]
+        total_coffer_count += account_data["total_coffer_count"]
+        total_dye_count += account_data["total_dye_count"]
+        total_mb_dye_count += account_data["total_mb_dye_count"]
+        total_venture_coins += account_data["total_venture_coins"]
+        total_fc_points += account_data["total_fc_points"]
+        total_subs_leveling += account_data["subs_leveling"]
+        total_subs_farming += account_data["subs_farming"]
+        total_idle_subs += account_data["idle_subs"]
+        total_retainers_leveling += account_data["retainers_leveling"]
+        total_retainers_farming += account_data["retainers_farming"]
+        total_idle_retainers += account_data["idle_retainers"]
+        total_excluded_retainers += account_data["excluded_retainers"]
+        total_excluded_subs += account_data["excluded_subs"]
+        total_sleeping_retainers += account_data["sleeping_retainers"]
+        total_sleeping_subs += account_data["sleeping_subs"]
+        total_potential_subs += account_data["potential_subs_count"]
+        total_enabled_retainers += account_data["enabled_retainers"]
+        total_enabled_subs += account_data["enabled_subs"]
+        total_all_max_mb += account_data["all_max_mb_count"]
         
         all_accounts.append(account_data)
     
+    total_characters_with_msq = len(msq_percents)
+    total_msq_percent = sum(msq_percents)
+    
+    # Income, supply and restock totals (workshop-excluded characters don't count toward income/supplies)
+    fleet_table = FleetTable(all_accounts)
+    fleet_totals = fleet_table.totals()
+    total_daily_income = fleet_totals["daily_income"]
+    total_daily_cost = fleet_totals["daily_cost"]
+    min_restock_days, max_restock_days = fleet_table.restock_range()
+    
     return {
         "accounts": all_accounts,
         "summary": {
@@ -2586,7 +4109,7 @@ def get_all_data():
             "monthly_profit": (total_daily_income - total_daily_cost) * 30,
             "annual_profit": (total_daily_income - total_daily_cost) * 365,
             "min_restock_days": min_restock_days,
-            "max_restock_days": max(restock_day_values) if restock_day_values else None,
+            "max_restock_days": max_restock_days,
             # MSQ Progress stats
             "msq_100_count": msq_100_count,
             "msq_90_count": msq_90_count,
@@ -2603,10 +4126,10 @@ def get_all_data():
             # Max MB retainer tracking
             "max_mb_retainer_count": sum(acc.get("max_mb_retainer_count", 0) for acc in all_accounts),
             # Supply totals for sublord snapshot
-            "total_ceruleum": total_ceruleum,
-            "total_kits": total_repair_kits,
-            "total_tanks_per_day": round(total_tanks_per_day_all, 2),
-            "total_kits_per_day": round(total_kits_per_day_all, 2),
+            "total_ceruleum": fleet_totals["ceruleum"],
+            "total_kits": fleet_totals["repair_kits"],
+            "total_tanks_per_day": fleet_totals["tanks_per_day"],
+            "total_kits_per_day": fleet_totals["kits_per_day"],
         },
         "last_updated": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     }
@@ -3223,6 +4746,13 @@ HTML_TEMPLATE = '''
             border-radius: 10px;
             border: 1px solid var(--border);
             overflow: hidden;
+            /* Skip layout/paint of off-screen cards */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 260px;
+        }
+        
+        .card-sentinel {
+            height: 1px;
         }
         
         .character-card.expanded {
@@ -3602,6 +5132,14 @@ HTML_TEMPLATE = '''
             color: var(--accent-light);
         }
         
+        .stale-badge {
+            font-size: 0.85em;
+            background: rgba(255, 193, 7, 0.25);
+            border: 1px solid #ffc107;
+            border-radius: 6px;
+            padding: 2px 8px;
+        }
+        
         .collapsible {
             cursor: pointer;
             user-select: none;
@@ -3669,7 +5207,7 @@ HTML_TEMPLATE = '''
                 <div class="header-content">
                     <div class="header-left">
                         <h1>⚓ AutoRetainer Dashboard <a href="/fcdata/" style="font-size:0.7rem;color:var(--accent-light);text-decoration:none;padding:3px 10px;border:1px solid var(--border);border-radius:6px;margin-left:8px;vertical-align:middle;font-weight:400;">🏨 FC Data</a><a href="/data/" style="font-size:0.7rem;color:var(--accent-light);text-decoration:none;padding:3px 10px;border:1px solid var(--border);border-radius:6px;margin-left:6px;vertical-align:middle;font-weight:400;">📝 Data</a><a href="/charts/" style="font-size:0.7rem;color:var(--accent-light);text-decoration:none;padding:3px 10px;border:1px solid var(--border);border-radius:6px;margin-left:6px;vertical-align:middle;font-weight:400;">📈 Charts</a></h1>
-                        <div class="subtitle">Last Updated: <span id="last-updated">{{ data.last_updated }}</span> | Auto-refresh: {{ auto_refresh }}s</div>
+                        <div class="subtitle">Last Updated: <span id="last-updated">{{ data.last_updated }}</span> | {% if live_updates %}Live updates{% else %}Auto-refresh: {{ auto_refresh }}s{% endif %}</div>
                     </div>
                     <div class="header-right">
                         <div class="search-container">
@@ -3799,6 +5337,7 @@ HTML_TEMPLATE = '''
             <div class="account-header collapsed" onclick="toggleAccount(this)">
                 <h2>{{ account.nickname }}</h2>
                 <div class="account-stats">
+                    {% if account.stale %}<span class="stale-badge" title="Account files did not respond in time - showing data from {{ account.stale_age }} ago">⏳ stale {{ account.stale_age }}</span>{% endif %}
                     <span>💰 <span class="acc-gil">{{ "{:,}".format(account.total_gil) }}</span> gil</span>
                     <span>💎 <span class="acc-treasure">{{ "{:,}".format(account.total_treasure) }}</span> treasure</span>
                     <span class="{% if account.ready_subs > 0 %}stat-ready{% endif %}">🚢 <span class="acc-ready-subs">{{ account.ready_subs }}</span>/<span class="acc-subs">{{ account.total_subs }}</span> subs</span>
@@ -3836,402 +5375,18 @@ HTML_TEMPLATE = '''
             {% if account.error %}
             <div class="error-message">{{ account.error }}</div>
             {% else %}
-            <div class="character-grid">
-                {% for char in account.characters %}
-                <div class="character-card{% if char.has_max_mb_retainer %} has-max-mb{% endif %}{% if char.has_idle_retainer and not char.retainers_sleeping %} has-idle-retainer{% endif %}{% if char.has_idle_sub and not char.subs_sleeping %} has-idle-sub{% endif %}{% if char.has_potential_retainer %} has-potential-retainer{% endif %}{% if char.has_potential_subs %} has-potential-subs{% endif %}" data-char="{{ char.cid }}" data-level="{{ char.current_level }}" data-lowest-level="{{ char.lowest_level }}" data-highest-level="{{ char.highest_level }}" data-gil="{{ char.total_gil }}" data-treasure="{{ char.treasure_value }}" data-fc-points="{{ char.fc_points }}" data-venture-coins="{{ char.venture_coins }}" data-coffers="{{ char.coffer_count }}" data-dyes="{{ char.dye_count }}" data-tanks="{{ char.ceruleum }}" data-kits="{{ char.repair_kits }}" data-restock="{{ char.days_until_restock if char.days_until_restock is not none else 9999 }}" data-retainers="{{ char.ready_retainers }}" data-total-retainers="{{ char.total_retainers }}" data-subs="{{ char.ready_subs }}" data-total-subs="{{ char.total_subs }}" data-inventory="{{ 140 - char.inventory_space }}" data-has-personal-house="{{ 'true' if char.private_house else 'false' }}" data-has-fc-house="{{ 'true' if char.fc_house else 'false' }}" data-has-fc-gil="{{ 'true' if char.fc_gil > 0 else 'false' }}" data-retainer-level="{{ char.max_retainer_level }}" data-sub-level="{{ char.min_sub_level }}" data-retainer-return="{{ char.min_retainer_return }}" data-sub-return="{{ char.min_sub_return }}" data-msq-percent="{{ char.msq_percent }}" data-has-max-mb="{{ 'true' if char.has_max_mb_retainer else 'false' }}" data-mb="{{ char.mb_items }}" data-has-mb="{{ 'true' if char.mb_items > 0 else 'false' }}" data-has-coffers="{{ 'true' if char.coffer_count > 0 else 'false' }}" data-has-dyes="{{ 'true' if char.dye_count > 0 else 'false' }}" data-has-treasure="{{ 'true' if char.treasure_value > 0 else 'false' }}" data-region="{{ char.region }}" data-has-ready="{{ 'true' if (char.ready_retainers > 0 and not char.exclude_retainer and not char.retainers_sleeping) or (char.ready_subs > 0 and not char.exclude_workshop and not char.subs_sleeping) else 'false' }}" data-has-exclusion="{{ 'true' if char.exclude_retainer or char.exclude_workshop else 'false' }}" data-is-processing="{{ 'true' if char.is_processing else 'false' }}" data-has-sleeping="{{ 'true' if (char.retainers_sleeping and char.total_retainers > 0 and not char.exclude_retainer) or (char.subs_sleeping and char.total_subs > 0 and not char.exclude_workshop) else 'false' }}" data-has-idle="{{ 'true' if (char.has_idle_retainer and not char.retainers_sleeping) or (char.has_idle_sub and not char.subs_sleeping) else 'false' }}" data-has-potential-subs="{{ 'true' if char.has_potential_subs or char.has_potential_retainer else 'false' }}">
-                    <div class="character-header collapsed {% if (char.ready_retainers > 0 and not char.exclude_retainer and not char.retainers_sleeping) or (char.ready_subs > 0 and not char.exclude_workshop and not char.subs_sleeping) %}has-available{% endif %}" onclick="toggleCharacter(this)">
-                        <div class="char-header-row name-row">
-                            <span class="character-name">{{ char.name }}{% if char.current_level > 0 %} <span style="font-size: 0.8em; color: var(--text-secondary);">(Lv {{ char.current_level }}, {{ char.current_job }})</span>{% endif %}{% if show_msq_progression and char.msq_completed > 0 %} <span style="font-size: 0.8em; {% if char.msq_percent >= 90 %}color: #4ade80;{% elif char.msq_percent >= 50 %}color: #fbbf24;{% else %}color: #94a3b8;{% endif %}" title="MSQ Progress: {{ char.msq_completed }}/{{ char.msq_total }}{% if char.msq_quest_name %} - {{ char.msq_quest_name }}{% endif %}">MSQ: {{ char.msq_percent }}%</span>{% endif %}{% if char.private_house %} <span style="font-size: 0.8em;" title="Personal House: {{ char.private_house }}">🏠</span>{% endif %}{% if char.fc_house %} <span style="font-size: 0.8em;" title="FC House: {{ char.fc_house }}">🏨</span>{% endif %}</span>
-                            <span class="char-status {% if char.ready_retainers > 0 and not char.exclude_retainer and not char.retainers_sleeping %}available{% else %}all-sent{% endif %}">👤 {% if char.exclude_retainer %}null{% else %}{{ char.ready_retainers }}/{{ char.total_retainers }}{% endif %}{% if char.sleeping_retainer_count > 0 %} <span style="color: #9370DB;">😴{{ char.sleeping_retainer_count }}</span>{% endif %}</span>
-                        </div>
-                        <div class="char-header-row">
-                            <span class="character-world">{{ char.world }}{% if char.fc_name %} • {{ char.fc_name }}{% endif %} • 🎒 {{ 140 - char.inventory_space }}/140</span>
-                            <span class="char-status {% if char.ready_subs > 0 and not char.exclude_workshop and not char.subs_sleeping %}available{% else %}all-sent{% endif %}">🚢 {% if char.exclude_workshop %}null{% else %}{{ char.ready_subs }}/{{ char.total_subs }}{% endif %}{% if char.sleeping_sub_count > 0 %} <span style="color: #9370DB;">😴{{ char.sleeping_sub_count }}</span>{% endif %}</span>
-                        </div>
-                        <div class="char-header-row">
-                            <span style="font-size: 0.8em; color: var(--text-secondary);">🪧 {{ char.mb_items }} | 📦 {{ char.coffer_count }} | 🎨 {{ char.dye_count }}{% if char.dye_count > 0 %} 🤍{{ char.dye_pure_white }} 🖤{{ char.dye_jet_black }} 🩷{{ char.dye_pastel_pink }}{% endif %}</span>
-                            <span class="character-gil">{{ "{:,}".format(char.total_gil) }} gil</span>
-                        </div>
-                        <div class="char-header-row">
-                            <span style="font-size: 0.8em; color: var(--text-secondary);">🪙 {{ "{:,}".format(char.fc_points) }} | 🛒 {{ "{:,}".format(char.venture_coins) }} | ⛽ {{ "{:,}".format(char.ceruleum) }} | 🔧 {{ "{:,}".format(char.repair_kits) }}{% if char.total_subs > 0 %} | <span style="{% if char.days_until_restock is not none and char.days_until_restock < 7 %}color: var(--danger);{% elif char.days_until_restock is not none and char.days_until_restock < 14 %}color: var(--warning);{% endif %}">♻️ {% if char.days_until_restock is not none %}{{ char.days_until_restock }}d{% else %}N/A{% endif %}</span>{% endif %}</span>
-                            {% if char.total_subs > 0 %}<span style="font-size: 0.8em; color: var(--gold);">💎 {{ "{:,}".format(char.treasure_value) }}</span>{% endif %}
-                        </div>
-                    </div>
-                    <div class="character-body collapsed">
-                        {% if highlight_idle_retainers and char.has_idle_retainer and not char.retainers_sleeping %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: cyan; padding: 5px 15px; background: rgba(0, 255, 255, 0.1);">* You have idle retainers, update your planner in game</div>
-                        {% endif %}
-                        {% if highlight_idle_subs and char.has_idle_sub and not char.subs_sleeping %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: #FFB6C1; padding: 5px 15px; background: rgba(255, 182, 193, 0.1);">* You have idle subs, update your planner in game</div>
-                        {% endif %}
-                        {% if highlight_max_mb and char.has_max_mb_retainer %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: #FFD700; padding: 5px 15px; background: rgba(255, 215, 0, 0.1);">* You have max marketboard items, go undercut or remove!</div>
-                        {% endif %}
-                        {% if highlight_potential_retainer and char.has_potential_retainer %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: #8B4513; padding: 5px 15px; background: rgba(139, 69, 19, 0.1);">* You should hire retainers, you have progressed far enough in MSQ</div>
-                        {% endif %}
-                        {% if highlight_potential_subs and char.has_potential_subs %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: #888; padding: 5px 15px; background: rgba(26, 26, 26, 0.3);">* You're lv 25+ and not in an FC, get to farming!<br>You may also just not have Lifestream registered, get on it!</div>
-                        {% endif %}
-                        {% if char.retainers_sleeping and char.total_retainers > 0 %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: #9370DB; padding: 5px 15px; background: rgba(147, 112, 219, 0.1);">* Your retainers are not enabled in AutoRetainer</div>
-                        {% endif %}
-                        {% if char.subs_sleeping and char.total_subs > 0 %}
-                        <div class="highlight-reason" style="font-size: 0.75em; color: #9370DB; padding: 5px 15px; background: rgba(147, 112, 219, 0.1);">* Your submarines are not enabled in AutoRetainer</div>
-                        {% endif %}
-                        <div class="section-title collapsible collapsed player-stats-header" onclick="toggleCollapse(this)">📊 Player Stats</div>
-                        <div class="collapse-content collapsed player-stats-content">
-                        <div class="info-row">
-                            <span class="info-label">Player</span>
-                            <span class="info-value player-name-world">{{ char.name }}@{{ char.world }}</span>
-                        </div>
-                        {% if char.current_level > 0 %}
-                        <div class="info-row">
-                            <span class="info-label">Current Class</span>
-                            <span class="info-value">{{ char.current_job }} Lv {{ char.current_level }}</span>
-                        </div>
-                        {% endif %}
-                        {% if char.lowest_level > 0 and char.lowest_level < char.current_level %}
-                        <div class="info-row">
-                            <span class="info-label">Lowest Class</span>
-                            <span class="info-value">{{ char.lowest_job }} Lv {{ char.lowest_level }}</span>
-                        </div>
-                        {% endif %}
-                        {% if char.highest_level > 0 and char.highest_level > char.current_level %}
-                        <div class="info-row">
-                            <span class="info-label">Highest Class</span>
-                            <span class="info-value">{{ char.highest_job }} Lv {{ char.highest_level }}</span>
-                        </div>
-                        {% endif %}
-                        <div class="info-row">
-                            <span class="info-label">Character Gil</span>
-                            <span class="info-value">{{ "{:,}".format(char.gil) }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">Retainer Gil</span>
-                            <span class="info-value">{{ "{:,}".format(char.retainer_gil) }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">FC Gil</span>
-                            <span class="info-value" style="color: var(--accent-light);">{{ "{:,}".format(char.fc_gil) }}</span>
-                        </div>
-                        {% if char.treasure_value > 0 %}
-                        <div class="info-row">
-                            <span class="info-label">Treasure Value</span>
-                            <span class="info-value" style="color: var(--gold);">{{ "{:,}".format(char.treasure_value) }}</span>
-                        </div>
-                        {% endif %}
-                        {% if char.coffer_dye_value > 0 %}
-                        <div class="info-row">
-                            <span class="info-label">Coffer + Dye Value</span>
-                            <span class="info-value" style="color: var(--accent-light);">{{ "{:,}".format(char.coffer_dye_value) }}</span>
-                        </div>
-                        {% endif %}
-                        <div class="info-row">
-                            <span class="info-label">FC Points 🪙</span>
-                            <span class="info-value">{{ "{:,}".format(char.fc_points) }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">Venture Coins 🛒</span>
-                            <span class="info-value">{{ char.venture_coins }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">Coffers 📦</span>
-                            <span class="info-value">{{ char.coffer_count }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">Inventory 🎒</span>
-                            <span class="info-value" style="{% if (140 - char.inventory_space) >= 130 %}color: var(--accent);{% elif (140 - char.inventory_space) >= 100 %}color: var(--warning);{% endif %}">{{ 140 - char.inventory_space }}/140</span>
-                        </div>
-                        {% if show_msq_progression and char.msq_completed > 0 %}
-                        <div class="info-row">
-                            <span class="info-label">MSQ Progress 📜</span>
-                            <span class="info-value" style="{% if char.msq_percent >= 90 %}color: #4ade80;{% elif char.msq_percent >= 50 %}color: #fbbf24;{% else %}color: #94a3b8;{% endif %}">{{ char.msq_percent }}% ({{ char.msq_completed }}/{{ char.msq_total }}){% if char.msq_quest_name %} - {{ char.msq_quest_name }}{% endif %}</span>
-                        </div>
-                        {% endif %}
-                        {% if char.private_house %}
-                        <div class="info-row">
-                            <span class="info-label">Personal House 🏠</span>
-                            <span class="info-value">{{ char.private_house }}</span>
-                        </div>
-                        {% endif %}
-                        {% if char.fc_house %}
-                        <div class="info-row">
-                            <span class="info-label">FC House 🏨</span>
-                            <span class="info-value">{{ char.fc_house }}</span>
-                        </div>
-                        {% endif %}
-                        <div class="info-row">
-                            <span class="info-label">Ceruleum Tanks ⛽</span>
-                            <span class="info-value">{{ "{:,}".format(char.ceruleum) }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">Repair Kits 🔧</span>
-                            <span class="info-value">{{ "{:,}".format(char.repair_kits) }}</span>
-                        </div>
-                        {% if char.total_subs > 0 %}
-                        <div class="info-row">
-                            <span class="info-label">Days Until Restock ♻️</span>
-                            <span class="info-value" style="{% if char.days_until_restock is not none and char.days_until_restock < 7 %}color: var(--danger);{% elif char.days_until_restock is not none and char.days_until_restock < 14 %}color: var(--warning);{% else %}color: var(--success);{% endif %}">{% if char.days_until_restock is not none %}{{ char.days_until_restock }} days{% else %}N/A{% endif %}</span>
-                        </div>
-                        {% endif %}
-                        <div class="info-row">
-                            <span class="info-label">Daily Income</span>
-                            <span class="info-value success">+{{ "{:,}".format(char.daily_income|int) }}</span>
-                        </div>
-                        <div class="info-row">
-                            <span class="info-label">Daily Cost</span>
-                            <span class="info-value warning">-{{ "{:,}".format(char.daily_cost|int) }}</span>
-                        </div>
-                        </div>
-                        
-                        {% if char.submarines %}
-                        <div class="section-title collapsible" onclick="toggleCollapse(this)">🚢 Submarines ({{ char.submarines|length }}) - <span style="color: var(--warning);">Lvl: {{ char.subs_leveling }}</span> | <span style="color: var(--success);">Farm: {{ char.subs_farming }}</span></div>
-                        <div class="collapse-content">
-                            <table class="sub-table">
-                                <tr>
-                                    <th>Name</th>
-                                    <th>Lvl</th>
-                                    <th>Build</th>
-                                    <th>Plan</th>
-                                    <th>Status</th>
-                                </tr>
-                                {% for sub in char.submarines %}
-                                <tr>
-                                    <td>{{ sub.name }}</td>
-                                    <td>{{ sub.level }}</td>
-                                    <td>{{ sub.build }}</td>
-                                    <td class="{% if not sub.plan_name and not sub.is_farming and not sub.is_leveling %}status-none{% endif %}" style="{% if sub.plan_name == 'Finalize' %}color: #f85149;{% elif sub.plan_name == 'Redeploy' %}color: cyan;{% elif sub.is_farming %}color: var(--success);{% elif sub.is_leveling %}color: var(--warning);{% endif %}">
-                                        {% if sub.plan_name %}{{ sub.plan_name }}{% elif sub.is_farming %}Farm{% elif sub.is_leveling %}Lvl{% else %}None{% endif %}
-                                    </td>
-                                    <td class="{% if sub.return_formatted == 'Ready!' %}status-ready{% else %}status-voyaging{% endif %}">
-                                        {{ sub.return_formatted }}
-                                    </td>
-                                </tr>
-                                {% endfor %}
-                            </table>
-                        </div>
-                        {% endif %}
-                        
-                        {% if char.retainers %}
-                        <div class="section-title collapsible" onclick="toggleCollapse(this)">👤 Retainers ({{ char.retainers|length }}) - <span style="color: var(--warning);">Lvl: {{ char.retainers_leveling }}</span> | <span style="color: var(--success);">Farm: {{ char.retainers_farming }}</span></div>
-                        <div class="collapse-content">
-                            <table class="ret-table">
-                                <tr>
-                                    <th>Name</th>
-                                    <th>Lvl</th>
-                                    <th>Gil</th>
-                                    <th>MB</th>
-                                    <th>Venture</th>
-                                </tr>
-                                {% for ret in char.retainers %}
-                                <tr>
-                                    <td>{{ ret.name }}</td>
-                                    <td>{{ ret.level }}</td>
-                                    <td>{{ "{:,}".format(ret.gil) }}</td>
-                                    <td>{{ ret.mb_items }}</td>
-                                    <td class="{% if ret.venture_formatted == 'Ready!' %}status-ready{% elif not ret.has_venture %}status-none{% else %}status-voyaging{% endif %}">
-                                        {{ ret.venture_formatted if ret.has_venture else "None" }}
-                                    </td>
-                                </tr>
-                                {% endfor %}
-                            </table>
-                        </div>
-                        {% endif %}
-                        
-                        {% if show_classes and char.all_jobs %}
-                        <div class="section-title collapsible collapsed" onclick="toggleCollapse(this)">⚔️ DoW/DoM</div>
-                        <div class="collapse-content collapsed">
-                            <div class="job-grid">
-                                <div class="job-column">
-                                    <div class="job-category-title">🛡️ Tank</div>
-                                    {% for job in job_categories.Tank %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    {% if job_level == 0 and job in job_base_class %}
-                                    {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
-                                    {% endif %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                    <div class="job-category-title" style="margin-top: 10px;">⚔️ Melee DPS</div>
-                                    {% for job in job_categories.MeleeDPS %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    {% if job_level == 0 and job in job_base_class %}
-                                    {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
-                                    {% endif %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                </div>
-                                <div class="job-column">
-                                    <div class="job-category-title">💚 Healer</div>
-                                    {% for job in job_categories.Healer %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    {% if job_level == 0 and job in job_base_class %}
-                                    {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
-                                    {% endif %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                    <div class="job-category-title" style="margin-top: 10px;">🏹 Physical Ranged DPS</div>
-                                    {% for job in job_categories.PhysRangedDPS %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    {% if job_level == 0 and job in job_base_class %}
-                                    {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
-                                    {% endif %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                    <div class="job-category-title" style="margin-top: 10px;">✨ Magical Ranged DPS</div>
-                                    {% for job in job_categories.MagicRangedDPS %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    {% if job_level == 0 and job in job_base_class %}
-                                    {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
-                                    {% endif %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                </div>
-                            </div>
-                        </div>
-                        
-                        <div class="section-title collapsible collapsed" onclick="toggleCollapse(this)">🔨 DoH/DoL</div>
-                        <div class="collapse-content collapsed">
-                            <div class="job-grid">
-                                <div class="job-column">
-                                    <div class="job-category-title">🔨 Disciples of the Hand</div>
-                                    {% for job in job_categories.DoH %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                </div>
-                                <div class="job-column">
-                                    <div class="job-category-title">⛏️ Disciples of the Land</div>
-                                    {% for job in job_categories.DoL %}
-                                    {% set job_level = char.all_jobs.get(job, 0) %}
-                                    <div class="job-row">
-                                        <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
-                                        <span class="job-name">{{ job_display_names.get(job, job) }}</span>
-                                    </div>
-                                    {% endfor %}
-                                </div>
-                            </div>
-                        </div>
-                        {% endif %}
-                        
-                        {% if show_currencies and char.categorized_currencies %}
-                        <div class="section-title collapsible collapsed" onclick="toggleCollapse(this)">💰 Currencies</div>
-                        <div class="collapse-content collapsed">
-                            <div class="currency-section">
-                                {% if char.categorized_currencies.crystal_grid %}
-                                <div class="crystal-container">
-                                <div class="currency-category-title">💎 Crystals</div>
-                                <div class="crystal-grid">
-                                    <div></div>
-                                    <div class="crystal-header">Shards</div>
-                                    <div class="crystal-header">Crystals</div>
-                                    <div class="crystal-header">Clusters</div>
-                                    {% for elem in char.categorized_currencies.crystal_elements %}
-                                    <div class="crystal-element">{{ elem }}</div>
-                                    <div class="{% if char.categorized_currencies.crystal_grid[elem].Shard > 0 %}crystal-value{% else %}crystal-value-zero{% endif %}">{{ "{:,}".format(char.categorized_currencies.crystal_grid[elem].Shard) }}</div>
-                                    <div class="{% if char.categorized_currencies.crystal_grid[elem].Crystal > 0 %}crystal-value{% else %}crystal-value-zero{% endif %}">{{ "{:,}".format(char.categorized_currencies.crystal_grid[elem].Crystal) }}</div>
-                                    <div class="{% if char.categorized_currencies.crystal_grid[elem].Cluster > 0 %}crystal-value{% else %}crystal-value-zero{% endif %}">{{ "{:,}".format(char.categorized_currencies.crystal_grid[elem].Cluster) }}</div>
-                                    {% endfor %}
-                                </div>
-                                </div>
-                                {% endif %}
-                                
-                                {% if char.categorized_currencies.categories.Common or char.categorized_currencies.categories.Tomestones %}
-                                <div class="currency-row-group">
-                                    {% if char.categorized_currencies.categories.Common %}
-                                    <div class="currency-category">
-                                        <div class="currency-category-title">Common</div>
-                                        {% for display_name, value in char.categorized_currencies.categories.Common %}
-                                        <div class="currency-row">
-                                            <span class="currency-name">{{ display_name }}</span>
-                                            <span class="currency-value">{{ "{:,}".format(value) }}</span>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-                                    {% if char.categorized_currencies.categories.Tomestones %}
-                                    <div class="currency-category">
-                                        <div class="currency-category-title">Tomestones</div>
-                                        {% for display_name, value in char.categorized_currencies.categories.Tomestones %}
-                                        <div class="currency-row">
-                                            <span class="currency-name">{{ display_name }}</span>
-                                            <span class="currency-value">{{ "{:,}".format(value) }}</span>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-                                </div>
-                                {% endif %}
-                                
-                                {% if char.categorized_currencies.categories.Battle or char.categorized_currencies.categories.Societies or char.categorized_currencies.categories.Other %}
-                                <div class="currency-row-group">
-                                    {% if char.categorized_currencies.categories.Battle %}
-                                    <div class="currency-category">
-                                        <div class="currency-category-title">Battle</div>
-                                        {% for display_name, value in char.categorized_currencies.categories.Battle %}
-                                        <div class="currency-row">
-                                            <span class="currency-name">{{ display_name }}</span>
-                                            <span class="currency-value">{{ "{:,}".format(value) }}</span>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-                                    {% if char.categorized_currencies.categories.Societies %}
-                                    <div class="currency-category">
-                                        <div class="currency-category-title">Societies</div>
-                                        {% for display_name, value in char.categorized_currencies.categories.Societies %}
-                                        <div class="currency-row">
-                                            <span class="currency-name">{{ display_name }}</span>
-                                            <span class="currency-value">{{ "{:,}".format(value) }}</span>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-                                    {% if char.categorized_currencies.categories.Other %}
-                                    <div class="currency-category">
-                                        <div class="currency-category-title">Other</div>
-                                        {% for display_name, value in char.categorized_currencies.categories.Other %}
-                                        <div class="currency-row">
-                                            <span class="currency-name">{{ display_name }}</span>
-                                            <span class="currency-value">{{ "{:,}".format(value) }}</span>
-                                        </div>
-                                        {% endfor %}
-                                    </div>
-                                    {% endif %}
-                                </div>
-                                {% endif %}
-                            </div>
-                        </div>
-                        {% endif %}
-                    </div>
-                </div>
-                {% endfor %}
+            {% set paginated = card_page_size and account.characters|length > card_page_size %}
+            <div class="character-grid" data-account-index="{{ loop.index0 }}" data-paginated="{{ 'true' if paginated else 'false' }}" data-total="{{ account.characters|length }}" data-loaded="{{ card_page_size if paginated else account.characters|length }}">
+                {{ render_character_cards(account.characters[:card_page_size] if paginated else account.characters) }}
             </div>
+            {% if paginated %}<div class="card-sentinel"></div>{% endif %}
             {% endif %}
             </div>
         </div>
         {% endfor %}
         
         <div class="footer">
-            Please wait for page to load, may take longer if importing hundreds of characters, disable classes and/or currencies to generate faster.<br>
+            Please wait for page to load, may take longer if importing hundreds of characters.<br>
             AutoRetainer Dashboard {{ version }} | Data sourced from AutoRetainer, Lifestream, & XA Database<br>
             <a href="https://github.com/xa-io/ffxiv-tools/tree/main/AutoRetainer-Dashboard" target="_blank" style="color: var(--accent); text-decoration: none;">github.com/xa-io/ffxiv-tools</a>
         </div>
@@ -4239,6 +5394,12 @@ HTML_TEMPLATE = '''
     
     <script>
         const REFRESH_INTERVAL = {{ auto_refresh }} * 1000;
+        const LIVE_UPDATES = {{ 'true' if live_updates else 'false' }};
+        // Model version this page was rendered from; refreshes ask /api/data for changes since it
+        let modelVersion = {{ model_version }};
+        let modelEpoch = "{{ model_epoch }}";
+        // Hash of the character data (ignoring countdown text); only a change here needs a data refresh
+        let contentHash = "{{ content_hash }}";
         const DEFAULT_THEME = '{{ default_theme }}';
         
         // Theme switching functionality
@@ -4279,26 +5440,23 @@ HTML_TEMPLATE = '''
         }
         
         // Character search functionality
+        const SEARCH_DEBOUNCE_MS = 250;  // Paginated accounts are searched by the server once typing pauses
         let currentSearchTerm = '';
+        let searchGeneration = 0;
+        let searchTimer = null;
         
         function searchCharacters(searchTerm) {
             currentSearchTerm = searchTerm.toLowerCase().trim();
-            const searchError = document.getElementById('search-error');
+            const generation = ++searchGeneration;
+            const sections = Array.from(document.querySelectorAll('.account-section'))
+                .filter(accountSection => accountSection.querySelector('.character-grid'));
+            const serverSections = sections.filter(accountSection => isPaginated(accountSection.querySelector('.character-grid')));
             let totalMatches = 0;
             
-            // Process all account sections
-            document.querySelectorAll('.account-section').forEach(accountSection => {
-                const accountHeader = accountSection.querySelector('.account-header');
-                const sortBar = accountSection.querySelector('.sort-bar');
-                const accountContent = accountSection.querySelector('.account-content');
-                const grid = accountSection.querySelector('.character-grid');
-                
-                if (!grid) return;
-                
-                const cards = grid.querySelectorAll('.character-card');
+            // Accounts with every card rendered are filtered right away, on each keystroke
+            sections.filter(accountSection => !serverSections.includes(accountSection)).forEach(accountSection => {
                 let accountMatches = 0;
-                
-                cards.forEach(card => {
+                accountSection.querySelectorAll('.character-card').forEach(card => {
                     const charName = card.querySelector('.character-name');
                     if (!charName) return;
                     
@@ -4307,52 +5465,110 @@ HTML_TEMPLATE = '''
                     
                     if (currentSearchTerm === '' || nameText.includes(currentSearchTerm)) {
                         card.classList.remove('search-hidden');
-                        if (currentSearchTerm !== '') {
-                            accountMatches++;
-                            totalMatches++;
-                        }
+                        if (currentSearchTerm !== '') accountMatches++;
                     } else {
                         card.classList.add('search-hidden');
                     }
                 });
-                
-                // If searching and this account has matches, expand it
-                if (currentSearchTerm !== '' && accountMatches > 0) {
-                    accountHeader.classList.remove('collapsed');
-                    if (sortBar) sortBar.classList.remove('collapsed');
-                    if (accountContent) accountContent.classList.remove('collapsed');
-                }
-                
-                // If searching and no matches in this account, collapse it
-                if (currentSearchTerm !== '' && accountMatches === 0) {
-                    accountHeader.classList.add('collapsed');
-                    if (sortBar) sortBar.classList.add('collapsed');
-                    if (accountContent) accountContent.classList.add('collapsed');
-                }
-                
-                // If search cleared, restore original collapse state
-                if (currentSearchTerm === '') {
-                    const collapsedAccounts = JSON.parse(localStorage.getItem('collapsedAccounts') || '{}');
-                    const accountName = accountSection.dataset.account;
-                    const shouldBeCollapsed = collapsedAccounts[accountName] !== false;
-                    accountHeader.classList.toggle('collapsed', shouldBeCollapsed);
-                    if (sortBar) sortBar.classList.toggle('collapsed', shouldBeCollapsed);
-                    if (accountContent) accountContent.classList.toggle('collapsed', shouldBeCollapsed);
-                }
+                applyAccountSearch(accountSection, accountMatches);
+                totalMatches += accountMatches;
             });
             
-            // Show/hide error message
-            if (currentSearchTerm !== '' && totalMatches === 0) {
-                searchError.classList.add('visible');
-            } else {
-                searchError.classList.remove('visible');
+            clearTimeout(searchTimer);
+            if (serverSections.length === 0) {
+                showSearchError(totalMatches);
+                return;
+            }
+            
+            // Paginated accounts: one server query (all accounts at once) after the last keystroke
+            searchTimer = setTimeout(async () => {
+                const serverMatches = await Promise.all(
+                    serverSections.map(accountSection => loadCardPage(accountSection.querySelector('.character-grid'), true))
+                );
+                // Typing went on while the server answered
+                if (generation !== searchGeneration) return;
+                serverSections.forEach((accountSection, i) => {
+                    const accountMatches = currentSearchTerm !== '' ? serverMatches[i] : 0;
+                    applyAccountSearch(accountSection, accountMatches);
+                    totalMatches += accountMatches;
+                });
+                showSearchError(totalMatches);
+            }, SEARCH_DEBOUNCE_MS);
+        }
+        
+        // Expand accounts with matches and collapse the rest; a cleared search restores the saved state
+        function applyAccountSearch(accountSection, accountMatches) {
+            const accountHeader = accountSection.querySelector('.account-header');
+            const sortBar = accountSection.querySelector('.sort-bar');
+            const accountContent = accountSection.querySelector('.account-content');
+            let collapsed = accountMatches === 0;
+            if (currentSearchTerm === '') {
+                const collapsedAccounts = JSON.parse(localStorage.getItem('collapsedAccounts') || '{}');
+                collapsed = collapsedAccounts[accountSection.dataset.account] !== false;
             }
+            accountHeader.classList.toggle('collapsed', collapsed);
+            if (sortBar) sortBar.classList.toggle('collapsed', collapsed);
+            if (accountContent) accountContent.classList.toggle('collapsed', collapsed);
+        }
+        
+        function showSearchError(totalMatches) {
+            const searchError = document.getElementById('search-error');
+            searchError.classList.toggle('visible', currentSearchTerm !== '' && totalMatches === 0);
         }
         
         function toggleCollapse(element) {
             element.classList.toggle('collapsed');
             const content = element.nextElementSibling;
             content.classList.toggle('collapsed');
+            if (!content.classList.contains('collapsed')) {
+                loadLazySection(content);
+            }
+        }
+        
+        // Jobs/currencies sections are fetched on first expand, once per character and section type
+        const lazySectionCache = new Map();  // "<cid>/<jobs|currencies>" -> Promise<html>
+        
+        function fetchLazySection(cid, kind) {
+            const key = `${cid}/${kind}`;
+            if (!lazySectionCache.has(key)) {
+                const request = fetch(`/api/character/${encodeURIComponent(cid)}/${kind}`).then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.text();
+                });
+                request.catch(() => lazySectionCache.delete(key));
+                lazySectionCache.set(key, request);
+            }
+            return lazySectionCache.get(key);
+        }
+        
+        async function loadLazySection(content) {
+            if (!content || !content.dataset.lazy || content.dataset.loaded) return;
+            content.dataset.loaded = 'loading';
+            try {
+                const html = await fetchLazySection(content.dataset.cid, content.dataset.lazy);
+                const template = document.createElement('template');
+                template.innerHTML = html;
+                // The jobs response holds both the DoW/DoM and DoH/DoL grids
+                const section = content.dataset.lazySection;
+                const node = section ? template.content.querySelector(`[data-section="${section}"]`) : template.content;
+                content.replaceChildren(...(node ? [node] : []));
+                content.dataset.loaded = 'true';
+            } catch (error) {
+                delete content.dataset.loaded;
+                console.error('Failed to load section:', error);
+            }
+        }
+        
+        // Drop a changed character's cached sections; open ones are fetched again
+        function invalidateLazySections(cid) {
+            lazySectionCache.delete(`${cid}/jobs`);
+            lazySectionCache.delete(`${cid}/currencies`);
+            document.querySelectorAll(`[data-lazy][data-cid="${cid}"]`).forEach(content => {
+                delete content.dataset.loaded;
+                if (!content.classList.contains('collapsed')) {
+                    loadLazySection(content);
+                }
+            });
         }
         
         function toggleAccount(header) {
@@ -4430,6 +5646,91 @@ HTML_TEMPLATE = '''
             localStorage.setItem('collapsedChars', JSON.stringify(collapsedChars));
         }
         
+        // Accounts with more than CARD_PAGE_SIZE characters render their first page inline and
+        // fetch the rest while scrolling; sorting, filtering and search are then done by the server
+        const CARD_PAGE_SIZE = {{ card_page_size }};
+        let cardRequestCounter = 0;
+        
+        function isPaginated(grid) {
+            return grid.dataset.paginated === 'true';
+        }
+        
+        // Sort/filter/search state of an account as /api/account/<index>/cards parameters
+        function cardQuery(grid) {
+            const section = grid.closest('.account-section');
+            const params = new URLSearchParams();
+            const sortBtn = section.querySelector('.sort-btn.active');
+            if (sortBtn) {
+                params.set('sort', sortBtn.dataset.sort);
+                params.set('order', sortBtn.dataset.order);
+            }
+            const filters = Object.keys(globalFilters).filter(name => globalFilters[name]);
+            // The per-account MSQ button hides only characters at 0%
+            section.querySelectorAll('.sort-bar .filter-btn.active').forEach(btn => {
+                filters.push(btn.dataset.filter === 'msq' ? 'msq-started' : btn.dataset.filter);
+            });
+            if (filters.length > 0) params.set('filters', filters.join(','));
+            if (activeRegion) params.set('region', activeRegion);
+            if (currentSearchTerm) params.set('q', currentSearchTerm);
+            return params;
+        }
+        
+        // Append the next page of cards (or start over with reset); resolves to the number of matching cards
+        async function loadCardPage(grid, reset = false) {
+            if (!reset && (grid.dataset.loading || Number(grid.dataset.loaded) >= Number(grid.dataset.total))) {
+                return Number(grid.dataset.total);
+            }
+            const token = String(++cardRequestCounter);
+            grid.dataset.loading = token;
+            const offset = reset ? 0 : Number(grid.dataset.loaded);
+            const params = cardQuery(grid);
+            params.set('offset', offset);
+            params.set('limit', CARD_PAGE_SIZE);
+            try {
+                const response = await fetch(`/api/account/${grid.dataset.accountIndex}/cards?${params}`);
+                if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                const page = await response.json();
+                // A newer query for this account replaced this one
+                if (grid.dataset.loading !== token) return page.total;
+                
+                const template = document.createElement('template');
+                template.innerHTML = page.html;
+                const cards = Array.from(template.content.querySelectorAll('.character-card'));
+                restoreCharacterCollapse(cards);
+                if (reset) {
+                    grid.replaceChildren(...cards);
+                } else {
+                    grid.append(...cards);
+                }
+                grid.dataset.loaded = offset + page.count;
+                grid.dataset.total = page.total;
+                
+                collectTimerCells();
+                updateCountdowns();
+                if (isAnonymized) anonymizeAll();
+                if (isMoneyHidden) hideMoneyAll();
+                
+                // Observe again so a sentinel that is still on screen loads the next page
+                const sentinel = grid.nextElementSibling;
+                if (cardPageObserver && sentinel && sentinel.classList.contains('card-sentinel')) {
+                    cardPageObserver.unobserve(sentinel);
+                    cardPageObserver.observe(sentinel);
+                }
+                return page.total;
+            } catch (error) {
+                console.error('Failed to load characters:', error);
+                return Number(grid.dataset.total);
+            } finally {
+                if (grid.dataset.loading === token) delete grid.dataset.loading;
+            }
+        }
+        
+        const cardPageObserver = window.IntersectionObserver ? new IntersectionObserver(entries => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) loadCardPage(entry.target.previousElementSibling);
+            });
+        }, { rootMargin: '800px 0px' }) : null;
+        
         function sortCharacters(btn) {
             const sortBar = btn.closest('.sort-bar');
             const accountSection = btn.closest('.account-section');
@@ -4453,6 +5754,11 @@ HTML_TEMPLATE = '''
             sortBar.querySelectorAll('.sort-btn').forEach(b => b.classList.remove('active'));
             btn.classList.add('active');
             
+            if (isPaginated(grid)) {
+                loadCardPage(grid, true);
+                return;
+            }
+            
             // Map sort keys to data attributes
             const attrMap = {
                 'level': 'level',
@@ -4519,6 +5825,11 @@ HTML_TEMPLATE = '''
             // Toggle active state
             btn.classList.toggle('active');
             
+            if (isPaginated(grid)) {
+                loadCardPage(grid, true);
+                return;
+            }
+            
             // Get all filter states
             const retainersBtn = sortBar.querySelector('.filter-btn[data-filter="retainers"]');
             const subsBtn = sortBar.querySelector('.filter-btn[data-filter="subs"]');
@@ -5183,6 +6494,7 @@ HTML_TEMPLATE = '''
                         const content = header.nextElementSibling;
                         if (content) {
                             content.classList.remove('collapsed');
+                            loadLazySection(content);
                         }
                     } else {
                         // Inactive = hide (collapse)
@@ -5217,6 +6529,7 @@ HTML_TEMPLATE = '''
                         const content = header.nextElementSibling;
                         if (content) {
                             content.classList.remove('collapsed');
+                            loadLazySection(content);
                         }
                     } else {
                         // Inactive = hide (collapse)
@@ -5277,6 +6590,10 @@ HTML_TEMPLATE = '''
             document.querySelectorAll('.account-section').forEach(section => {
                 const grid = section.querySelector('.character-grid');
                 if (!grid) return;
+                if (isPaginated(grid)) {
+                    loadCardPage(grid, true);
+                    return;
+                }
                 const cards = grid.querySelectorAll('.character-card');
                 
                 cards.forEach(card => {
@@ -5402,9 +6719,13 @@ HTML_TEMPLATE = '''
                 accountsBtn.title = allAccountsExpanded ? 'Collapse All Accounts' : 'Expand All Accounts';
             }
             
-            // Restore character card collapsed states (default to collapsed)
+            restoreCharacterCollapse(document.querySelectorAll('.character-card'));
+        }
+        
+        // Restore character card collapsed states (default to collapsed)
+        function restoreCharacterCollapse(cards) {
             const collapsedChars = JSON.parse(localStorage.getItem('collapsedChars') || '{}');
-            document.querySelectorAll('.character-card').forEach(card => {
+            cards.forEach(card => {
                 const charId = card.dataset.char;
                 const header = card.querySelector('.character-header');
                 const body = card.querySelector('.character-body');
@@ -5424,21 +6745,151 @@ HTML_TEMPLATE = '''
             });
         }
         
-        async function refreshData() {
-            try {
-                const response = await fetch('/api/data');
-                const data = await response.json();
-                
-                // Update timestamp always
-                document.getElementById('last-updated').textContent = data.last_updated;
-                
-                // Only update summary cards and account stats if money is NOT hidden
-                if (!isMoneyHidden) {
-                    document.getElementById('sum-total-gil').textContent = formatNumber(data.summary.total_gil);
-                    document.getElementById('sum-treasure').textContent = formatNumber(data.summary.total_treasure);
-                    document.getElementById('sum-with-treasure').textContent = formatNumber(data.summary.total_with_treasure);
-                    document.getElementById('sum-ready-subs').textContent = data.summary.ready_subs;
-                    document.getElementById('sum-total-subs').textContent = data.summary.enabled_subs;
+        // Same output as format_time_remaining() on the server
+        function formatTimeRemaining(endsAt) {
+            const seconds = endsAt - Date.now() / 1000;
+            if (seconds <= 0) return 'Ready!';
+            let hours = Math.floor(seconds / 3600);
+            const minutes = Math.floor((seconds % 3600) / 60);
+            if (hours > 24) {
+                const days = Math.floor(hours / 24);
+                hours = hours % 24;
+                return `${days}d ${hours}h ${minutes}m`;
+            } else if (hours > 0) {
+                return `${hours}h ${minutes}m`;
+            }
+            return `${minutes}m`;
+        }
+        
+        // Countdown cells by timer ID ("<cid>:s:<sub name>" / "<cid>:r:<retainer name>")
+        const timerCells = new Map();
+        
+        function collectTimerCells() {
+            timerCells.clear();
+            document.querySelectorAll('[data-timer]').forEach(cell => timerCells.set(cell.dataset.timer, cell));
+        }
+        
+        function renderCountdown(cell) {
+            const endsAt = Number(cell.dataset.ends);
+            const text = endsAt ? formatTimeRemaining(endsAt) : cell.dataset.idleText;
+            if (cell.textContent.trim() !== text) {
+                cell.textContent = text;
+            }
+            const stateClass = text === 'Ready!' ? 'status-ready' : (endsAt ? 'status-voyaging' : cell.dataset.idleClass);
+            ['status-ready', 'status-voyaging', 'status-none'].forEach(cls => cell.classList.toggle(cls, cls === stateClass));
+        }
+        
+        function updateCountdowns() {
+            timerCells.forEach(renderCountdown);
+        }
+        
+        function setTimerEnds(id, endsAt, idleClass) {
+            const cell = timerCells.get(id);
+            if (cell) {
+                cell.dataset.ends = endsAt || 0;
+                if (idleClass) cell.dataset.idleClass = idleClass;
+                renderCountdown(cell);
+            }
+        }
+        
+        // Apply /api/timers epochs to every countdown cell (cells missing from the map are idle)
+        function applyTimers(timers) {
+            timerCells.forEach((cell, id) => {
+                cell.dataset.ends = timers[id] || 0;
+                renderCountdown(cell);
+            });
+        }
+        
+        function patchCharacterCard(char) {
+            const card = document.querySelector(`[data-char="${char.cid}"]`);
+            if (card) {
+                if (char.has_max_mb_retainer) {
+                    card.classList.add('has-max-mb');
+                } else {
+                    card.classList.remove('has-max-mb');
+                }
+            }
+            invalidateLazySections(char.cid);
+            (char.submarines || []).forEach(sub => setTimerEnds(`${char.cid}:s:${sub.name}`, sub.return_time));
+            (char.retainers || []).forEach(ret => setTimerEnds(`${char.cid}:r:${ret.name}`,
+                ret.has_venture ? ret.venture_ends : 0, ret.has_venture ? 'status-voyaging' : 'status-none'));
+        }
+        
+        // Polling mode: fetch the small timers payload and only refresh data when the content changed
+        async function checkTimers() {
+            try {
+                const response = await fetch('/api/timers');
+                const data = await response.json();
+                applyTimers(data.timers);
+                if (data.content_hash !== contentHash || data.model_epoch !== modelEpoch) {
+                    scheduleRefresh();
+                }
+            } catch (error) {
+                console.error('Failed to check timers:', error);
+            }
+        }
+        
+        let refreshInFlight = null;
+        let refreshQueued = false;
+        
+        // Run refreshData one at a time; a request made while one is running is folded into a single follow-up
+        function scheduleRefresh() {
+            if (refreshInFlight) {
+                refreshQueued = true;
+                return;
+            }
+            refreshInFlight = refreshData().finally(() => {
+                refreshInFlight = null;
+                if (refreshQueued) {
+                    refreshQueued = false;
+                    scheduleRefresh();
+                }
+            });
+        }
+        
+        // Fetch changes only when the server announces a new model version
+        function startLiveUpdates() {
+            const source = new EventSource(`/api/events?since=${modelVersion}&epoch=${encodeURIComponent(modelEpoch)}`);
+            source.addEventListener('model', event => {
+                const info = JSON.parse(event.data);
+                if (info.content_hash !== contentHash || info.model_epoch !== modelEpoch) {
+                    scheduleRefresh();
+                } else if (!refreshInFlight) {
+                    // Only the clock moved: countdowns already run locally
+                    modelVersion = info.model_version;
+                    document.getElementById('last-updated').textContent = info.last_updated;
+                }
+            });
+            // Closed for good (the server answered 503: every event stream slot is taken):
+            // fall back to timed checks of /api/timers
+            source.onerror = () => {
+                if (source.readyState === EventSource.CLOSED) {
+                    setInterval(checkTimers, REFRESH_INTERVAL > 0 ? REFRESH_INTERVAL : 60000);
+                }
+            };
+        }
+        
+        async function refreshData() {
+            try {
+                const response = await fetch(`/api/data?since=${modelVersion}&epoch=${encodeURIComponent(modelEpoch)}`);
+                const data = await response.json();
+                
+                // Character cards are rendered server-side: added/removed characters need a page load
+                if (!data.full && (data.added.length > 0 || data.removed.length > 0)) {
+                    location.reload();
+                    return;
+                }
+                
+                // Update timestamp always
+                document.getElementById('last-updated').textContent = data.last_updated;
+                
+                // Only update summary cards and account stats if money is NOT hidden
+                if (!isMoneyHidden) {
+                    document.getElementById('sum-total-gil').textContent = formatNumber(data.summary.total_gil);
+                    document.getElementById('sum-treasure').textContent = formatNumber(data.summary.total_treasure);
+                    document.getElementById('sum-with-treasure').textContent = formatNumber(data.summary.total_with_treasure);
+                    document.getElementById('sum-ready-subs').textContent = data.summary.ready_subs;
+                    document.getElementById('sum-total-subs').textContent = data.summary.enabled_subs;
                     document.getElementById('sum-ready-retainers').textContent = data.summary.ready_retainers;
                     document.getElementById('sum-total-retainers').textContent = data.summary.enabled_retainers;
                     document.getElementById('sum-total-mb').textContent = data.summary.total_mb_items;
@@ -5478,19 +6929,16 @@ HTML_TEMPLATE = '''
                         }
                     });
                     
-                    // Update character card has-max-mb class
-                    data.accounts.forEach(account => {
-                        account.characters.forEach(char => {
-                            const card = document.querySelector(`[data-char="${char.cid}"]`);
-                            if (card) {
-                                if (char.has_max_mb_retainer) {
-                                    card.classList.add('has-max-mb');
-                                } else {
-                                    card.classList.remove('has-max-mb');
-                                }
-                            }
-                        });
-                    });
+                    // Update character card has-max-mb class (only cards that changed, unless this is a full payload)
+                    if (data.full) {
+                        data.accounts.forEach(account => account.characters.forEach(patchCharacterCard));
+                    } else {
+                        data.changed.forEach(patchCharacterCard);
+                    }
+                    // Only move forward once changes are applied (while money is hidden, deltas keep accumulating)
+                    modelVersion = data.model_version;
+                    modelEpoch = data.model_epoch;
+                    contentHash = data.content_hash;
                 }
                 
                 // Re-apply anonymize if active
@@ -5527,9 +6975,21 @@ HTML_TEMPLATE = '''
             updateStickyPositions();
             window.addEventListener('resize', updateStickyPositions);
             
-            // Start auto-refresh if enabled
-            if (REFRESH_INTERVAL > 0) {
-                setInterval(refreshData, REFRESH_INTERVAL);
+            // Load further character pages of large accounts while scrolling
+            if (cardPageObserver) {
+                document.querySelectorAll('.card-sentinel').forEach(sentinel => cardPageObserver.observe(sentinel));
+            }
+            
+            // Countdowns run in the browser from the return/venture epochs
+            collectTimerCells();
+            updateCountdowns();
+            setInterval(updateCountdowns, 1000);
+            
+            // Start live updates, or fall back to timed checks of /api/timers
+            if (LIVE_UPDATES && window.EventSource) {
+                startLiveUpdates();
+            } else if (REFRESH_INTERVAL > 0) {
+                setInterval(checkTimers, REFRESH_INTERVAL);
             }
         });
     </script>
@@ -5538,6 +6998,407 @@ HTML_TEMPLATE = '''
 '''
 
 
+# ===============================================
+# Character Section Templates
+# ===============================================
+# Character cards of the main page: rendered inline for the first page of each account and
+# by /api/account/<index>/cards for the rest
+CHARACTER_CARDS_TEMPLATE = '''
+{% for char in characters %}
+<div class="character-card{% if char.has_max_mb_retainer %} has-max-mb{% endif %}{% if char.has_idle_retainer and not char.retainers_sleeping %} has-idle-retainer{% endif %}{% if char.has_idle_sub and not char.subs_sleeping %} has-idle-sub{% endif %}{% if char.has_potential_retainer %} has-potential-retainer{% endif %}{% if char.has_potential_subs %} has-potential-subs{% endif %}" data-char="{{ char.cid }}" data-level="{{ char.current_level }}" data-lowest-level="{{ char.lowest_level }}" data-highest-level="{{ char.highest_level }}" data-gil="{{ char.total_gil }}" data-treasure="{{ char.treasure_value }}" data-fc-points="{{ char.fc_points }}" data-venture-coins="{{ char.venture_coins }}" data-coffers="{{ char.coffer_count }}" data-dyes="{{ char.dye_count }}" data-tanks="{{ char.ceruleum }}" data-kits="{{ char.repair_kits }}" data-restock="{{ char.days_until_restock if char.days_until_restock is not none else 9999 }}" data-retainers="{{ char.ready_retainers }}" data-total-retainers="{{ char.total_retainers }}" data-subs="{{ char.ready_subs }}" data-total-subs="{{ char.total_subs }}" data-inventory="{{ 140 - char.inventory_space }}" data-has-personal-house="{{ 'true' if char.private_house else 'false' }}" data-has-fc-house="{{ 'true' if char.fc_house else 'false' }}" data-has-fc-gil="{{ 'true' if char.fc_gil > 0 else 'false' }}" data-retainer-level="{{ char.max_retainer_level }}" data-sub-level="{{ char.min_sub_level }}" data-retainer-return="{{ char.min_retainer_return }}" data-sub-return="{{ char.min_sub_return }}" data-msq-percent="{{ char.msq_percent }}" data-has-max-mb="{{ 'true' if char.has_max_mb_retainer else 'false' }}" data-mb="{{ char.mb_items }}" data-has-mb="{{ 'true' if char.mb_items > 0 else 'false' }}" data-has-coffers="{{ 'true' if char.coffer_count > 0 else 'false' }}" data-has-dyes="{{ 'true' if char.dye_count > 0 else 'false' }}" data-has-treasure="{{ 'true' if char.treasure_value > 0 else 'false' }}" data-region="{{ char.region }}" data-has-ready="{{ 'true' if (char.ready_retainers > 0 and not char.exclude_retainer and not char.retainers_sleeping) or (char.ready_subs > 0 and not char.exclude_workshop and not char.subs_sleeping) else 'false' }}" data-has-exclusion="{{ 'true' if char.exclude_retainer or char.exclude_workshop else 'false' }}" data-is-processing="{{ 'true' if char.is_processing else 'false' }}" data-has-sleeping="{{ 'true' if (char.retainers_sleeping and char.total_retainers > 0 and not char.exclude_retainer) or (char.subs_sleeping and char.total_subs > 0 and not char.exclude_workshop) else 'false' }}" data-has-idle="{{ 'true' if (char.has_idle_retainer and not char.retainers_sleeping) or (char.has_idle_sub and not char.subs_sleeping) else 'false' }}" data-has-potential-subs="{{ 'true' if char.has_potential_subs or char.has_potential_retainer else 'false' }}">
+    <div class="character-header collapsed {% if (char.ready_retainers > 0 and not char.exclude_retainer and not char.retainers_sleeping) or (char.ready_subs > 0 and not char.exclude_workshop and not char.subs_sleeping) %}has-available{% endif %}" onclick="toggleCharacter(this)">
+        <div class="char-header-row name-row">
+            <span class="character-name">{{ char.name }}{% if char.current_level > 0 %} <span style="font-size: 0.8em; color: var(--text-secondary);">(Lv {{ char.current_level }}, {{ char.current_job }})</span>{% endif %}{% if show_msq_progression and char.msq_completed > 0 %} <span style="font-size: 0.8em; {% if char.msq_percent >= 90 %}color: #4ade80;{% elif char.msq_percent >= 50 %}color: #fbbf24;{% else %}color: #94a3b8;{% endif %}" title="MSQ Progress: {{ char.msq_completed }}/{{ char.msq_total }}{% if char.msq_quest_name %} - {{ char.msq_quest_name }}{% endif %}">MSQ: {{ char.msq_percent }}%</span>{% endif %}{% if char.private_house %} <span style="font-size: 0.8em;" title="Personal House: {{ char.private_house }}">🏠</span>{% endif %}{% if char.fc_house %} <span style="font-size: 0.8em;" title="FC House: {{ char.fc_house }}">🏨</span>{% endif %}</span>
+            <span class="char-status {% if char.ready_retainers > 0 and not char.exclude_retainer and not char.retainers_sleeping %}available{% else %}all-sent{% endif %}">👤 {% if char.exclude_retainer %}null{% else %}{{ char.ready_retainers }}/{{ char.total_retainers }}{% endif %}{% if char.sleeping_retainer_count > 0 %} <span style="color: #9370DB;">😴{{ char.sleeping_retainer_count }}</span>{% endif %}</span>
+        </div>
+        <div class="char-header-row">
+            <span class="character-world">{{ char.world }}{% if char.fc_name %} • {{ char.fc_name }}{% endif %} • 🎒 {{ 140 - char.inventory_space }}/140</span>
+            <span class="char-status {% if char.ready_subs > 0 and not char.exclude_workshop and not char.subs_sleeping %}available{% else %}all-sent{% endif %}">🚢 {% if char.exclude_workshop %}null{% else %}{{ char.ready_subs }}/{{ char.total_subs }}{% endif %}{% if char.sleeping_sub_count > 0 %} <span style="color: #9370DB;">😴{{ char.sleeping_sub_count }}</span>{% endif %}</span>
+        </div>
+        <div class="char-header-row">
+            <span style="font-size: 0.8em; color: var(--text-secondary);">🪧 {{ char.mb_items }} | 📦 {{ char.coffer_count }} | 🎨 {{ char.dye_count }}{% if char.dye_count > 0 %} 🤍{{ char.dye_pure_white }} 🖤{{ char.dye_jet_black }} 🩷{{ char.dye_pastel_pink }}{% endif %}</span>
+            <span class="character-gil">{{ "{:,}".format(char.total_gil) }} gil</span>
+        </div>
+        <div class="char-header-row">
+            <span style="font-size: 0.8em; color: var(--text-secondary);">🪙 {{ "{:,}".format(char.fc_points) }} | 🛒 {{ "{:,}".format(char.venture_coins) }} | ⛽ {{ "{:,}".format(char.ceruleum) }} | 🔧 {{ "{:,}".format(char.repair_kits) }}{% if char.total_subs > 0 %} | <span style="{% if char.days_until_restock is not none and char.days_until_restock < 7 %}color: var(--danger);{% elif char.days_until_restock is not none and char.days_until_restock < 14 %}color: var(--warning);{% endif %}">♻️ {% if char.days_until_restock is not none %}{{ char.days_until_restock }}d{% else %}N/A{% endif %}</span>{% endif %}</span>
+            {% if char.total_subs > 0 %}<span style="font-size: 0.8em; color: var(--gold);">💎 {{ "{:,}".format(char.treasure_value) }}</span>{% endif %}
+        </div>
+    </div>
+    <div class="character-body collapsed">
+        {% if highlight_idle_retainers and char.has_idle_retainer and not char.retainers_sleeping %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: cyan; padding: 5px 15px; background: rgba(0, 255, 255, 0.1);">* You have idle retainers, update your planner in game</div>
+        {% endif %}
+        {% if highlight_idle_subs and char.has_idle_sub and not char.subs_sleeping %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: #FFB6C1; padding: 5px 15px; background: rgba(255, 182, 193, 0.1);">* You have idle subs, update your planner in game</div>
+        {% endif %}
+        {% if highlight_max_mb and char.has_max_mb_retainer %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: #FFD700; padding: 5px 15px; background: rgba(255, 215, 0, 0.1);">* You have max marketboard items, go undercut or remove!</div>
+        {% endif %}
+        {% if highlight_potential_retainer and char.has_potential_retainer %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: #8B4513; padding: 5px 15px; background: rgba(139, 69, 19, 0.1);">* You should hire retainers, you have progressed far enough in MSQ</div>
+        {% endif %}
+        {% if highlight_potential_subs and char.has_potential_subs %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: #888; padding: 5px 15px; background: rgba(26, 26, 26, 0.3);">* You're lv 25+ and not in an FC, get to farming!<br>You may also just not have Lifestream registered, get on it!</div>
+        {% endif %}
+        {% if char.retainers_sleeping and char.total_retainers > 0 %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: #9370DB; padding: 5px 15px; background: rgba(147, 112, 219, 0.1);">* Your retainers are not enabled in AutoRetainer</div>
+        {% endif %}
+        {% if char.subs_sleeping and char.total_subs > 0 %}
+        <div class="highlight-reason" style="font-size: 0.75em; color: #9370DB; padding: 5px 15px; background: rgba(147, 112, 219, 0.1);">* Your submarines are not enabled in AutoRetainer</div>
+        {% endif %}
+        <div class="section-title collapsible collapsed player-stats-header" onclick="toggleCollapse(this)">📊 Player Stats</div>
+        <div class="collapse-content collapsed player-stats-content">
+        <div class="info-row">
+            <span class="info-label">Player</span>
+            <span class="info-value player-name-world">{{ char.name }}@{{ char.world }}</span>
+        </div>
+        {% if char.current_level > 0 %}
+        <div class="info-row">
+            <span class="info-label">Current Class</span>
+            <span class="info-value">{{ char.current_job }} Lv {{ char.current_level }}</span>
+        </div>
+        {% endif %}
+        {% if char.lowest_level > 0 and char.lowest_level < char.current_level %}
+        <div class="info-row">
+            <span class="info-label">Lowest Class</span>
+            <span class="info-value">{{ char.lowest_job }} Lv {{ char.lowest_level }}</span>
+        </div>
+        {% endif %}
+        {% if char.highest_level > 0 and char.highest_level > char.current_level %}
+        <div class="info-row">
+            <span class="info-label">Highest Class</span>
+            <span class="info-value">{{ char.highest_job }} Lv {{ char.highest_level }}</span>
+        </div>
+        {% endif %}
+        <div class="info-row">
+            <span class="info-label">Character Gil</span>
+            <span class="info-value">{{ "{:,}".format(char.gil) }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">Retainer Gil</span>
+            <span class="info-value">{{ "{:,}".format(char.retainer_gil) }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">FC Gil</span>
+            <span class="info-value" style="color: var(--accent-light);">{{ "{:,}".format(char.fc_gil) }}</span>
+        </div>
+        {% if char.treasure_value > 0 %}
+        <div class="info-row">
+            <span class="info-label">Treasure Value</span>
+            <span class="info-value" style="color: var(--gold);">{{ "{:,}".format(char.treasure_value) }}</span>
+        </div>
+        {% endif %}
+        {% if char.coffer_dye_value > 0 %}
+        <div class="info-row">
+            <span class="info-label">Coffer + Dye Value</span>
+            <span class="info-value" style="color: var(--accent-light);">{{ "{:,}".format(char.coffer_dye_value) }}</span>
+        </div>
+        {% endif %}
+        <div class="info-row">
+            <span class="info-label">FC Points 🪙</span>
+            <span class="info-value">{{ "{:,}".format(char.fc_points) }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">Venture Coins 🛒</span>
+            <span class="info-value">{{ char.venture_coins }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">Coffers 📦</span>
+            <span class="info-value">{{ char.coffer_count }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">Inventory 🎒</span>
+            <span class="info-value" style="{% if (140 - char.inventory_space) >= 130 %}color: var(--accent);{% elif (140 - char.inventory_space) >= 100 %}color: var(--warning);{% endif %}">{{ 140 - char.inventory_space }}/140</span>
+        </div>
+        {% if show_msq_progression and char.msq_completed > 0 %}
+        <div class="info-row">
+            <span class="info-label">MSQ Progress 📜</span>
+            <span class="info-value" style="{% if char.msq_percent >= 90 %}color: #4ade80;{% elif char.msq_percent >= 50 %}color: #fbbf24;{% else %}color: #94a3b8;{% endif %}">{{ char.msq_percent }}% ({{ char.msq_completed }}/{{ char.msq_total }}){% if char.msq_quest_name %} - {{ char.msq_quest_name }}{% endif %}</span>
+        </div>
+        {% endif %}
+        {% if char.private_house %}
+        <div class="info-row">
+            <span class="info-label">Personal House 🏠</span>
+            <span class="info-value">{{ char.private_house }}</span>
+        </div>
+        {% endif %}
+        {% if char.fc_house %}
+        <div class="info-row">
+            <span class="info-label">FC House 🏨</span>
+            <span class="info-value">{{ char.fc_house }}</span>
+        </div>
+        {% endif %}
+        <div class="info-row">
+            <span class="info-label">Ceruleum Tanks ⛽</span>
+            <span class="info-value">{{ "{:,}".format(char.ceruleum) }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">Repair Kits 🔧</span>
+            <span class="info-value">{{ "{:,}".format(char.repair_kits) }}</span>
+        </div>
+        {% if char.total_subs > 0 %}
+        <div class="info-row">
+            <span class="info-label">Days Until Restock ♻️</span>
+            <span class="info-value" style="{% if char.days_until_restock is not none and char.days_until_restock < 7 %}color: var(--danger);{% elif char.days_until_restock is not none and char.days_until_restock < 14 %}color: var(--warning);{% else %}color: var(--success);{% endif %}">{% if char.days_until_restock is not none %}{{ char.days_until_restock }} days{% else %}N/A{% endif %}</span>
+        </div>
+        {% endif %}
+        <div class="info-row">
+            <span class="info-label">Daily Income</span>
+            <span class="info-value success">+{{ "{:,}".format(char.daily_income|int) }}</span>
+        </div>
+        <div class="info-row">
+            <span class="info-label">Daily Cost</span>
+            <span class="info-value warning">-{{ "{:,}".format(char.daily_cost|int) }}</span>
+        </div>
+        </div>
+        
+        {% if char.submarines %}
+        <div class="section-title collapsible" onclick="toggleCollapse(this)">🚢 Submarines ({{ char.submarines|length }}) - <span style="color: var(--warning);">Lvl: {{ char.subs_leveling }}</span> | <span style="color: var(--success);">Farm: {{ char.subs_farming }}</span></div>
+        <div class="collapse-content">
+            <table class="sub-table">
+                <tr>
+                    <th>Name</th>
+                    <th>Lvl</th>
+                    <th>Build</th>
+                    <th>Plan</th>
+                    <th>Status</th>
+                </tr>
+                {% for sub in char.submarines %}
+                <tr>
+                    <td>{{ sub.name }}</td>
+                    <td>{{ sub.level }}</td>
+                    <td>{{ sub.build }}</td>
+                    <td class="{% if not sub.plan_name and not sub.is_farming and not sub.is_leveling %}status-none{% endif %}" style="{% if sub.plan_name == 'Finalize' %}color: #f85149;{% elif sub.plan_name == 'Redeploy' %}color: cyan;{% elif sub.is_farming %}color: var(--success);{% elif sub.is_leveling %}color: var(--warning);{% endif %}">
+                        {% if sub.plan_name %}{{ sub.plan_name }}{% elif sub.is_farming %}Farm{% elif sub.is_leveling %}Lvl{% else %}None{% endif %}
+                    </td>
+                    <td class="{% if sub.return_formatted == 'Ready!' %}status-ready{% else %}status-voyaging{% endif %}" data-timer="{{ char.cid }}:s:{{ sub.name }}" data-ends="{{ sub.return_time or 0 }}" data-idle-text="Docked" data-idle-class="status-voyaging">
+                        {{ sub.return_formatted }}
+                    </td>
+                </tr>
+                {% endfor %}
+            </table>
+        </div>
+        {% endif %}
+        
+        {% if char.retainers %}
+        <div class="section-title collapsible" onclick="toggleCollapse(this)">👤 Retainers ({{ char.retainers|length }}) - <span style="color: var(--warning);">Lvl: {{ char.retainers_leveling }}</span> | <span style="color: var(--success);">Farm: {{ char.retainers_farming }}</span></div>
+        <div class="collapse-content">
+            <table class="ret-table">
+                <tr>
+                    <th>Name</th>
+                    <th>Lvl</th>
+                    <th>Gil</th>
+                    <th>MB</th>
+                    <th>Venture</th>
+                </tr>
+                {% for ret in char.retainers %}
+                <tr>
+                    <td>{{ ret.name }}</td>
+                    <td>{{ ret.level }}</td>
+                    <td>{{ "{:,}".format(ret.gil) }}</td>
+                    <td>{{ ret.mb_items }}</td>
+                    <td class="{% if ret.venture_formatted == 'Ready!' %}status-ready{% elif not ret.has_venture %}status-none{% else %}status-voyaging{% endif %}" data-timer="{{ char.cid }}:r:{{ ret.name }}" data-ends="{{ ret.venture_ends if ret.has_venture and ret.venture_ends else 0 }}" data-idle-text="None" data-idle-class="{{ 'status-voyaging' if ret.has_venture else 'status-none' }}">
+                        {{ ret.venture_formatted if ret.has_venture else "None" }}
+                    </td>
+                </tr>
+                {% endfor %}
+            </table>
+        </div>
+        {% endif %}
+        
+        {% if show_classes and char.all_jobs %}
+        <div class="section-title collapsible collapsed" onclick="toggleCollapse(this)">⚔️ DoW/DoM</div>
+        <div class="collapse-content collapsed" data-lazy="jobs" data-lazy-section="combat" data-cid="{{ char.cid }}"></div>
+        
+        <div class="section-title collapsible collapsed" onclick="toggleCollapse(this)">🔨 DoH/DoL</div>
+        <div class="collapse-content collapsed" data-lazy="jobs" data-lazy-section="crafting" data-cid="{{ char.cid }}"></div>
+        {% endif %}
+        
+        {% if show_currencies and char.categorized_currencies %}
+        <div class="section-title collapsible collapsed" onclick="toggleCollapse(this)">💰 Currencies</div>
+        <div class="collapse-content collapsed" data-lazy="currencies" data-cid="{{ char.cid }}"></div>
+        {% endif %}
+    </div>
+</div>
+{% endfor %}
+'''
+
+# Per-character sections of the main page, loaded when their card section is first expanded
+# (/api/character/<cid>/jobs and /api/character/<cid>/currencies)
+CHARACTER_JOBS_TEMPLATE = '''
+<div class="job-grid" data-section="combat">
+    <div class="job-column">
+        <div class="job-category-title">🛡️ Tank</div>
+        {% for job in job_categories.Tank %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        {% if job_level == 0 and job in job_base_class %}
+        {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
+        {% endif %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+        <div class="job-category-title" style="margin-top: 10px;">⚔️ Melee DPS</div>
+        {% for job in job_categories.MeleeDPS %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        {% if job_level == 0 and job in job_base_class %}
+        {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
+        {% endif %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+    </div>
+    <div class="job-column">
+        <div class="job-category-title">💚 Healer</div>
+        {% for job in job_categories.Healer %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        {% if job_level == 0 and job in job_base_class %}
+        {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
+        {% endif %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+        <div class="job-category-title" style="margin-top: 10px;">🏹 Physical Ranged DPS</div>
+        {% for job in job_categories.PhysRangedDPS %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        {% if job_level == 0 and job in job_base_class %}
+        {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
+        {% endif %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+        <div class="job-category-title" style="margin-top: 10px;">✨ Magical Ranged DPS</div>
+        {% for job in job_categories.MagicRangedDPS %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        {% if job_level == 0 and job in job_base_class %}
+        {% set job_level = char.all_jobs.get(job_base_class[job], 0) %}
+        {% endif %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+    </div>
+</div>
+<div class="job-grid" data-section="crafting">
+    <div class="job-column">
+        <div class="job-category-title">🔨 Disciples of the Hand</div>
+        {% for job in job_categories.DoH %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+    </div>
+    <div class="job-column">
+        <div class="job-category-title">⛏️ Disciples of the Land</div>
+        {% for job in job_categories.DoL %}
+        {% set job_level = char.all_jobs.get(job, 0) %}
+        <div class="job-row">
+            <span class="job-level {% if job_level == 0 %}job-level-zero{% endif %}">{{ job_level }}</span>
+            <span class="job-name">{{ job_display_names.get(job, job) }}</span>
+        </div>
+        {% endfor %}
+    </div>
+</div>
+'''
+
+CHARACTER_CURRENCIES_TEMPLATE = '''
+<div class="currency-section">
+    {% if char.categorized_currencies.crystal_grid %}
+    <div class="crystal-container">
+    <div class="currency-category-title">💎 Crystals</div>
+    <div class="crystal-grid">
+        <div></div>
+        <div class="crystal-header">Shards</div>
+        <div class="crystal-header">Crystals</div>
+        <div class="crystal-header">Clusters</div>
+        {% for elem in char.categorized_currencies.crystal_elements %}
+        <div class="crystal-element">{{ elem }}</div>
+        <div class="{% if char.categorized_currencies.crystal_grid[elem].Shard > 0 %}crystal-value{% else %}crystal-value-zero{% endif %}">{{ "{:,}".format(char.categorized_currencies.crystal_grid[elem].Shard) }}</div>
+        <div class="{% if char.categorized_currencies.crystal_grid[elem].Crystal > 0 %}crystal-value{% else %}crystal-value-zero{% endif %}">{{ "{:,}".format(char.categorized_currencies.crystal_grid[elem].Crystal) }}</div>
+        <div class="{% if char.categorized_currencies.crystal_grid[elem].Cluster > 0 %}crystal-value{% else %}crystal-value-zero{% endif %}">{{ "{:,}".format(char.categorized_currencies.crystal_grid[elem].Cluster) }}</div>
+        {% endfor %}
+    </div>
+    </div>
+    {% endif %}
+    
+    {% if char.categorized_currencies.categories.Common or char.categorized_currencies.categories.Tomestones %}
+    <div class="currency-row-group">
+        {% if char.categorized_currencies.categories.Common %}
+        <div class="currency-category">
+            <div class="currency-category-title">Common</div>
+            {% for display_name, value in char.categorized_currencies.categories.Common %}
+            <div class="currency-row">
+                <span class="currency-name">{{ display_name }}</span>
+                <span class="currency-value">{{ "{:,}".format(value) }}</span>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+        {% if char.categorized_currencies.categories.Tomestones %}
+        <div class="currency-category">
+            <div class="currency-category-title">Tomestones</div>
+            {% for display_name, value in char.categorized_currencies.categories.Tomestones %}
+            <div class="currency-row">
+                <span class="currency-name">{{ display_name }}</span>
+                <span class="currency-value">{{ "{:,}".format(value) }}</span>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+    </div>
+    {% endif %}
+    
+    {% if char.categorized_currencies.categories.Battle or char.categorized_currencies.categories.Societies or char.categorized_currencies.categories.Other %}
+    <div class="currency-row-group">
+        {% if char.categorized_currencies.categories.Battle %}
+        <div class="currency-category">
+            <div class="currency-category-title">Battle</div>
+            {% for display_name, value in char.categorized_currencies.categories.Battle %}
+            <div class="currency-row">
+                <span class="currency-name">{{ display_name }}</span>
+                <span class="currency-value">{{ "{:,}".format(value) }}</span>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+        {% if char.categorized_currencies.categories.Societies %}
+        <div class="currency-category">
+            <div class="currency-category-title">Societies</div>
+            {% for display_name, value in char.categorized_currencies.categories.Societies %}
+            <div class="currency-row">
+                <span class="currency-name">{{ display_name }}</span>
+                <span class="currency-value">{{ "{:,}".format(value) }}</span>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+        {% if char.categorized_currencies.categories.Other %}
+        <div class="currency-category">
+            <div class="currency-category-title">Other</div>
+            {% for display_name, value in char.categorized_currencies.categories.Other %}
+            <div class="currency-row">
+                <span class="currency-name">{{ display_name }}</span>
+                <span class="currency-value">{{ "{:,}".format(value) }}</span>
+            </div>
+            {% endfor %}
+        </div>
+        {% endif %}
+    </div>
+    {% endif %}
+</div>
+'''
+
+
 # ===============================================
 # Map Page Data Collection
 # ===============================================
@@ -5548,320 +7409,371 @@ MAX_PLOTS_PER_WARD = 60
 DISTRICT_ORDER = ["Goblet", "LB", "Mist", "Empyreum", "Shirogane"]
 
 
-def get_map_data():
+def extract_map_account(sources):
+    """
+    Per-account extraction shared by both get_map_data() phases: each character's FC name,
+    FC key (FC plot, else world + FC name), subs and exclusion flags are worked out once.
+    Returns: {"account": dict, "ar_config": dict, "alto_map": dict, "housing_map": dict, "characters": [...]}
+    """
+    ar_config = sources["ar_config"]
+    fc_data = ar_config["fc_data"]
+    housing_map = sources["housing_map"]
+    characters = []
+    for char in ar_config["characters"]:
+        cid = char.get("CID", 0)
+        world = char.get("World", "Unknown")
+        fc_name = fc_data[cid].get("Name", "") if cid in fc_data else ""
+        has_fc_house = cid in housing_map and housing_map[cid].get('fc') is not None
+        
+        # Build FC key for dedup (same plot = same FC = same earnings)
+        fc_key = None
+        if has_fc_house:
+            fcd = housing_map[cid]['fc']
+            fc_key = f"{world}_{fcd['district']}_W{fcd['ward']}_P{fcd['plot']}"
+        elif fc_name:
+            fc_key = f"{world}_{fc_name}"
+        
+        characters.append({
+            "char": char,
+            "cid": cid,
+            "name": char.get("Name", "Unknown"),
+            "world": world,
+            "fc_name": fc_name,
+            "fc_key": fc_key,
+            "has_subs": bool(char.get("OfflineSubmarineData", [])),
+            "has_fc_house": has_fc_house,
+            # Check AR exclusion settings for this character
+            "is_excluded": char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False,
+        })
+    return {
+        "account": sources["account"],
+        "ar_config": ar_config,
+        "alto_map": sources["alto_map"],
+        "housing_map": housing_map,
+        "characters": characters,
+    }
+
+
+def build_map_account(sources):
+    """
+    Build one account's /map/ data from its own files only: character classification, region/world
+    counts, characters not in an FC, housing plots (unsized) and Sub Planner rows.
+    Anything that depends on other accounts (FC managers, XA plot sizes, FC plot dedup) is left to
+    the reduce in get_map_data(), so this partial can be cached per account.
+    """
+    extract = extract_map_account(sources)
+    account = extract["account"]
+    plan_names = extract["ar_config"]["plan_names"]
+    
+    # XA Database snapshot for highest_level, Lifestream housing
+    alto_map = extract["alto_map"]
+    housing_map = extract["housing_map"]
+    
+    # Track per-account stats
+    acc_chars_total = 0
+    acc_chars_in_fc = 0
+    acc_chars_in_fc_no_subs = 0  # orange: FC house no subs OR duplicate FC (managed by alt)
+    acc_chars_no_fc = 0
+    acc_chars_excluded = 0
+    acc_region_counts = {}   # region -> count of chars
+    acc_world_counts = {}    # world -> count of chars
+    acc_world_fc_counts = {} # world -> count of unique FCs with subs (green)
+    acc_world_fc_nosubs_counts = {} # world -> count of managed-by-alt (orange)
+    acc_world_excluded_counts = {} # world -> count of excluded chars
+    acc_region_fc = {}       # region -> count of unique FCs with subs (green)
+    acc_region_fc_nosubs = {} # region -> count of managed-by-alt (orange)
+    acc_region_excluded = {} # region -> count of excluded chars
+    acc_no_fc_list = []      # chars not in FC for this account
+    seen_fc_keys = {}        # FC plot dedup: fc_key -> first char name that claimed it
+    per_world_chars = {}     # world -> list of ({name, status, fc_name}, fc_key if managed by an alt)
+    acc_plots = []           # Characters with housing, in roster order (sized and deduped in the reduce)
+    acc_sub_chars = []       # Characters with subs for Sub Planner
+    fc_manager_candidates = []  # (fc_key, name) of chars with active subs, in roster order
+    
+    for row in extract["characters"]:
+        char = row["char"]
+        cid = row["cid"]
+        name = row["name"]
+        world = row["world"]
+        region = region_from_world(world)
+        
+        # Get highest level from XA Database
+        xa_snapshot = alto_map.get(cid, {})
+        highest_level = xa_snapshot.get("highest_level", 0)
+        
+        # FC membership for capacity planner
+        fc_name = row["fc_name"]
+        fc_key = row["fc_key"]
+        is_excluded = row["is_excluded"]
+        has_subs = row["has_subs"]
+        has_fc_house = row["has_fc_house"]
+        if has_subs and not is_excluded and fc_key:
+            fc_manager_candidates.append((fc_key, name))
+        
+        # Classify character into 4 categories:
+        # GREEN  (in_fc):         unique FC with active subs
+        # ORANGE (in_fc_no_subs): managed by alt — FC house no subs, or duplicate FC with subs
+        # GRAY   (excluded):      ExcludeWorkshop enabled
+        # YELLOW (can_join):      not in any FC
+        if is_excluded:
+            char_status = "excluded"
+        elif has_subs:
+            if fc_key and fc_key in seen_fc_keys:
+                char_status = "fc_managed"  # duplicate FC — subs managed by another toon
+            else:
+                char_status = "in_fc"  # unique FC with active subs
+                if fc_key:
+                    seen_fc_keys[fc_key] = {"name": name, "account": account["nickname"]}
+        elif has_fc_house:
+            char_status = "fc_managed"  # has FC plot but no subs on this char
+        else:
+            char_status = "can_join"
+        
+        acc_chars_total += 1
+        if char_status == "excluded":
+            acc_chars_excluded += 1
+        elif char_status == "in_fc":
+            acc_chars_in_fc += 1
+        elif char_status == "fc_managed":
+            acc_chars_in_fc_no_subs += 1
+        else:
+            acc_chars_no_fc += 1
+        
+        # Region/world counts
+        if region:
+            acc_region_counts[region] = acc_region_counts.get(region, 0) + 1
+            if char_status == "excluded":
+                acc_region_excluded[region] = acc_region_excluded.get(region, 0) + 1
+            elif char_status == "in_fc":
+                acc_region_fc[region] = acc_region_fc.get(region, 0) + 1
+            elif char_status == "fc_managed":
+                acc_region_fc_nosubs[region] = acc_region_fc_nosubs.get(region, 0) + 1
+        if world:
+            acc_world_counts[world] = acc_world_counts.get(world, 0) + 1
+            if char_status == "excluded":
+                acc_world_excluded_counts[world] = acc_world_excluded_counts.get(world, 0) + 1
+            elif char_status == "in_fc":
+                acc_world_fc_counts[world] = acc_world_fc_counts.get(world, 0) + 1
+            elif char_status == "fc_managed":
+                acc_world_fc_nosubs_counts[world] = acc_world_fc_nosubs_counts.get(world, 0) + 1
+        
+        # Track character for clickable world UI (managed_by is filled in from the global FC managers)
+        if world not in per_world_chars:
+            per_world_chars[world] = []
+        char_info = {
+            "name": name,
+            "status": char_status,
+            "fc_name": fc_name,
+        }
+        per_world_chars[world].append((char_info, fc_key if char_status == "fc_managed" else None))
+        
+        # Characters not in FC (can_join or excluded — not green/orange)
+        if char_status in ("can_join", "excluded"):
+            char_entry = {
+                "name": name,
+                "world": world,
+                "region": region,
+                "highest_level": highest_level,
+                "account": account["nickname"],
+                "has_fc_house": False,
+                "has_private_house": False,
+                "is_excluded": is_excluded,
+            }
+            if cid in housing_map:
+                if housing_map[cid].get('fc'):
+                    char_entry["has_fc_house"] = True
+                if housing_map[cid].get('private'):
+                    char_entry["has_private_house"] = True
+                    pd = housing_map[cid]['private']
+                    char_entry["private_house"] = f"{pd['district']} W{pd['ward']} P{pd['plot']}"
+            acc_no_fc_list.append(char_entry)
+        
+        # Housing plots from Lifestream
+        if cid in housing_map:
+            acc_plots.append({
+                "housing": housing_map[cid],
+                "xa_snapshot": xa_snapshot,
+                "world": world,
+                "region": region,
+                "name": name,
+                "fc_name": fc_name,
+            })
+        
+        # Collect submarine data for Sub Planner
+        submarines = parse_submarine_data(char, plan_names)
+        if submarines:
+            subs_sleeping = not char.get("WorkshopEnabled", True)
+            sub_list = []
+            for s in submarines:
+                # Compact ETA: "R" if ready, "Xh" or "Xm" or "XdYh"
+                eta = "R"
+                if not s.get("is_ready", False) and s.get("return_time"):
+                    delta = datetime.datetime.fromtimestamp(s["return_time"]) - datetime.datetime.now()
+                    secs = delta.total_seconds()
+                    if secs > 0:
+                        hrs = int(secs // 3600)
+                        mins = int((secs % 3600) // 60)
+                        if hrs >= 24:
+                            eta = f"{hrs // 24}d{hrs % 24}h"
+                        elif hrs > 0:
+                            eta = f"{hrs}h"
+                        else:
+                            eta = f"{mins}m"
+                sub_list.append({
+                    "name": s["name"],
+                    "level": s["level"],
+                    "build": s["build"],
+                    "plan_name": s.get("plan_name", ""),
+                    "is_farming": s.get("is_farming", False),
+                    "is_leveling": s.get("is_leveling", False),
+                    "eta": eta,
+                })
+            
+            # Character inventory stats
+            ceruleum = char.get("Ceruleum", 0)
+            repair_kits = char.get("RepairKits", 0)
+            inventory_space = char.get("InventorySpace", 0)
+            fleet = tally_fleet(submarines, ())
+            restock_days = estimate_restock_days(ceruleum, repair_kits, fleet["tanks_per_day"], fleet["kits_per_day"])
+            
+            acc_sub_chars.append({
+                "name": name,
+                "world": world,
+                "region": region,
+                "fc_name": fc_name,
+                "excluded": is_excluded,
+                "sleeping": subs_sleeping,
+                "subs": sub_list,
+                "tanks": ceruleum,
+                "kits": repair_kits,
+                "restock_days": restock_days,
+                "inventory": inventory_space,
+            })
+    
+    return {
+        "account": account,
+        "xa_housing_size_lookup": build_xa_housing_size_lookup(alto_map),
+        "fc_manager_candidates": fc_manager_candidates,
+        "chars_total": acc_chars_total,
+        "chars_in_fc": acc_chars_in_fc,
+        "chars_in_fc_no_subs": acc_chars_in_fc_no_subs,
+        "chars_no_fc": acc_chars_no_fc,
+        "chars_excluded": acc_chars_excluded,
+        "region_counts": acc_region_counts,
+        "region_fc": acc_region_fc,
+        "region_fc_nosubs": acc_region_fc_nosubs,
+        "region_excluded": acc_region_excluded,
+        "world_counts": acc_world_counts,
+        "world_fc_counts": acc_world_fc_counts,
+        "world_fc_nosubs_counts": acc_world_fc_nosubs_counts,
+        "world_excluded_counts": acc_world_excluded_counts,
+        "per_world_chars": per_world_chars,
+        "no_fc_chars": acc_no_fc_list,
+        "plots": acc_plots,
+        "sub_chars": acc_sub_chars,
+    }
+
+
+def get_map_data(account_sources=None):
     """
     Collect all data needed for the /map/ page:
     - Plot locations by district/ward with character details
     - Characters not in FC grouped by account
     - Per-account, per-region, per-world character counts
     - Capacity calculations for FC planning
+    Per-account partials come from the artifact cache; this reduces them into the global view.
+    account_sources: load_all_account_sources() result shared by the views of one model build.
     """
     plot_list = []           # All individual plot entries
     district_ward_map = {}   # district -> ward -> [plot entries]
     seen_fc_plots = {}       # Deduplicate FC plots by world+district+ward+plot (same as main page)
     no_fc_chars = []         # Characters not in any FC
     account_summaries = []   # Per-account capacity info
-    account_xa_maps = {}
-    xa_housing_size_lookup = {}
-
-    # First pass: build global FC manager map across ALL accounts
-    # Maps fc_key -> {name, account} for the first char with active subs per FC
-    global_fc_managers = {}
-    for account in account_locations:
-        auto_path = account["auto_path"]
-        if not os.path.isfile(auto_path):
-            continue
-        try:
-            with open(auto_path, 'r', encoding='utf-8-sig') as f:
-                pre_data = json.load(f)
-        except Exception:
-            continue
-        pre_fc_data = extract_fc_data(pre_data)
-        pre_characters = collect_characters(pre_data, account["nickname"])
-        pre_housing = {}
-        lfstrm_path = account.get("lfstrm_path", "")
-        if lfstrm_path:
-            pre_housing = load_lifestream_data(lfstrm_path)
-        xa_db_path = account.get("xa_db_path", "")
-        pre_alto_map = scan_xa_db(xa_db_path) if xa_db_path else {}
-        account_xa_maps[account["nickname"]] = pre_alto_map
-        xa_housing_size_lookup.update(build_xa_housing_size_lookup(pre_alto_map))
-        for char in pre_characters:
-            cid = char.get("CID", 0)
-            if not bool(char.get("OfflineSubmarineData", [])):
-                continue
-            if char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False:
-                continue
-            world = char.get("World", "Unknown")
-            name = char.get("Name", "Unknown")
-            fc_name = pre_fc_data[cid].get("Name", "") if cid in pre_fc_data else ""
-            has_fc_house = cid in pre_housing and pre_housing[cid].get('fc') is not None
-            fc_key = None
-            if has_fc_house:
-                fcd = pre_housing[cid]['fc']
-                fc_key = f"{world}_{fcd['district']}_W{fcd['ward']}_P{fcd['plot']}"
-            elif fc_name:
-                fc_key = f"{world}_{fc_name}"
-            if fc_key and fc_key not in global_fc_managers:
-                global_fc_managers[fc_key] = {"name": name, "account": account["nickname"]}
-
-    sub_planner_accounts = []  # Per-account submarine planner data
-
-    for account in account_locations:
-        auto_path = account["auto_path"]
-        if not os.path.isfile(auto_path):
-            continue
-
-        try:
-            with open(auto_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
-        except Exception:
-            continue
-
-        build_plan_name_lookup(data)
-        fc_data = extract_fc_data(data)
-        characters = collect_characters(data, account["nickname"])
-
-        # Scan XA Database for highest_level
-        alto_map = account_xa_maps.get(account["nickname"], {})
-
-        # Load Lifestream housing
-        housing_map = {}
-        lfstrm_path = account.get("lfstrm_path", "")
-        if lfstrm_path:
-            housing_map = load_lifestream_data(lfstrm_path)
-
-        # Track per-account stats
-        acc_chars_total = 0
-        acc_chars_in_fc = 0
-        acc_chars_in_fc_no_subs = 0  # orange: FC house no subs OR duplicate FC (managed by alt)
-        acc_chars_no_fc = 0
-        acc_chars_excluded = 0
-        acc_region_counts = {}   # region -> count of chars
-        acc_world_counts = {}    # world -> count of chars
-        acc_world_fc_counts = {} # world -> count of unique FCs with subs (green)
-        acc_world_fc_nosubs_counts = {} # world -> count of managed-by-alt (orange)
-        acc_world_excluded_counts = {} # world -> count of excluded chars
-        acc_region_fc = {}       # region -> count of unique FCs with subs (green)
-        acc_region_fc_nosubs = {} # region -> count of managed-by-alt (orange)
-        acc_region_excluded = {} # region -> count of excluded chars
-        acc_no_fc_list = []      # chars not in FC for this account
-        seen_fc_keys = {}        # FC plot dedup: fc_key -> first char name that claimed it
-        per_world_chars = {}     # world -> list of {name, status, fc_name} for clickable UI
-        acc_sub_chars = []       # Characters with subs for Sub Planner
-
-        for char in characters:
-            cid = char.get("CID", 0)
-            name = char.get("Name", "Unknown")
-            world = char.get("World", "Unknown")
-            region = region_from_world(world)
-
-            # Get highest level from XA Database
-            xa_snapshot = alto_map.get(cid, {})
-            highest_level = xa_snapshot.get("highest_level", 0)
-            if cid in housing_map:
-                housing_map[cid] = apply_xa_housing_sizes(housing_map[cid], xa_snapshot, xa_housing_size_lookup)
-
-            # FC membership for capacity planner
-            fc_name = ""
-            if cid in fc_data:
-                fc_name = fc_data[cid].get("Name", "")
-
-            # Check AR exclusion settings for this character
-            exclude_workshop = char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False
-            is_excluded = exclude_workshop
-
-            has_subs = bool(char.get("OfflineSubmarineData", []))
-            has_fc_house = cid in housing_map and housing_map[cid].get('fc') is not None
-
-            # Build FC key for dedup (same plot = same FC = same earnings)
-            fc_key = None
-            if has_fc_house:
-                fcd = housing_map[cid]['fc']
-                fc_key = f"{world}_{fcd['district']}_W{fcd['ward']}_P{fcd['plot']}"
-            elif fc_name:
-                fc_key = f"{world}_{fc_name}"
-
-            # Classify character into 4 categories:
-            # GREEN  (in_fc):         unique FC with active subs
-            # ORANGE (in_fc_no_subs): managed by alt — FC house no subs, or duplicate FC with subs
-            # GRAY   (excluded):      ExcludeWorkshop enabled
-            # YELLOW (can_join):      not in any FC
-            if is_excluded:
-                char_status = "excluded"
-            elif has_subs:
-                if fc_key and fc_key in seen_fc_keys:
-                    char_status = "fc_managed"  # duplicate FC — subs managed by another toon
-                else:
-                    char_status = "in_fc"  # unique FC with active subs
-                    if fc_key:
-                        seen_fc_keys[fc_key] = {"name": name, "account": account["nickname"]}
-            elif has_fc_house:
-                char_status = "fc_managed"  # has FC plot but no subs on this char
-            else:
-                char_status = "can_join"
-
-            acc_chars_total += 1
-            if char_status == "excluded":
-                acc_chars_excluded += 1
-            elif char_status == "in_fc":
-                acc_chars_in_fc += 1
-            elif char_status == "fc_managed":
-                acc_chars_in_fc_no_subs += 1
-            else:
-                acc_chars_no_fc += 1
-
-            # Region/world counts
-            if region:
-                acc_region_counts[region] = acc_region_counts.get(region, 0) + 1
-                if char_status == "excluded":
-                    acc_region_excluded[region] = acc_region_excluded.get(region, 0) + 1
-                elif char_status == "in_fc":
-                    acc_region_fc[region] = acc_region_fc.get(region, 0) + 1
-                elif char_status == "fc_managed":
-                    acc_region_fc_nosubs[region] = acc_region_fc_nosubs.get(region, 0) + 1
-            if world:
-                acc_world_counts[world] = acc_world_counts.get(world, 0) + 1
-                if char_status == "excluded":
-                    acc_world_excluded_counts[world] = acc_world_excluded_counts.get(world, 0) + 1
-                elif char_status == "in_fc":
-                    acc_world_fc_counts[world] = acc_world_fc_counts.get(world, 0) + 1
-                elif char_status == "fc_managed":
-                    acc_world_fc_nosubs_counts[world] = acc_world_fc_nosubs_counts.get(world, 0) + 1
+    xa_housing_size_lookup = {}
 
-            # Track character for clickable world UI
-            if world not in per_world_chars:
-                per_world_chars[world] = []
-            char_info = {
-                "name": name,
-                "status": char_status,
-                "fc_name": fc_name,
-            }
-            if char_status == "fc_managed" and fc_key and fc_key in global_fc_managers:
-                mgr = global_fc_managers[fc_key]
-                char_info["managed_by"] = mgr["name"]
-                char_info["managed_by_account"] = mgr["account"]
-            per_world_chars[world].append(char_info)
-
-            # Characters not in FC (can_join or excluded — not green/orange)
-            if char_status in ("can_join", "excluded"):
-                char_entry = {
-                    "name": name,
-                    "world": world,
-                    "region": region,
-                    "highest_level": highest_level,
-                    "account": account["nickname"],
-                    "has_fc_house": False,
-                    "has_private_house": False,
-                    "is_excluded": is_excluded,
-                }
-                if cid in housing_map:
-                    if housing_map[cid].get('fc'):
-                        char_entry["has_fc_house"] = True
-                    if housing_map[cid].get('private'):
-                        char_entry["has_private_house"] = True
-                        pd = housing_map[cid]['private']
-                        char_entry["private_house"] = f"{pd['district']} W{pd['ward']} P{pd['plot']}"
-                acc_no_fc_list.append(char_entry)
-                no_fc_chars.append(char_entry)
-
-            # Collect plot data from housing_map
-            if cid in housing_map:
-                for plot_type in ['private', 'fc']:
-                    pd = housing_map[cid].get(plot_type)
-                    if pd:
-                        # Deduplicate FC plots by world+district+ward+plot (same as main page unique_fc_plots)
-                        plot_key = f"{world}_{pd['district']}_W{pd['ward']}_P{pd['plot']}"
-                        if plot_type == 'fc':
-                            existing_fc_entry = seen_fc_plots.get(plot_key)
-                            if existing_fc_entry:
-                                if not existing_fc_entry.get("size") and pd.get("size"):
-                                    existing_fc_entry["size"] = pd["size"]
-                                if not existing_fc_entry.get("fc_name") and fc_name:
-                                    existing_fc_entry["fc_name"] = fc_name
-                                continue
-
-                        entry = {
-                            "type": plot_type,
-                            "district": pd['district'],
-                            "ward": pd['ward'],
-                            "plot": pd['plot'],
-                            "world": world,
-                            "region": region,
-                            "data_center": datacenter_from_world(world),
-                            "size": pd.get('size', ''),
-                            "character": name,
-                            "account": account["nickname"],
-                            "fc_name": fc_name if plot_type == 'fc' else "",
-                        }
-                        if plot_type == 'fc':
-                            seen_fc_plots[plot_key] = entry
-                        plot_list.append(entry)
-
-                        # Build district -> ward map
-                        dist = pd['district']
-                        if dist not in district_ward_map:
-                            district_ward_map[dist] = {}
-                        ward = pd['ward']
-                        if ward not in district_ward_map[dist]:
-                            district_ward_map[dist][ward] = []
-                        district_ward_map[dist][ward].append(entry)
-
-            # Collect submarine data for Sub Planner
-            submarines = parse_submarine_data(char)
-            if submarines:
-                subs_sleeping = not char.get("WorkshopEnabled", True)
-                sub_list = []
-                for s in submarines:
-                    # Compact ETA: "R" if ready, "Xh" or "Xm" or "XdYh"
-                    eta = "R"
-                    if not s.get("is_ready", False) and s.get("return_time"):
-                        delta = datetime.datetime.fromtimestamp(s["return_time"]) - datetime.datetime.now()
-                        secs = delta.total_seconds()
-                        if secs > 0:
-                            hrs = int(secs // 3600)
-                            mins = int((secs % 3600) // 60)
-                            if hrs >= 24:
-                                eta = f"{hrs // 24}d{hrs % 24}h"
-                            elif hrs > 0:
-                                eta = f"{hrs}h"
-                            else:
-                                eta = f"{mins}m"
-                    sub_list.append({
-                        "name": s["name"],
-                        "level": s["level"],
-                        "build": s["build"],
-                        "plan_name": s.get("plan_name", ""),
-                        "is_farming": s.get("is_farming", False),
-                        "is_leveling": s.get("is_leveling", False),
-                        "eta": eta,
-                    })
+    if account_sources is None:
+        account_sources = load_all_account_sources()
+    account_partials = [get_account_artifact("map", sources, build_map_account)
+                        for sources in account_sources if not sources["error"]]
 
-                # Character inventory stats
-                ceruleum = char.get("Ceruleum", 0)
-                repair_kits = char.get("RepairKits", 0)
-                inventory_space = char.get("InventorySpace", 0)
-                total_tanks_per_day = sum(s.get("tanks_per_day", 0) for s in submarines)
-                total_kits_per_day = sum(s.get("kits_per_day", 0) for s in submarines)
-                restock_days = None
-                if total_tanks_per_day > 0 and total_kits_per_day > 0:
-                    d_tanks = ceruleum / total_tanks_per_day if ceruleum > 0 else 0
-                    d_kits = repair_kits / total_kits_per_day if repair_kits > 0 else 0
-                    restock_days = int(min(d_tanks, d_kits))
-
-                acc_sub_chars.append({
-                    "name": name,
-                    "world": world,
-                    "region": region,
-                    "fc_name": fc_name,
-                    "excluded": is_excluded,
-                    "sleeping": subs_sleeping,
-                    "subs": sub_list,
-                    "tanks": ceruleum,
-                    "kits": repair_kits,
-                    "restock_days": restock_days,
-                    "inventory": inventory_space,
-                })
+    # Global FC manager map across ALL accounts
+    # Maps fc_key -> {name, account} for the first char with active subs per FC
+    global_fc_managers = {}
+    for partial in account_partials:
+        xa_housing_size_lookup.update(partial["xa_housing_size_lookup"])
+        for fc_key, name in partial["fc_manager_candidates"]:
+            if fc_key not in global_fc_managers:
+                global_fc_managers[fc_key] = {"name": name, "account": partial["account"]["nickname"]}
+
+    sub_planner_accounts = []  # Per-account submarine planner data
+
+    for partial in account_partials:
+        account = partial["account"]
+        acc_region_counts = partial["region_counts"]
+        acc_region_fc = partial["region_fc"]
+        acc_region_fc_nosubs = partial["region_fc_nosubs"]
+        acc_region_excluded = partial["region_excluded"]
+        acc_world_counts = partial["world_counts"]
+        acc_world_fc_counts = partial["world_fc_counts"]
+        acc_world_fc_nosubs_counts = partial["world_fc_nosubs_counts"]
+        acc_world_excluded_counts = partial["world_excluded_counts"]
+        acc_sub_chars = partial["sub_chars"]
+        no_fc_chars.extend(partial["no_fc_chars"])
+
+        # Characters per world, naming the toon whose subs manage each orange character's FC
+        per_world_chars = {}
+        for world, chars in partial["per_world_chars"].items():
+            per_world_chars[world] = []
+            for char_info, fc_key in chars:
+                if fc_key and fc_key in global_fc_managers:
+                    mgr = global_fc_managers[fc_key]
+                    char_info = dict(char_info, managed_by=mgr["name"], managed_by_account=mgr["account"])
+                per_world_chars[world].append(char_info)
+
+        # Collect plot data from housing (XA plot sizes use the lookup built from every account)
+        for plot_char in partial["plots"]:
+            housing = apply_xa_housing_sizes(plot_char["housing"], plot_char["xa_snapshot"], xa_housing_size_lookup)
+            world = plot_char["world"]
+            fc_name = plot_char["fc_name"]
+            for plot_type in ['private', 'fc']:
+                pd = housing.get(plot_type)
+                if pd:
+                    # Deduplicate FC plots by world+district+ward+plot (same as main page unique_fc_plots)
+                    plot_key = f"{world}_{pd['district']}_W{pd['ward']}_P{pd['plot']}"
+                    if plot_type == 'fc':
+                        existing_fc_entry = seen_fc_plots.get(plot_key)
+                        if existing_fc_entry:
+                            if not existing_fc_entry.get("size") and pd.get("size"):
+                                existing_fc_entry["size"] = pd["size"]
+                            if not existing_fc_entry.get("fc_name") and fc_name:
+                                existing_fc_entry["fc_name"] = fc_name
+                            continue
+
+                    entry = {
+                        "type": plot_type,
+                        "district": pd['district'],
+                        "ward": pd['ward'],
+                        "plot": pd['plot'],
+                        "world": world,
+                        "region": plot_char["region"],
+                        "data_center": datacenter_from_world(world),
+                        "size": pd.get('size', ''),
+                        "character": plot_char["name"],
+                        "account": account["nickname"],
+                        "fc_name": fc_name if plot_type == 'fc' else "",
+                    }
+                    if plot_type == 'fc':
+                        seen_fc_plots[plot_key] = entry
+                    plot_list.append(entry)
+
+                    # Build district -> ward map
+                    dist = pd['district']
+                    if dist not in district_ward_map:
+                        district_ward_map[dist] = {}
+                    ward = pd['ward']
+                    if ward not in district_ward_map[dist]:
+                        district_ward_map[dist][ward] = []
+                    district_ward_map[dist][ward].append(entry)
 
         # Calculate capacity per region
         region_capacity = []
@@ -5899,12 +7811,12 @@ def get_map_data():
 
         account_summaries.append({
             "nickname": account["nickname"],
-            "total_chars": acc_chars_total,
-            "in_fc": acc_chars_in_fc,
-            "in_fc_no_subs": acc_chars_in_fc_no_subs,
-            "not_in_fc": acc_chars_no_fc,
-            "excluded": acc_chars_excluded,
-            "no_fc_chars": acc_no_fc_list,
+            "total_chars": partial["chars_total"],
+            "in_fc": partial["chars_in_fc"],
+            "in_fc_no_subs": partial["chars_in_fc_no_subs"],
+            "not_in_fc": partial["chars_no_fc"],
+            "excluded": partial["chars_excluded"],
+            "no_fc_chars": partial["no_fc_chars"],
             "region_capacity": region_capacity,
         })
 
@@ -7639,12 +9551,148 @@ MAP_TEMPLATE = '''
 # ===============================================
 # Submarine Master List Data
 # ===============================================
-def get_subs_data():
+def build_subs_account(sources):
+    """
+    Build one account's /subs/ rows plus what get_subs_data() reduces into the totals:
+    per-character contributions and the FC points of each of the account's FCs.
+    Returns: {"rows": list, "char_totals": list, "fc_points": {fc_name: points}}
+    """
+    rows = []
+    char_totals = []
+    fc_points_by_name = {}  # First character's FC points per FC name
+    account = sources["account"]
+    ar_config = sources["ar_config"]
+    
+    plan_names = ar_config["plan_names"]
+    fc_data = ar_config["fc_data"]
+    characters = ar_config["characters"]
+    
+    # XA Database data for treasure values
+    alto_map = sources["alto_map"]
+    
+    for char in characters:
+        cid = char.get("CID", 0)
+        submarines = parse_submarine_data(char, plan_names)
+        
+        # Character-level data
+        char_name = char.get("Name", "Unknown")
+        world = char.get("World", "Unknown")
+        region = region_from_world(world)
+        char_gil = char.get("Gil", 0)
+        exclude_retainer = char.get("ExcludeRetainer", False) if HONOR_AR_EXCLUSIONS else False
+        retainers = parse_retainer_data(char)
+        fleet = tally_fleet(submarines, retainers)
+        retainer_gil = fleet["retainer_gil"] if not exclude_retainer else 0
+        ceruleum = char.get("Ceruleum", 0)
+        repair_kits = char.get("RepairKits", 0)
+        inventory_space = char.get("InventorySpace", 0)
+        ventures = char.get("Ventures", 0)
+        
+        # XA Database data
+        treasure_value = 0
+        fc_gil = 0
+        xa_fc_points = 0
+        highest_level = 0
+        highest_job = ""
+        if cid in alto_map:
+            treasure_value = alto_map[cid].get("treasure_value", 0)
+            fc_gil = alto_map[cid].get("fc_gil", 0)
+            xa_fc_points = alto_map[cid].get("fc_points", 0)
+            highest_level = alto_map[cid].get("highest_level", 0)
+            highest_job = alto_map[cid].get("highest_job", "")
+        
+        # FC info
+        fc_name = ""
+        fc_points = xa_fc_points
+        if cid in fc_data:
+            fc_name = fc_data[cid].get("Name", "")
+            if fc_points <= 0:
+                fc_points = fc_data[cid].get("FCPoints", 0)
+            # Only count FC points once per unique FC per account
+            if fc_name and fc_name not in fc_points_by_name:
+                fc_points_by_name[fc_name] = fc_points
+        
+        # Exclusion / sleeping flags
+        exclude_workshop = char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False
+        subs_sleeping = not char.get("WorkshopEnabled", True)
+        
+        # Calculate days until restock
+        days_until_restock = estimate_restock_days(ceruleum, repair_kits, fleet["tanks_per_day"], fleet["kits_per_day"])
+        
+        # Daily totals for this character
+        daily_income = fleet["sub_daily_gil"]
+        daily_cost = fleet["sub_daily_cost"]
+        
+        # Pad submarines to 4 slots
+        sub_slots = []
+        for i in range(4):
+            if i < len(submarines):
+                s = submarines[i]
+                sub_slots.append({
+                    "name": s["name"],
+                    "level": s["level"],
+                    "build": s["build"],
+                    "plan_name": s["plan_name"] if s["plan_name"] else ("Farming" if s["is_farming"] else ("Leveling" if s["is_leveling"] else "None")),
+                    "return_formatted": s["return_formatted"],
+                    "return_time": s["return_time"] if s["return_time"] else 0,
+                    "is_ready": s["is_ready"],
+                    "is_farming": s["is_farming"],
+                    "is_leveling": s["is_leveling"],
+                    "daily_gil": s["daily_gil"],
+                })
+            else:
+                sub_slots.append(None)
+        
+        # Determine if character is "unused" (no FC, no subs, no tanks, no kits)
+        has_fc = bool(fc_name)
+        has_subs = len(submarines) > 0
+        has_tanks = ceruleum > 0
+        has_kits = repair_kits > 0
+        is_unused = not has_fc and not has_subs and not has_tanks and not has_kits
+        
+        # Per-character contributions, summed in roster order by get_subs_data()
+        char_totals.append((len(submarines), fleet["subs_farming"], fleet["subs_leveling"], fleet["idle_subs"],
+                            fleet["ready_subs"], daily_income, daily_cost, ceruleum, repair_kits, is_unused))
+        
+        rows.append({
+            "account": account["nickname"],
+            "char_name": char_name,
+            "world": world,
+            "name_world": f"{char_name}@{world}",
+            "snd_script_name": f'{{"{char_name}@{world}"}},',
+            "region": region,
+            "fc_name": fc_name,
+            "char_level": highest_level,
+            "char_job": highest_job,
+            "gil": char_gil,
+            "retainer_gil": retainer_gil,
+            "fc_gil": fc_gil,
+            "fc_points": fc_points,
+            "ceruleum": ceruleum,
+            "repair_kits": repair_kits,
+            "inventory_space": inventory_space,
+            "ventures": ventures,
+            "treasure_value": treasure_value,
+            "days_until_restock": days_until_restock,
+            "daily_income": daily_income,
+            "daily_cost": daily_cost,
+            "num_subs": len(submarines),
+            "subs": sub_slots,
+            "exclude_workshop": exclude_workshop,
+            "subs_sleeping": subs_sleeping,
+            "is_unused": is_unused,
+        })
+    
+    return {"rows": rows, "char_totals": char_totals, "fc_points": fc_points_by_name}
+
+
+def get_subs_data(account_sources=None):
     """
     Collect all character data across all accounts for the /subs/ master list page.
     Returns one row per character with up to 4 submarine slots,
     plus character-level context like gil, ceruleum, kits, inventory, treasure.
     Characters with no FC, no subs, no tanks, no kits are flagged as 'unused'.
+    account_sources: load_all_account_sources() result shared by the views of one model build.
     """
     rows = []
     seen_fcs = {}  # Track unique FCs by (account, fc_name) to avoid double-counting points
@@ -7674,160 +9722,36 @@ def get_subs_data():
         "unique_fc_count": 0,
     }
     
-    for account in account_locations:
-        auto_path = account["auto_path"]
-        if not os.path.isfile(auto_path):
-            continue
-        
-        try:
-            with open(auto_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
-        except Exception:
+    if account_sources is None:
+        account_sources = load_all_account_sources()
+    for sources in account_sources:
+        if sources["error"]:
             continue
+        partial = get_account_artifact("subs", sources, build_subs_account)
+        rows.extend(partial["rows"])
         
-        build_plan_name_lookup(data)
-        fc_data = extract_fc_data(data)
-        characters = collect_characters(data, account["nickname"])
-        
-        # Scan XA Database for treasure values
-        alto_map = {}
-        xa_db_path = account.get("xa_db_path", "")
-        if xa_db_path:
-            alto_map = scan_xa_db(xa_db_path)
-        
-        for char in characters:
-            cid = char.get("CID", 0)
-            submarines = parse_submarine_data(char)
-            
+        # Accumulate totals
+        for (num_subs, farming, leveling, idle, ready, daily_income, daily_cost,
+             ceruleum, repair_kits, is_unused) in partial["char_totals"]:
             totals["total_chars"] += 1
-            
-            # Character-level data
-            char_name = char.get("Name", "Unknown")
-            world = char.get("World", "Unknown")
-            region = region_from_world(world)
-            char_gil = char.get("Gil", 0)
-            exclude_retainer = char.get("ExcludeRetainer", False) if HONOR_AR_EXCLUSIONS else False
-            retainers = parse_retainer_data(char)
-            retainer_gil = sum(r["gil"] for r in retainers) if not exclude_retainer else 0
-            ceruleum = char.get("Ceruleum", 0)
-            repair_kits = char.get("RepairKits", 0)
-            inventory_space = char.get("InventorySpace", 0)
-            ventures = char.get("Ventures", 0)
-            
-            # XA Database data
-            treasure_value = 0
-            fc_gil = 0
-            xa_fc_points = 0
-            highest_level = 0
-            highest_job = ""
-            if cid in alto_map:
-                treasure_value = alto_map[cid].get("treasure_value", 0)
-                fc_gil = alto_map[cid].get("fc_gil", 0)
-                xa_fc_points = alto_map[cid].get("fc_points", 0)
-                highest_level = alto_map[cid].get("highest_level", 0)
-                highest_job = alto_map[cid].get("highest_job", "")
-            
-            # FC info
-            fc_name = ""
-            fc_points = xa_fc_points
-            if cid in fc_data:
-                fc_name = fc_data[cid].get("Name", "")
-                if fc_points <= 0:
-                    fc_points = fc_data[cid].get("FCPoints", 0)
-                # Only count FC points once per unique FC per account
-                fc_key = (account["nickname"], fc_name)
-                if fc_key not in seen_fcs and fc_name:
-                    seen_fcs[fc_key] = fc_points
-                if fc_name:
-                    unique_fc_names.add(fc_name)
-            
-            # Exclusion / sleeping flags
-            exclude_workshop = char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False
-            subs_sleeping = not char.get("WorkshopEnabled", True)
-            
-            # Calculate days until restock
-            total_tanks_per_day = sum(s.get("tanks_per_day", 0) for s in submarines)
-            total_kits_per_day = sum(s.get("kits_per_day", 0) for s in submarines)
-            days_until_restock = None
-            if total_tanks_per_day > 0 and total_kits_per_day > 0:
-                days_from_tanks = ceruleum / total_tanks_per_day if ceruleum > 0 else 0
-                days_from_kits = repair_kits / total_kits_per_day if repair_kits > 0 else 0
-                days_until_restock = int(min(days_from_tanks, days_from_kits))
-            
-            # Daily totals for this character
-            daily_income = sum(s["daily_gil"] for s in submarines) if submarines else 0
-            daily_cost = sum(s["daily_cost"] for s in submarines) if submarines else 0
-            
-            # Pad submarines to 4 slots
-            sub_slots = []
-            for i in range(4):
-                if i < len(submarines):
-                    s = submarines[i]
-                    sub_slots.append({
-                        "name": s["name"],
-                        "level": s["level"],
-                        "build": s["build"],
-                        "plan_name": s["plan_name"] if s["plan_name"] else ("Farming" if s["is_farming"] else ("Leveling" if s["is_leveling"] else "None")),
-                        "return_formatted": s["return_formatted"],
-                        "return_time": s["return_time"] if s["return_time"] else 0,
-                        "is_ready": s["is_ready"],
-                        "is_farming": s["is_farming"],
-                        "is_leveling": s["is_leveling"],
-                        "daily_gil": s["daily_gil"],
-                    })
-                else:
-                    sub_slots.append(None)
-            
-            # Determine if character is "unused" (no FC, no subs, no tanks, no kits)
-            has_fc = bool(fc_name)
-            has_subs = len(submarines) > 0
-            has_tanks = ceruleum > 0
-            has_kits = repair_kits > 0
-            is_unused = not has_fc and not has_subs and not has_tanks and not has_kits
-            
-            # Accumulate totals
-            if has_subs:
+            if num_subs:
                 totals["total_chars_with_subs"] += 1
-                totals["total_subs"] += len(submarines)
-                totals["total_farming"] += sum(1 for s in submarines if s["is_farming"])
-                totals["total_leveling"] += sum(1 for s in submarines if s["is_leveling"])
-                totals["total_idle"] += sum(1 for s in submarines if not s["plan_name"] and not s["is_farming"] and not s["is_leveling"])
-                totals["total_ready"] += sum(1 for s in submarines if s["is_ready"])
+                totals["total_subs"] += num_subs
+                totals["total_farming"] += farming
+                totals["total_leveling"] += leveling
+                totals["total_idle"] += idle
+                totals["total_ready"] += ready
                 totals["total_daily_income"] += daily_income
                 totals["total_daily_cost"] += daily_cost
             totals["total_ceruleum"] += ceruleum
             totals["total_kits"] += repair_kits
             if is_unused:
                 totals["total_unused"] += 1
-            
-            rows.append({
-                "account": account["nickname"],
-                "char_name": char_name,
-                "world": world,
-                "name_world": f"{char_name}@{world}",
-                "snd_script_name": f'{{"{char_name}@{world}"}},',
-                "region": region,
-                "fc_name": fc_name,
-                "char_level": highest_level,
-                "char_job": highest_job,
-                "gil": char_gil,
-                "retainer_gil": retainer_gil,
-                "fc_gil": fc_gil,
-                "fc_points": fc_points,
-                "ceruleum": ceruleum,
-                "repair_kits": repair_kits,
-                "inventory_space": inventory_space,
-                "ventures": ventures,
-                "treasure_value": treasure_value,
-                "days_until_restock": days_until_restock,
-                "daily_income": daily_income,
-                "daily_cost": daily_cost,
-                "num_subs": len(submarines),
-                "subs": sub_slots,
-                "exclude_workshop": exclude_workshop,
-                "subs_sleeping": subs_sleeping,
-                "is_unused": is_unused,
-            })
+        
+        # Only count FC points once per unique FC per account
+        for fc_name, fc_points in partial["fc_points"].items():
+            seen_fcs[(sources["account"]["nickname"], fc_name)] = fc_points
+            unique_fc_names.add(fc_name)
     
     totals["total_monthly_income"] = totals["total_daily_income"] * 30
     totals["total_monthly_cost"] = totals["total_daily_cost"] * 30
@@ -8698,151 +10622,1153 @@ CHARTS_TEMPLATE = '''
             { label: 'Leveling Subs', data: snapshots.map(s => s.total_subs_leveling || 0), yAxisID: 'y1', borderColor: '#d29922', backgroundColor: 'rgba(210,153,34,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 }
         ], wholeNumberTick, wholeNumberTick);
 
-        createDualAxisLineChart('supplyChart', [
-            { label: 'Ceruleum Tanks', data: snapshots.map(s => s.ceruleum_tank_inventory || 0), yAxisID: 'y', borderColor: '#d29922', backgroundColor: 'rgba(210,153,34,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 },
-            { label: 'Repair Kits', data: snapshots.map(s => s.repair_kit_inventory || 0), yAxisID: 'y1', borderColor: '#8b949e', backgroundColor: 'rgba(139,148,158,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 }
-        ], wholeNumberTick, wholeNumberTick);
+        createDualAxisLineChart('supplyChart', [
+            { label: 'Ceruleum Tanks', data: snapshots.map(s => s.ceruleum_tank_inventory || 0), yAxisID: 'y', borderColor: '#d29922', backgroundColor: 'rgba(210,153,34,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 },
+            { label: 'Repair Kits', data: snapshots.map(s => s.repair_kit_inventory || 0), yAxisID: 'y1', borderColor: '#8b949e', backgroundColor: 'rgba(139,148,158,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 }
+        ], wholeNumberTick, wholeNumberTick);
+
+        createDualAxisLineChart('consumptionChart', [
+            { label: 'Tanks/Day', data: snapshots.map(s => s.total_tanks_per_day || 0), yAxisID: 'y', borderColor: '#d29922', backgroundColor: 'rgba(210,153,34,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 },
+            { label: 'Kits/Day', data: snapshots.map(s => s.total_kits_per_day || 0), yAxisID: 'y1', borderColor: '#8b949e', backgroundColor: 'rgba(139,148,158,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 }
+        ], decimalTick, decimalTick);
+
+        createDualAxisLineChart('restockChart', [
+            {
+                label: 'Days Until Restock',
+                data: snapshots.map(s => s.min_days_until_restocking ?? s.days_until_restocking),
+                yAxisID: 'y',
+                borderColor: '#f85149',
+                backgroundColor: 'rgba(248,81,73,0.1)',
+                fill: true,
+                tension: 0.3,
+                pointRadius: 1,
+                borderWidth: 1.5,
+                pointBackgroundColor: snapshots.map(s => {
+                    const value = s.min_days_until_restocking ?? s.days_until_restocking;
+                    return value !== null && value < 7 ? '#f85149' : '#3fb950';
+                })
+            },
+            {
+                label: 'Highest Days Until Restock',
+                data: snapshots.map(s => s.max_days_until_restocking ?? s.days_until_restocking),
+                yAxisID: 'y1',
+                borderColor: '#58a6ff',
+                backgroundColor: 'rgba(88,166,255,0)',
+                fill: false,
+                tension: 0.3,
+                pointRadius: 1,
+                borderWidth: 1.5
+            }
+        ], decimalTick, decimalTick);
+    </script>
+    {% else %}
+    <div class="no-data">
+        <h2>No Financial Data Available</h2>
+        {% if not data %}
+        <p>USE_AAR_DB is disabled in config.json.</p>
+        <p style="margin-top:8px;color:#8b949e;">Set <code style="background:#21262d;padding:2px 6px;border-radius:3px;">"USE_AAR_DB": true</code> to enable snapshot recording.</p>
+        {% else %}
+        <p>No snapshots recorded yet. Data will appear after the dashboard loads and records its first daily snapshot.</p>
+        <p style="margin-top:8px;color:#8b949e;">Visit the main dashboard page to trigger snapshot recording.</p>
+        {% endif %}
+    </div>
+    {% endif %}
+
+    <div class="footer">AutoRetainer Dashboard {{ version }} | Charts powered by sublord.db snapshots from XA Database</div>
+</body>
+</html>
+'''
+
+
+# ===============================================
+# Dashboard Model (background refresh)
+# ===============================================
+# All pages are served from one immutable model built by a background thread.
+# Requests only serialize the latest model (stale-while-revalidate), so request
+# latency no longer depends on account count. The model is rebuilt every
+# MODEL_REFRESH_INTERVAL seconds, when a watched source file changes, or when
+# /api/refresh asks for it. A file-change rebuild only recomputes the accounts whose
+# files changed (see Per-Account Artifacts).
+DashboardModel = collections.namedtuple(
+    "DashboardModel",
+    ["version", "built_at", "build_seconds", "timings", "main", "map", "subs", "charts", "gil_totals", "char_hashes",
+     "content_hash", "timers"],
+)
+# Versions restart at 1 with the process; the epoch tells clients their version came from another run
+MODEL_EPOCH = f"{int(time.time()):x}{os.getpid():x}"
+MODEL_HISTORY_SIZE = 32  # Past versions kept for /api/data?since= deltas (older ones get a full payload)
+
+
+# Character fields computed from the current time (countdown text, seconds-left sort keys).
+# The page counts these down itself from the return/venture epochs, so a rebuild where only
+# the clock moved doesn't mark any character as changed.
+TIMER_DERIVED_KEYS = {"min_retainer_return", "min_sub_return"}
+TIMER_DERIVED_ITEM_KEYS = {"return_formatted", "venture_formatted"}
+
+
+def _character_hash_view(char):
+    """Return the character without its clock-derived fields"""
+    view = {key: value for key, value in char.items() if key not in TIMER_DERIVED_KEYS}
+    for key in ("submarines", "retainers"):
+        if key in view:
+            view[key] = [{k: v for k, v in item.items() if k not in TIMER_DERIVED_ITEM_KEYS} for item in view[key]]
+    return view
+
+
+def compute_character_hashes(main_data):
+    """Return {cid: content hash} for every character card in the main view"""
+    hashes = {}
+    for account in (main_data or {}).get("accounts", []):
+        for char in account.get("characters", []):
+            encoded = json.dumps(_character_hash_view(char), default=str, separators=(",", ":")).encode("utf-8")
+            hashes[str(char.get("cid"))] = hashlib.blake2b(encoded, digest_size=8).hexdigest()
+    return hashes
+
+
+def compute_content_hash(char_hashes):
+    """Combine character hashes into one hash that only changes when some character's data does"""
+    encoded = json.dumps(sorted(char_hashes.items()), separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def timer_id(cid, kind, name):
+    """Stable ID of a countdown: kind is "s" (submarine return) or "r" (retainer venture)"""
+    return f"{cid}:{kind}:{name}"
+
+
+def collect_timers(main_data):
+    """Return {timer id: unix epoch} for every voyaging submarine and venturing retainer"""
+    timers = {}
+    for account in (main_data or {}).get("accounts", []):
+        for char in account.get("characters", []):
+            cid = char.get("cid")
+            for sub in char.get("submarines", []):
+                if sub.get("return_time"):
+                    timers[timer_id(cid, "s", sub["name"])] = int(sub["return_time"])
+            for ret in char.get("retainers", []):
+                if ret.get("has_venture") and ret.get("venture_ends"):
+                    timers[timer_id(cid, "r", ret["name"])] = int(ret["venture_ends"])
+    return timers
+
+
+def get_source_signature():
+    """
+    Return change signatures for every account source file.
+    sublord.db is not watched: the model build is its only writer, so watching it would
+    make every snapshot write trigger another rebuild.
+    """
+    return tuple(get_account_signatures())
+
+
+def build_dashboard_model(version):
+    """Build all dashboard views once and return them as a DashboardModel"""
+    timings = {}
+    started = time.perf_counter()
+    
+    def _timed(name, builder):
+        view_started = time.perf_counter()
+        result = builder()
+        timings[name] = round(time.perf_counter() - view_started, 4)
+        return result
+    
+    # Each account is read once per build; all three views share the result
+    account_sources = _timed("load", load_all_account_sources)
+    main_data = _timed("main", lambda: get_all_data(account_sources))
+    map_data = _timed("map", lambda: get_map_data(account_sources))
+    subs_data = _timed("subs", lambda: get_subs_data(account_sources))
+    gil_totals = None
+    if USE_AAR_DB:
+        gil_totals = _timed("gil_totals", _get_xa_gil_totals)
+        # Record the /charts/ snapshot from this build before reading the history back
+        if main_data and "summary" in main_data:
+            _timed("snapshot", lambda: write_daily_snapshot(main_data["summary"], gil_totals))
+    charts_data = _timed("charts", read_sublord_data)
+    char_hashes = _timed("hashes", lambda: compute_character_hashes(main_data))
+    timers = _timed("timers", lambda: collect_timers(main_data))
+    
+    return DashboardModel(
+        version=version,
+        built_at=time.time(),
+        build_seconds=round(time.perf_counter() - started, 4),
+        timings=timings,
+        main=main_data,
+        map=map_data,
+        subs=subs_data,
+        charts=charts_data,
+        gil_totals=gil_totals,
+        char_hashes=char_hashes,
+        content_hash=compute_content_hash(char_hashes),
+        timers=timers,
+    )
+
+
+class ModelRefresher:
+    """Background thread that keeps the latest DashboardModel built"""
+    
+    def __init__(self, refresh_interval, poll_interval):
+        self.refresh_interval = refresh_interval
+        self.poll_interval = max(0.1, poll_interval)
+        self._model = None
+        self._last_error = None
+        self._wakeup = threading.Event()
+        self._pending_lock = threading.Lock()
+        self._rebuild_requested = False  # Full rebuild (clock tick) asked for by /api/refresh
+        self._sources_changed = False    # Source watcher reported changed files
+        self._model_ready = threading.Condition()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._last_signature = None
+        self._history = collections.OrderedDict()  # version -> char_hashes, newest last
+        # Rebuild requests that arrived while one was already queued, and requests that
+        # waited for the first build instead of building themselves
+        self.stats = {"builds": 0, "rebuild_requests": 0, "coalesced_requests": 0, "first_build_waiters": 0}
+    
+    def start(self):
+        """Start the refresher thread (no-op if already running)"""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="dashboard-model-refresher", daemon=True)
+            self._thread.start()
+    
+    def request_rebuild(self):
+        """Queue a rebuild; returns immediately. Requests made before it starts share one build."""
+        with self._pending_lock:
+            self.stats["rebuild_requests"] += 1
+            self.stats["coalesced_requests"] += self._rebuild_requested
+            self._rebuild_requested = True
+        self._wakeup.set()
+    
+    def notify_sources_changed(self, paths=None):
+        """Queue a rebuild of the accounts whose files changed (source watcher subscriber)"""
+        with self._pending_lock:
+            self._sources_changed = True
+        self._wakeup.set()
+    
+    def get_stats(self):
+        """Return build and request coalescing counters"""
+        with self._pending_lock:
+            stats = dict(self.stats)
+        with self._model_ready:
+            stats["version"] = self._model.version if self._model else None
+        return stats
+    
+    def get_model(self, timeout=None):
+        """Return the latest model, waiting for the first build if none exists yet"""
+        self.start()
+        with self._model_ready:
+            if self._model is None:
+                with self._pending_lock:
+                    self.stats["first_build_waiters"] += 1
+                self._model_ready.wait_for(lambda: self._model is not None or self._last_error is not None, timeout)
+            if self._model is None and self._last_error is not None:
+                raise RuntimeError(f"Dashboard model build failed: {self._last_error}")
+            return self._model
+    
+    def wait_for_update(self, version, timeout):
+        """Block until a model other than `version` is served or `timeout` passes; returns the latest model"""
+        self.start()
+        with self._model_ready:
+            self._model_ready.wait_for(lambda: self._model is not None and self._model.version != version, timeout)
+            return self._model
+    
+    def get_character_hashes(self, version):
+        """Return the character hashes of a recent model version, or None if it's no longer kept"""
+        with self._model_ready:
+            return self._history.get(version)
+    
+    def _rebuild(self):
+        signature = get_source_signature()
+        version = (self._model.version + 1) if self._model else 1
+        try:
+            model = build_dashboard_model(version)
+        except Exception as e:
+            print(f"[MODEL] Rebuild failed, keeping previous model: {e}")
+            with self._model_ready:
+                self._last_error = e
+                self._model_ready.notify_all()
+            return
+        self._last_signature = signature
+        with self._pending_lock:
+            self.stats["builds"] += 1
+        with self._model_ready:
+            self._model = model
+            self._last_error = None
+            self._history[model.version] = model.char_hashes
+            while len(self._history) > MODEL_HISTORY_SIZE:
+                self._history.popitem(last=False)
+            self._model_ready.notify_all()
+        if DEBUG:
+            with _account_artifact_lock:
+                artifacts = dict(account_artifact_stats)
+            print(f"[MODEL] v{model.version} built in {model.build_seconds:.2f}s {model.timings} "
+                  f"(account partials: {artifacts['hits']} reused, {artifacts['misses']} built in total)")
+    
+    def _run(self):
+        self._rebuild()
+        last_build = time.monotonic()
+        while True:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            with self._pending_lock:
+                requested, self._rebuild_requested = self._rebuild_requested, False
+                changed, self._sources_changed = self._sources_changed, False
+            due = self.refresh_interval > 0 and time.monotonic() - last_build >= self.refresh_interval
+            if requested or due:
+                # Scheduled/requested rebuilds refresh every account's timers and ready flags
+                advance_artifact_clock()
+                self._rebuild()
+                last_build = time.monotonic()
+            elif changed or (not source_watcher.is_running() and get_source_signature() != self._last_signature):
+                # A source file changed: only accounts whose files changed are recomputed.
+                # Without the source watcher the refresher polls file signatures itself.
+                self._rebuild()
+
+
+model_refresher = ModelRefresher(MODEL_REFRESH_INTERVAL, MODEL_CHANGE_POLL_INTERVAL)
+
+
+def get_dashboard_model():
+    """Return the latest DashboardModel (starts the background refresher on first use)"""
+    return model_refresher.get_model()
+
+
+# ===============================================
+# Source File Watcher
+# ===============================================
+# Notices changes to every account source file (AutoRetainer, Lifestream, xa.db and its -wal)
+# and quest_cache.json, and publishes them to subscribers: the caches drop what they hold for
+# the changed files, then the model refresher rebuilds the affected accounts. inotify is used
+# for files on local filesystems when inotify_simple is installed; everything else is polled,
+# since network shares (SMB/NFS, WSL drives) don't report writes made by other machines.
+# AutoRetainer rewrites its config several times in a burst, so events are debounced.
+NETWORK_FS_TYPES = {"cifs", "smb3", "smbfs", "nfs", "nfs4", "9p", "drvfs", "fuse.sshfs", "afs", "ceph", "glusterfs"}
+
+
+def get_network_mount_points():
+    """Return mount points of network filesystems from /proc/self/mounts (empty where unavailable)"""
+    mount_points = []
+    try:
+        with open("/proc/self/mounts", "r", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3 and fields[2] in NETWORK_FS_TYPES:
+                    mount_points.append(fields[1].replace("\\040", " "))
+    except OSError:
+        pass
+    return mount_points
+
+
+def is_network_path(path, mount_points):
+    """True if path lives on one of the given network mount points"""
+    path = os.path.abspath(path)
+    return any(path == mount or path.startswith(mount.rstrip("/") + "/") for mount in mount_points)
+
+
+class SourceWatcher:
+    """Background thread that publishes debounced sets of changed source file paths"""
+    
+    max_delay = 10  # Seconds: publish at least this often while a file keeps changing (busy xa.db-wal)
+    
+    def __init__(self, poll_interval, debounce, mode="auto"):
+        self.poll_interval = max(0.1, poll_interval)
+        self.debounce = max(0.0, debounce)
+        self.mode = mode
+        self.backend = None  # "inotify", "poll" or "inotify+poll" once started
+        self.stats = {"events": 0, "published": 0, "paths_published": 0}
+        self._subscribers = []
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._inotify = None
+        self._watch_dirs = {}        # inotify watch descriptor -> directory
+        self._inotify_paths = set()  # Files covered by inotify
+        self._polled_paths = set()   # Files covered by polling
+        self._poll_signatures = {}   # path -> last signature seen by the poller
+    
+    def subscribe(self, callback):
+        """Call callback(paths) with each debounced set of changed paths (on the watcher thread)"""
+        self._subscribers.append(callback)
+    
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+    
+    def watched_paths(self):
+        """Return every file the dashboard is built from"""
+        paths = {QUEST_CACHE_PATH}
+        for account in list(account_locations):
+            paths.update(account_source_paths(account))
+        return paths
+    
+    def start(self):
+        """Start watching (no-op if already running)"""
+        with self._start_lock:
+            if self.is_running():
+                return
+            self._setup()
+            self._thread = threading.Thread(target=self._run, name="source-watcher", daemon=True)
+            self._thread.start()
+    
+    def get_stats(self):
+        return dict(self.stats, backend=self.backend, inotify_paths=len(self._inotify_paths),
+                    polled_paths=len(self._polled_paths))
+    
+    def _setup(self):
+        paths = self.watched_paths()
+        local = set()
+        if self.mode != "poll" and inotify_simple is not None and sys.platform.startswith("linux"):
+            network_mounts = get_network_mount_points()
+            local = {path for path in paths if not is_network_path(path, network_mounts)}
+            try:
+                self._inotify = inotify_simple.INotify()
+            except OSError as e:
+                print(f"[WATCH] inotify unavailable ({e}), polling instead")
+                local = set()
+            flags = inotify_simple.flags
+            mask = flags.CLOSE_WRITE | flags.MOVED_TO | flags.CREATE | flags.DELETE | flags.MODIFY
+            for directory in sorted({os.path.dirname(path) for path in local}):
+                try:
+                    self._watch_dirs[self._inotify.add_watch(directory, mask)] = directory
+                except OSError:
+                    # Missing or unwatchable folder: poll its files instead
+                    local = {path for path in local if os.path.dirname(path) != directory}
+        self._inotify_paths = local
+        self._polled_paths = paths - local
+        if local and self._polled_paths:
+            self.backend = "inotify+poll"
+        else:
+            self.backend = "inotify" if local else "poll"
+    
+    def _poll(self):
+        """Return polled paths whose signature changed since the last poll"""
+        changed = set()
+        polled_accounts = [account for account in list(account_locations)
+                           if self._polled_paths.intersection(account_source_paths(account))]
+        if polled_accounts:
+            # Same deadline handling as model builds, so a hung share doesn't stall the watcher
+            signatures = dict(zip((account["auto_path"] for account in account_locations), get_account_signatures()))
+            for account in polled_accounts:
+                signature = signatures.get(account["auto_path"])
+                previous = self._poll_signatures.get(account["auto_path"])
+                if signature is None or previous is None:
+                    self._poll_signatures[account["auto_path"]] = signature
+                    continue
+                for index, kind in enumerate(ACCOUNT_SOURCE_KINDS):
+                    if signature[index] != previous[index]:
+                        changed.update(path for path, path_kind in account_source_paths(account).items()
+                                       if path_kind == kind and path in self._polled_paths)
+                self._poll_signatures[account["auto_path"]] = signature
+        if QUEST_CACHE_PATH in self._polled_paths:
+            signature = get_file_signature(QUEST_CACHE_PATH)
+            if QUEST_CACHE_PATH in self._poll_signatures and signature != self._poll_signatures[QUEST_CACHE_PATH]:
+                changed.add(QUEST_CACHE_PATH)
+            self._poll_signatures[QUEST_CACHE_PATH] = signature
+        return changed
+    
+    def _read_inotify(self, timeout):
+        """Wait up to timeout seconds for inotify events; returns the watched paths they touched"""
+        changed = set()
+        for event in self._inotify.read(timeout=int(timeout * 1000)):
+            if event.mask & inotify_simple.flags.Q_OVERFLOW:
+                # Events were dropped: treat every inotify-watched file as changed
+                changed.update(self._inotify_paths)
+                continue
+            directory = self._watch_dirs.get(event.wd)
+            if directory is not None and event.name:
+                path = os.path.join(directory, event.name)
+                if path in self._inotify_paths:
+                    changed.add(path)
+        return changed
+    
+    def _publish(self, paths):
+        self.stats["published"] += 1
+        self.stats["paths_published"] += len(paths)
+        if DEBUG:
+            print(f"[WATCH] {len(paths)} changed: {', '.join(sorted(os.path.basename(p) for p in paths))}")
+        for callback in list(self._subscribers):
+            try:
+                callback(paths)
+            except Exception as e:
+                print(f"[WATCH] Subscriber {getattr(callback, '__name__', callback)} failed: {e}")
+    
+    def _run(self):
+        pending, first_event, last_event = set(), None, None
+        next_poll = time.monotonic()
+        if self._polled_paths:
+            self._poll()  # Baseline signatures
+            next_poll += self.poll_interval
+        while True:
+            now = time.monotonic()
+            timeout = next_poll - now if self._polled_paths else self.poll_interval
+            if pending:
+                timeout = min(timeout, last_event + self.debounce - now, first_event + self.max_delay - now)
+            timeout = max(0.0, timeout)
+            
+            changed = set()
+            if self._inotify is not None and self._inotify_paths:
+                changed.update(self._read_inotify(timeout))
+            else:
+                time.sleep(timeout)
+            if self._polled_paths and time.monotonic() >= next_poll:
+                changed.update(self._poll())
+                next_poll = time.monotonic() + self.poll_interval
+            
+            now = time.monotonic()
+            if changed:
+                self.stats["events"] += len(changed)
+                pending.update(changed)
+                last_event = now
+                if first_event is None:
+                    first_event = now
+            if pending and (now - last_event >= self.debounce or now - first_event >= self.max_delay):
+                self._publish(pending)
+                pending, first_event, last_event = set(), None, None
+
+
+source_watcher = SourceWatcher(MODEL_CHANGE_POLL_INTERVAL, WATCH_DEBOUNCE, SOURCE_WATCHER)
+# Caches first, so the rebuild the refresher then runs reads the new files
+source_watcher.subscribe(invalidate_changed_sources)
+source_watcher.subscribe(model_refresher.notify_sources_changed)
+
+
+def build_data_delta(model, since, epoch):
+    """
+    Return the /api/data payload relative to model version `since`:
+    summary and per-account stats plus only added/changed characters and removed cids.
+    Falls back to the full payload ("full": true) when `since` is unknown or from another run.
+    """
+    payload = {"model_version": model.version, "model_epoch": MODEL_EPOCH, "content_hash": model.content_hash}
+    old_hashes = model_refresher.get_character_hashes(since) if epoch == MODEL_EPOCH else None
+    if old_hashes is None:
+        payload.update(model.main, full=True)
+        return payload
+    
+    new_hashes = model.char_hashes
+    added, changed = [], []
+    accounts = []
+    for account in model.main.get("accounts", []):
+        accounts.append({key: value for key, value in account.items() if key != "characters"})
+        for char in account.get("characters", []):
+            cid = str(char.get("cid"))
+            if cid not in old_hashes:
+                added.append(char)
+            elif old_hashes[cid] != new_hashes.get(cid):
+                changed.append(char)
+    payload.update({
+        "full": False,
+        "since": since,
+        "last_updated": model.main.get("last_updated"),
+        "summary": model.main.get("summary"),
+        "accounts": accounts,
+        "added": added,
+        "changed": changed,
+        "removed": [cid for cid in old_hashes if cid not in new_hashes],
+    })
+    return payload
+
+
+# Open /api/events streams; each one holds a server thread while connected. Under a fixed
+# worker pool (--serve production) the number of streams is capped so normal requests always
+# have threads left; tabs past the cap get a 503 and poll /api/timers instead.
+_event_stream_lock = threading.Lock()
+event_stream_stats = {"clients": 0, "connections": 0, "events_sent": 0, "rejected": 0}
+event_stream_limit = {"max": None}  # Concurrent streams allowed (None = unlimited)
+
+
+def acquire_event_stream():
+    """Reserve a stream slot; returns False when event_stream_limit streams are already open"""
+    with _event_stream_lock:
+        limit = event_stream_limit["max"]
+        if limit is not None and event_stream_stats["clients"] >= limit:
+            event_stream_stats["rejected"] += 1
+            return False
+        event_stream_stats["clients"] += 1
+        event_stream_stats["connections"] += 1
+        return True
+
+
+def release_event_stream():
+    """Free a slot taken by acquire_event_stream() (called when the stream's response closes)"""
+    with _event_stream_lock:
+        event_stream_stats["clients"] -= 1
+
+
+def format_model_event(model):
+    """Format a model version as a Server-Sent Events message"""
+    data = json.dumps({"model_version": model.version, "model_epoch": MODEL_EPOCH,
+                       "content_hash": model.content_hash, "last_updated": model.main.get("last_updated")})
+    return f"id: {MODEL_EPOCH}:{model.version}\nevent: model\ndata: {data}\n\n"
+
+
+def stream_model_events(since, epoch):
+    """
+    Yield a "model" event each time the background refresher serves a new model version.
+    The current version is sent straight away unless the client already has it
+    (`since`/`epoch` from the page or the EventSource Last-Event-ID), so a reconnect
+    never misses a rebuild. Idle streams get a comment every EVENTS_KEEPALIVE seconds,
+    which is also how a closed browser tab is noticed.
+    """
+    yield "retry: 3000\n\n"
+    version = since if epoch == MODEL_EPOCH else None
+    while True:
+        model = model_refresher.wait_for_update(version, max(1, EVENTS_KEEPALIVE))
+        if model is None or model.version == version:
+            yield ": keep-alive\n\n"
+            continue
+        version = model.version
+        with _event_stream_lock:
+            event_stream_stats["events_sent"] += 1
+        yield format_model_event(model)
+
+
+# ===============================================
+# Template Rendering (compiled once, per-version HTML cache)
+# ===============================================
+# render_template_string() re-parses and re-compiles these multi-thousand-line templates on
+# every request. Templates are compiled once into Jinja Template objects instead, and the
+# rendered HTML of each page is kept for the current model version, so refreshing a page
+# whose model hasn't changed returns the same string without rendering.
+_compiled_templates = {}  # template name -> jinja2.Template
+_render_cache = {}  # template name -> (model version, html)
+_render_lock = threading.Lock()
+render_stats = {}  # template name -> {"renders", "cache_hits", "last_render_seconds", "compile_seconds"}
+
+
+def get_compiled_template(name):
+    """Return the compiled Jinja template for a module-level template string (e.g. "HTML_TEMPLATE")"""
+    template = _compiled_templates.get(name)
+    if template is not None:
+        return template
+    with _render_lock:
+        template = _compiled_templates.get(name)
+        if template is None:
+            started = time.perf_counter()
+            template = app.jinja_env.from_string(globals()[name])
+            _compiled_templates[name] = template
+            stats = render_stats.setdefault(name, {"renders": 0, "cache_hits": 0, "last_render_seconds": 0})
+            stats["compile_seconds"] = round(time.perf_counter() - started, 4)
+    return template
+
+
+def compile_templates():
+    """Compile every page template up front (called at startup so the first request doesn't pay for it)"""
+    for name in ("HTML_TEMPLATE", "MAP_TEMPLATE", "SUBS_TEMPLATE", "CHARTS_TEMPLATE",
+                 "CHARACTER_CARDS_TEMPLATE", "CHARACTER_JOBS_TEMPLATE", "CHARACTER_CURRENCIES_TEMPLATE"):
+        get_compiled_template(name)
+
+
+def render_page(name, cache_version, **context):
+    """
+    Render a compiled page template with Flask's template context.
+    With RENDER_CACHE enabled the HTML is reused until cache_version (the model version) changes;
+    cache_version=None always renders and leaves the cache alone.
+    """
+    use_cache = RENDER_CACHE and cache_version is not None
+    if use_cache:
+        with _render_lock:
+            cached = _render_cache.get(name)
+            if cached is not None and cached[0] == cache_version:
+                render_stats[name]["cache_hits"] += 1
+                return cached[1]
+    
+    template = get_compiled_template(name)
+    started = time.perf_counter()
+    app.update_template_context(context)
+    html = template.render(context)
+    elapsed = time.perf_counter() - started
+    
+    with _render_lock:
+        stats = render_stats[name]
+        stats["renders"] += 1
+        stats["last_render_seconds"] = round(elapsed, 4)
+        if use_cache:
+            _render_cache[name] = (cache_version, html)
+    if DEBUG:
+        print(f"[RENDER] {name} for model v{cache_version} in {elapsed * 1000:.1f} ms")
+    return html
+
+
+@pass_context
+def render_character_cards(context, characters):
+    """Render character cards inside HTML_TEMPLATE with the page's own template context"""
+    template = get_compiled_template("CHARACTER_CARDS_TEMPLATE")
+    return Markup(template.render(dict(context.get_all(), characters=characters)))
+
+
+# ===============================================
+# Character Card Pages (server-side sort/filter for large accounts)
+# ===============================================
+def _card_number(value):
+    """Numeric sort value of a card field (the page's parseFloat(x) || 0)"""
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Sort buttons of the main page -> key of a character dict (same values as the card data-* attributes)
+CARD_SORT_KEYS = {
+    "level": lambda c: _card_number(c.get("current_level")),
+    "classes": lambda c: (_card_number(c.get("lowest_level")), _card_number(c.get("highest_level"))),
+    "gil": lambda c: _card_number(c.get("total_gil")),
+    "treasure": lambda c: _card_number(c.get("treasure_value")),
+    "fc_points": lambda c: _card_number(c.get("fc_points")),
+    "venture_coins": lambda c: _card_number(c.get("venture_coins")),
+    "coffers": lambda c: _card_number(c.get("coffer_count")),
+    "dyes": lambda c: _card_number(c.get("dye_count")),
+    "tanks": lambda c: _card_number(c.get("ceruleum")),
+    "kits": lambda c: _card_number(c.get("repair_kits")),
+    "restock": lambda c: _card_number(c["days_until_restock"] if c.get("days_until_restock") is not None else 9999),
+    "inventory": lambda c: 140 - _card_number(c.get("inventory_space")),
+    "mb": lambda c: _card_number(c.get("mb_items")),
+    "retainers": lambda c: _card_number(c.get("min_retainer_return")),
+    "retainer_level": lambda c: _card_number(c.get("max_retainer_level")),
+    "subs": lambda c: _card_number(c.get("min_sub_return")),
+    "sub_level": lambda c: _card_number(c.get("min_sub_level")),
+    "msq_percent": lambda c: _card_number(c.get("msq_percent")),
+}
+
+
+def _card_has_ready(c):
+    return ((c.get("ready_retainers", 0) > 0 and not c.get("exclude_retainer") and not c.get("retainers_sleeping"))
+            or (c.get("ready_subs", 0) > 0 and not c.get("exclude_workshop") and not c.get("subs_sleeping")))
+
+
+def _card_has_sleeping(c):
+    return ((c.get("retainers_sleeping") and c.get("total_retainers", 0) > 0 and not c.get("exclude_retainer"))
+            or (c.get("subs_sleeping") and c.get("total_subs", 0) > 0 and not c.get("exclude_workshop")))
+
+
+def _card_has_idle(c):
+    return ((c.get("has_idle_retainer") and not c.get("retainers_sleeping"))
+            or (c.get("has_idle_sub") and not c.get("subs_sleeping")))
+
+
+# Filter buttons of the main page -> predicate (global filters plus the per-account "msq-started")
+CARD_FILTERS = {
+    "personal-house": lambda c: bool(c.get("private_house")),
+    "fc-house": lambda c: bool(c.get("fc_house")),
+    "coffers": lambda c: c.get("coffer_count", 0) > 0,
+    "dyes": lambda c: c.get("dye_count", 0) > 0,
+    "mb": lambda c: c.get("mb_items", 0) > 0,
+    "fc-gil": lambda c: c.get("fc_gil", 0) > 0,
+    "retainers": lambda c: c.get("total_retainers", 0) > 0,
+    "treasure": lambda c: c.get("treasure_value", 0) > 0,
+    "subs": lambda c: c.get("total_subs", 0) > 0,
+    "msq": lambda c: int(_card_number(c.get("msq_percent"))) != 0,
+    "msq-started": lambda c: _card_number(c.get("msq_percent")) != 0,
+    "ready": _card_has_ready,
+    "sleeping": _card_has_sleeping,
+    "idle": _card_has_idle,
+    "potential_subs": lambda c: bool(c.get("has_potential_subs") or c.get("has_potential_retainer")),
+    "processing": lambda c: bool(c.get("is_processing")),
+    "excluded": lambda c: bool(c.get("exclude_retainer") or c.get("exclude_workshop")),
+}
+
+# Sort orders and filter flags per account, built on first use for the served model
+_card_index_lock = threading.Lock()
+_card_index = {"model": None, "orders": {}, "flags": {}}
+
+
+def _get_card_index(model):
+    """Return the sort/filter index for `model`, dropping the previous model's"""
+    with _card_index_lock:
+        if _card_index["model"] != (model.version, model.built_at):
+            _card_index.update(model=(model.version, model.built_at), orders={}, flags={})
+        return _card_index
+
+
+def query_character_cards(model, account_index, sort=None, order="desc", filters=(), region=None, search=""):
+    """
+    Return an account's characters the way the page would show them after sorting/filtering:
+    sorted by CARD_SORT_KEYS[sort] (stable, like the page's Array.sort), then filtered by
+    CARD_FILTERS, region and a case-insensitive name search. None if the account doesn't exist.
+    """
+    accounts = (model.main or {}).get("accounts", [])
+    if not 0 <= account_index < len(accounts):
+        return None
+    characters = accounts[account_index].get("characters", [])
+    index = _get_card_index(model)
+    
+    positions = range(len(characters))
+    if sort in CARD_SORT_KEYS:
+        key = (account_index, sort, order)
+        positions = index["orders"].get(key)
+        if positions is None:
+            sort_key = CARD_SORT_KEYS[sort]
+            positions = sorted(range(len(characters)), key=lambda i: sort_key(characters[i]), reverse=order == "desc")
+            index["orders"][key] = positions
+    for name in filters:
+        if name not in CARD_FILTERS:
+            continue
+        flags = index["flags"].get((account_index, name))
+        if flags is None:
+            flags = [bool(CARD_FILTERS[name](char)) for char in characters]
+            index["flags"][(account_index, name)] = flags
+        positions = [i for i in positions if flags[i]]
+    if region:
+        positions = [i for i in positions if characters[i].get("region") == region]
+    if search:
+        positions = [i for i in positions if search in str(characters[i].get("name", "")).lower()]
+    return [characters[i] for i in positions]
+
+
+# ===============================================
+# HTTP Caching & Compression
+# ===============================================
+# Every page and JSON payload is a pure function of the model version (and the request URL),
+# so the ETag is derived from them and a revalidating browser gets a 304 without the
+# payload being rendered, serialized or compressed. Compressed bodies are kept for the
+# current version so concurrent clients share one gzip/brotli pass, and a body is built
+# single-flight: tabs that ask for it while another request is building it wait for that
+# build instead of rendering their own copy.
+# Fragments (per-character sections, card pages, ?since= deltas) have one URL per character or
+# query, so they get their own cache: expanding many cards never evicts the page bodies.
+COMPRESSED_CACHE_SIZE = 32   # Page/full payload bodies kept per (URL, encoding); older entries are dropped first
+FRAGMENT_CACHE_SIZE = 512    # Fragment bodies kept per (URL, encoding)
+_compressed_cache = collections.OrderedDict()  # (full path, encoding) -> (etag, mimetype, body, raw size)
+_fragment_cache = collections.OrderedDict()    # Same layout, for fragment responses
+_compressed_cache_lock = threading.Lock()      # Guards both caches
+_body_builds_in_flight = {}  # ((full path, encoding), etag) -> [done Event, entry or None if the build failed]
+http_cache_stats = {"responses": 0, "not_modified": 0, "compressed": 0, "body_cache_hits": 0,
+                    "body_builds": 0, "coalesced": 0, "bytes_uncompressed": 0, "bytes_sent": 0}
+
+
+def negotiate_encoding():
+    """Pick the response Content-Encoding from Accept-Encoding (brotli preferred when installed)"""
+    if not HTTP_COMPRESSION:
+        return None
+    offered = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return request.accept_encodings.best_match(offered)
+
+
+def compress_body(body, encoding):
+    """Compress a response body with "br" or "gzip" """
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
 
-        createDualAxisLineChart('consumptionChart', [
-            { label: 'Tanks/Day', data: snapshots.map(s => s.total_tanks_per_day || 0), yAxisID: 'y', borderColor: '#d29922', backgroundColor: 'rgba(210,153,34,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 },
-            { label: 'Kits/Day', data: snapshots.map(s => s.total_kits_per_day || 0), yAxisID: 'y1', borderColor: '#8b949e', backgroundColor: 'rgba(139,148,158,0.1)', fill: true, tension: 0.3, pointRadius: 1, borderWidth: 1.5 }
-        ], decimalTick, decimalTick);
+def model_etag(version):
+    """Strong ETag for the current request URL at a model version (stable within one server run)"""
+    key = f"{MODEL_EPOCH}:{version}:{request.full_path}".encode("utf-8")
+    return hashlib.blake2b(key, digest_size=8).hexdigest()
 
-        createDualAxisLineChart('restockChart', [
-            {
-                label: 'Days Until Restock',
-                data: snapshots.map(s => s.min_days_until_restocking ?? s.days_until_restocking),
-                yAxisID: 'y',
-                borderColor: '#f85149',
-                backgroundColor: 'rgba(248,81,73,0.1)',
-                fill: true,
-                tension: 0.3,
-                pointRadius: 1,
-                borderWidth: 1.5,
-                pointBackgroundColor: snapshots.map(s => {
-                    const value = s.min_days_until_restocking ?? s.days_until_restocking;
-                    return value !== null && value < 7 ? '#f85149' : '#3fb950';
-                })
-            },
-            {
-                label: 'Highest Days Until Restock',
-                data: snapshots.map(s => s.max_days_until_restocking ?? s.days_until_restocking),
-                yAxisID: 'y1',
-                borderColor: '#58a6ff',
-                backgroundColor: 'rgba(88,166,255,0)',
-                fill: false,
-                tension: 0.3,
-                pointRadius: 1,
-                borderWidth: 1.5
-            }
-        ], decimalTick, decimalTick);
-    </script>
-    {% else %}
-    <div class="no-data">
-        <h2>No Financial Data Available</h2>
-        {% if not data %}
-        <p>USE_AAR_DB is disabled in config.json.</p>
-        <p style="margin-top:8px;color:#8b949e;">Set <code style="background:#21262d;padding:2px 6px;border-radius:3px;">"USE_AAR_DB": true</code> to enable snapshot recording.</p>
-        {% else %}
-        <p>No snapshots recorded yet. Data will appear after the dashboard loads and records its first daily snapshot.</p>
-        <p style="margin-top:8px;color:#8b949e;">Visit the main dashboard page to trigger snapshot recording.</p>
-        {% endif %}
-    </div>
-    {% endif %}
 
-    <div class="footer">AutoRetainer Dashboard {{ version }} | Charts powered by sublord.db snapshots from XA Database</div>
-</body>
-</html>
-'''
+def build_body_entry(build, encoding, tags):
+    """Run a view's build() and return its (etag, mimetype, body, raw size) cache entry"""
+    built = app.make_response(build())
+    body = built.get_data()
+    raw_size = len(body)
+    tag = tags[0]
+    if encoding and raw_size >= COMPRESSION_MIN_SIZE:
+        body, tag = compress_body(body, encoding), tags[1]
+    return (tag, built.mimetype, body, raw_size)
+
+
+def model_response(version, build, fragment=False):
+    """
+    Return a response for the current request whose content only depends on `version`
+    (a model version, or a content hash for payloads that outlive versions).
+    build() returns the view result (HTML string or jsonify response) and is only called
+    when neither a 304 nor a cached body can be sent, and only by one of the concurrent
+    requests for the same URL, encoding and version (the others wait for its body).
+    fragment=True keeps the body in the fragment cache instead of the page cache.
+    """
+    encoding = negotiate_encoding()
+    etag = model_etag(version)
+    # Each encoding is its own representation with its own strong tag; a client holding
+    # any representation of this version can keep it
+    tags = (etag, f"{etag}-{encoding}") if encoding else (etag,)
+    matched = next((tag for tag in tags if request.if_none_match.contains_weak(tag)), None)
+    if matched is not None:
+        with _compressed_cache_lock:
+            http_cache_stats["not_modified"] += 1
+        response = Response(status=304)
+        response.set_etag(matched)
+    else:
+        cache_key = (request.full_path, encoding)
+        flight_key = (cache_key, etag)
+        cache, cache_size = (_fragment_cache, FRAGMENT_CACHE_SIZE) if fragment else (_compressed_cache, COMPRESSED_CACHE_SIZE)
+        flight = None
+        leader = False
+        # The cache lookup and the in-flight check share one lock, so a request either finds
+        # the finished body or joins the build that will store it
+        with _compressed_cache_lock:
+            entry = cache.get(cache_key)
+            if entry is not None and entry[0] in tags:
+                cache.move_to_end(cache_key)
+                http_cache_stats["body_cache_hits"] += 1
+            else:
+                entry = None
+                flight = _body_builds_in_flight.get(flight_key)
+                if flight is None:
+                    leader = True
+                    flight = _body_builds_in_flight[flight_key] = [threading.Event(), None]
+                else:
+                    http_cache_stats["coalesced"] += 1
+        if flight is not None and not leader:
+            flight[0].wait()
+            entry = flight[1]
+        if entry is None:
+            # This request leads the build, or the build it waited for failed
+            try:
+                entry = build_body_entry(build, encoding, tags)
+            finally:
+                with _compressed_cache_lock:
+                    if entry is not None:
+                        http_cache_stats["body_builds"] += 1
+                        cache[cache_key] = entry
+                        cache.move_to_end(cache_key)
+                        while len(cache) > cache_size:
+                            cache.popitem(last=False)
+                    if leader:
+                        _body_builds_in_flight.pop(flight_key, None)
+                if leader:
+                    flight[1] = entry
+                    flight[0].set()
+        tag, mimetype, body, raw_size = entry
+        response = Response(body, mimetype=mimetype)
+        if tag != etag:
+            response.headers["Content-Encoding"] = encoding
+        response.set_etag(tag)
+        with _compressed_cache_lock:
+            http_cache_stats["responses"] += 1
+            http_cache_stats["compressed"] += tag != etag
+            http_cache_stats["bytes_uncompressed"] += raw_size
+            http_cache_stats["bytes_sent"] += len(body)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 # ===============================================
 # Flask Routes
 # ===============================================
+def index_context(model):
+    """Template context for the main dashboard page"""
+    return dict(data=model.main, auto_refresh=AUTO_REFRESH,
+                live_updates=LIVE_UPDATES, card_page_size=CARD_PAGE_SIZE,
+                render_character_cards=render_character_cards,
+                model_version=model.version, model_epoch=MODEL_EPOCH, content_hash=model.content_hash,
+                job_categories=JOB_CATEGORIES, job_display_names=JOB_DISPLAY_NAMES,
+                job_base_class=JOB_BASE_CLASS, version=VERSION,
+                show_classes=SHOW_CLASSES, show_currencies=SHOW_CURRENCIES,
+                show_msq_progression=SHOW_MSQ_PROGRESSION, default_theme=DEFAULT_THEME,
+                highlight_idle_retainers=HIGHLIGHT_IDLE_RETAINERS,
+                highlight_idle_subs=HIGHLIGHT_IDLE_SUBS,
+                highlight_ready_items=HIGHLIGHT_READY_ITEMS,
+                highlight_max_mb=HIGHLIGHT_MAX_MB,
+                highlight_potential_retainer=HIGHLIGHT_POTENTIAL_RETAINER,
+                highlight_potential_subs=HIGHLIGHT_POTENTIAL_SUBS,
+                highlight_color_idle_retainers=HIGHLIGHT_COLOR_IDLE_RETAINERS,
+                highlight_color_idle_subs=HIGHLIGHT_COLOR_IDLE_SUBS,
+                highlight_color_max_mb=HIGHLIGHT_COLOR_MAX_MB,
+                highlight_color_potential_retainer=HIGHLIGHT_COLOR_POTENTIAL_RETAINER,
+                highlight_color_potential_subs=HIGHLIGHT_COLOR_POTENTIAL_SUBS)
+
+
 @app.route('/')
 def index():
     """Main dashboard page"""
-    data = get_all_data()
-    # Write daily snapshot to sublord.db for charts historical data
-    if USE_AAR_DB and data and "summary" in data:
-        write_daily_snapshot(data["summary"])
-    return render_template_string(HTML_TEMPLATE, data=data, auto_refresh=AUTO_REFRESH, 
-                                  job_categories=JOB_CATEGORIES, job_display_names=JOB_DISPLAY_NAMES,
-                                  job_base_class=JOB_BASE_CLASS, version=VERSION,
-                                  show_classes=SHOW_CLASSES, show_currencies=SHOW_CURRENCIES,
-                                  show_msq_progression=SHOW_MSQ_PROGRESSION, default_theme=DEFAULT_THEME,
-                                  highlight_idle_retainers=HIGHLIGHT_IDLE_RETAINERS,
-                                  highlight_idle_subs=HIGHLIGHT_IDLE_SUBS,
-                                  highlight_ready_items=HIGHLIGHT_READY_ITEMS,
-                                  highlight_max_mb=HIGHLIGHT_MAX_MB,
-                                  highlight_potential_retainer=HIGHLIGHT_POTENTIAL_RETAINER,
-                                  highlight_potential_subs=HIGHLIGHT_POTENTIAL_SUBS,
-                                  highlight_color_idle_retainers=HIGHLIGHT_COLOR_IDLE_RETAINERS,
-                                  highlight_color_idle_subs=HIGHLIGHT_COLOR_IDLE_SUBS,
-                                  highlight_color_max_mb=HIGHLIGHT_COLOR_MAX_MB,
-                                  highlight_color_potential_retainer=HIGHLIGHT_COLOR_POTENTIAL_RETAINER,
-                                  highlight_color_potential_subs=HIGHLIGHT_COLOR_POTENTIAL_SUBS)
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: render_page("HTML_TEMPLATE", model.version, **index_context(model)))
 
 
 @app.route('/fcdata/')
 @app.route('/fcdata')
 def map_page():
     """Plot map and FC capacity planner page"""
-    data = get_map_data()
-    return render_template_string(MAP_TEMPLATE, data=data, version=VERSION)
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: render_page("MAP_TEMPLATE", model.version, data=model.map, version=VERSION))
 
 
 @app.route('/data/')
 @app.route('/data')
 def subs_page():
     """Submarine master list page"""
-    data = get_subs_data()
-    return render_template_string(SUBS_TEMPLATE, data=data, version=VERSION)
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: render_page("SUBS_TEMPLATE", model.version, data=model.subs, version=VERSION))
 
 
 @app.route('/charts/')
 @app.route('/charts')
 def charts_page():
     """Financial charts page (historical snapshots from sublord.db)"""
-    data = read_sublord_data()
-    return render_template_string(CHARTS_TEMPLATE, data=data, version=VERSION)
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: render_page("CHARTS_TEMPLATE", model.version, data=model.charts, version=VERSION))
 
 
-@app.route('/api/charts-data')
-def api_charts_data():
-    """API endpoint for charts page JSON data"""
-    data = read_sublord_data()
+def charts_data_payload(data):
+    """JSON body for /api/charts-data"""
     if data is None:
         return jsonify({"error": "sublord.db not available", "daily_snapshots": [], "cumulative": {}})
     return jsonify(data)
 
 
+@app.route('/api/charts-data')
+def api_charts_data():
+    """API endpoint for charts page JSON data"""
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: charts_data_payload(model.charts))
+
+
 @app.route('/api/subs-data')
 def api_subs_data():
     """API endpoint for subs page JSON data"""
-    data = get_subs_data()
-    return jsonify(data)
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: jsonify(model.subs))
 
 
 @app.route('/api/map-data')
 def api_map_data():
     """API endpoint for map page JSON data"""
-    data = get_map_data()
-    return jsonify(data)
+    model = get_dashboard_model()
+    return model_response(model.version, lambda: jsonify(model.map))
+
+
+@app.route('/api/fleet')
+def api_fleet():
+    """Submarine totals, per account/region/build breakdowns and a restock projection (?days=30)"""
+    model = get_dashboard_model()
+    days = max(1, request.args.get("days", 30, type=int))
+    
+    def build():
+        table = FleetTable(model.main.get("accounts", []))
+        restock = table.restock_state()
+        restock_min, restock_max = table.restock_range(restock)
+        return jsonify({
+            "model_version": model.version,
+            "backend": "numpy" if table.use_numpy else "python",
+            "totals": dict(table.totals(), min_restock_days=restock_min, max_restock_days=restock_max),
+            "groups": {key: table.group_by(key) for key in FLEET_GROUP_KEYS},
+            "restock_projection": table.restock_projection(days, restock),
+        })
+    return model_response(model.version, build)
 
 
 @app.route('/api/data')
 def api_data():
-    """API endpoint for raw JSON data"""
-    data = get_all_data()
-    return jsonify(data)
+    """
+    API endpoint for raw JSON data.
+    ?since=<model_version>&epoch=<model_epoch> returns only what changed since that version.
+    """
+    model = get_dashboard_model()
+    since = request.args.get("since", type=int)
+    if since is None:
+        return model_response(model.version, lambda: jsonify(dict(model.main, model_version=model.version,
+                                                                     model_epoch=MODEL_EPOCH,
+                                                                     content_hash=model.content_hash)))
+    return model_response(model.version, lambda: jsonify(build_data_delta(model, since, request.args.get("epoch", ""))),
+                          fragment=True)
+
+
+@app.route('/api/account/<int:account_index>/cards')
+def api_account_cards(account_index):
+    """
+    One page of an account's character cards as HTML, for accounts bigger than CARD_PAGE_SIZE.
+    ?offset=&limit=&sort=<CARD_SORT_KEYS>&order=asc|desc&filters=a,b&region=&q=<name search>
+    """
+    model = get_dashboard_model()
+    offset = max(0, request.args.get("offset", 0, type=int))
+    limit = request.args.get("limit", CARD_PAGE_SIZE, type=int) or CARD_PAGE_SIZE or 60
+    filters = [name for name in request.args.get("filters", "").split(",") if name]
+    characters = query_character_cards(
+        model, account_index, sort=request.args.get("sort"), order=request.args.get("order", "desc"),
+        filters=filters, region=request.args.get("region") or None,
+        search=request.args.get("q", "").lower().strip(),
+    )
+    if characters is None:
+        return jsonify({"error": f"Unknown account index: {account_index}"}), 404
+    page = characters[offset:offset + max(1, limit)]
+    return model_response(model.version, lambda: jsonify({
+        "total": len(characters),
+        "offset": offset,
+        "count": len(page),
+        "html": render_page("CHARACTER_CARDS_TEMPLATE", None, characters=page, **index_context(model)),
+    }), fragment=True)
+
+
+# Lazily loaded character card sections: URL section name -> template
+CHARACTER_SECTION_TEMPLATES = {"jobs": "CHARACTER_JOBS_TEMPLATE", "currencies": "CHARACTER_CURRENCIES_TEMPLATE"}
+
+
+def find_character(main_data, cid):
+    """Return the main view's character dict for a content ID (string), or None"""
+    for account in (main_data or {}).get("accounts", []):
+        for char in account.get("characters", []):
+            if str(char.get("cid")) == cid:
+                return char
+    return None
+
+
+@app.route('/api/character/<cid>/<section>')
+def api_character_section(cid, section):
+    """
+    HTML for one character card's jobs or currencies section, fetched when it is first expanded.
+    Cached by the character's content hash, so it stays 304 until that character changes.
+    """
+    model = get_dashboard_model()
+    template_name = CHARACTER_SECTION_TEMPLATES.get(section)
+    char = find_character(model.main, cid) if template_name else None
+    if char is None:
+        return jsonify({"error": f"Unknown character section: {cid}/{section}"}), 404
+    return model_response(model.char_hashes.get(cid), lambda: render_page(
+        template_name, None, char=char, job_categories=JOB_CATEGORIES,
+        job_display_names=JOB_DISPLAY_NAMES, job_base_class=JOB_BASE_CLASS), fragment=True)
+
+
+@app.route('/api/timers')
+def api_timers():
+    """
+    Countdown epochs for every voyaging submarine and venturing retainer, keyed by timer_id().
+    Cached by content hash, so rebuilds where nothing but the clock moved answer 304.
+    """
+    model = get_dashboard_model()
+    return model_response(model.content_hash, lambda: jsonify({
+        "model_epoch": MODEL_EPOCH,
+        "content_hash": model.content_hash,
+        "timers": model.timers,
+    }))
+
+
+@app.route('/api/events')
+def api_events():
+    """
+    Server-Sent Events stream of dashboard model versions.
+    ?since=<model_version>&epoch=<model_epoch> (or Last-Event-ID) skips the version the client already has.
+    503 once event_stream_limit streams are open (the page then polls /api/timers).
+    """
+    if not acquire_event_stream():
+        response = jsonify({"error": "Too many open event streams", "fallback": "/api/timers"})
+        response.status_code = 503
+        response.headers["Retry-After"] = str(max(1, AUTO_REFRESH or 60))
+        return response
+    since = request.args.get("since", type=int)
+    epoch = request.args.get("epoch", "")
+    last_event_id = request.headers.get("Last-Event-ID", "")
+    if ":" in last_event_id:
+        epoch, _, last_version = last_event_id.rpartition(":")
+        since = int(last_version) if last_version.isdigit() else None
+    response = Response(stream_model_events(since, epoch), mimetype="text/event-stream",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    # Runs when the server closes the response, even if the stream never started
+    response.call_on_close(release_event_stream)
+    return response
+
+
+@app.route('/api/cache-stats')
+def api_cache_stats():
+    """API endpoint for data source cache hit/miss counters"""
+    return jsonify(get_cache_stats())
 
 
 @app.route('/api/refresh')
 def api_refresh():
-    """Force data refresh"""
-    data = get_all_data()
-    return jsonify({"status": "ok", "last_updated": data["last_updated"]})
+    """Queue a background data refresh (returns the currently served model's status)"""
+    model_refresher.request_rebuild()
+    model = get_dashboard_model()
+    return jsonify({"status": "ok", "queued": True, "model_version": model.version,
+                    "last_updated": model.main["last_updated"]})
 
 
 # ===============================================
@@ -8864,13 +11790,12 @@ def run_fc_diagnostic():
         if not os.path.isfile(auto_path):
             continue
         try:
-            with open(auto_path, 'r', encoding='utf-8-sig') as f:
-                data = json.load(f)
+            ar_config = load_autoretainer_config(auto_path, account["nickname"])
         except Exception:
             continue
         
-        fc_data = extract_fc_data(data)
-        characters = collect_characters(data, account["nickname"])
+        fc_data = ar_config["fc_data"]
+        characters = ar_config["characters"]
         
         housing_map = {}
         lfstrm_path = account.get("lfstrm_path", "")
@@ -9003,12 +11928,1296 @@ def run_fc_diagnostic():
     print("=" * 100 + "\n")
 
 
+# ===============================================
+# Benchmarks (python "Landing Page.py" --benchmark)
+# ===============================================
+def create_synthetic_xa_db(db_path, characters=2000, seed=1, first_cid=1):
+    """Write a synthetic xa_characters snapshot database for benchmarking/parity checks"""
+    import random
+    rnd = random.Random(seed)
+    item_pool = sorted(TREASURE_IDS | COFFER_DYE_IDS) + [1, 2, 5, 4850, 12669]
+    jobs = [(JOB_DISPLAY_NAMES.get(key, key), key.upper()[:3]) for key in list(JOB_DISPLAY_NAMES)[:12]]
+    conn = sqlite3.connect(db_path)
+    conn.execute("""CREATE TABLE xa_characters (
+        content_id INTEGER PRIMARY KEY, currencies_json TEXT, jobs_json TEXT, items_json TEXT,
+        listings_json TEXT, retainer_items_json TEXT, msq_milestones_json TEXT,
+        personal_estate TEXT, fc_estate TEXT, free_company_json TEXT, fc_points INTEGER)""")
+    rows = []
+    for i in range(characters):
+        items = [{"ItemId": rnd.choice(item_pool), "Quantity": rnd.randint(1, 99)} for _ in range(rnd.randint(20, 140))]
+        retainer_items = [{"item_id": rnd.choice(item_pool), "quantity": rnd.randint(1, 20)} for _ in range(rnd.randint(0, 60))]
+        listings = [{"ItemId": rnd.choice(item_pool), "Quantity": rnd.randint(1, 5)} for _ in range(rnd.randint(0, 20))]
+        currencies = [{"Name": name, "Amount": rnd.randint(0, 50000)}
+                      for name in ("Gil", "Venture Coins", "MGP", "Allagan Tomestone of Poetics", "Wolf Marks")]
+        job_levels = [{"Name": name, "Abbreviation": abbr, "Level": rnd.choice([0, 1, 50, 90, 100])} for name, abbr in jobs]
+        milestones = [{"QuestRowId": quest_id, "IsComplete": rnd.random() > 0.4} for quest_id in list(MSQ_NAME_MAP)[:25]]
+        rows.append((
+            first_cid + i, json.dumps(currencies), json.dumps(job_levels), json.dumps(items), json.dumps(listings),
+            json.dumps(retainer_items), json.dumps(milestones), "", "",
+            json.dumps({"FcGil": rnd.randint(0, 5000000)}), rnd.randint(0, 900000),
+        ))
+    conn.executemany("INSERT INTO xa_characters VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
+    conn.commit()
+    conn.close()
+
+
+def create_synthetic_account(plugin_dir, characters=250, seed=1, first_cid=1):
+    """
+    Write a synthetic pluginConfigs folder (AutoRetainer, Lifestream and XA Database files)
+    for `characters` characters with content IDs starting at first_cid; returns its acc() entry
+    """
+    import random
+    rnd = random.Random(seed)
+    now = int(time.time())
+    worlds = ["Adamantoise", "Cactuar", "Gilgamesh", "Lich", "Odin", "Ravana", "Sophia", "Tonberry"]
+    parts = [21792, 21793, 21794, 21795, 21798, 22526, 23906, 23907]
+    offline_data, houses, fc_data = [], [], {}
+    for i in range(characters):
+        cid = first_cid + i
+        offline_subs, additional_subs = [], {}
+        if i % 2 == 0:
+            for slot in range(4):
+                name = f"Sub-{cid}-{slot}"
+                offline_subs.append({"Name": name, "ReturnTime": now + rnd.randint(-3600, 86400)})
+                additional_subs[name] = {
+                    "Name": name, "Level": rnd.randint(1, 120),
+                    "Part1": rnd.choice(parts), "Part2": rnd.choice(parts),
+                    "Part3": rnd.choice(parts), "Part4": rnd.choice(parts),
+                    "VesselBehavior": rnd.choice([0, 1, 2, 4]), "SelectedPointPlan": "", "SelectedUnlockPlan": "",
+                }
+        retainers = [{
+            "Name": f"Ret-{cid}-{slot}", "Level": rnd.choice([50, 90, 100]), "Job": rnd.randint(1, 18),
+            "Gil": rnd.randint(0, 100000), "MBItems": rnd.choice([0, 5, 20]), "HasVenture": rnd.random() > 0.2,
+            "VentureEndsAt": now + rnd.randint(-3600, 3600),
+        } for slot in range(rnd.randint(0, 9))]
+        offline_data.append({
+            "CID": cid, "Name": f"Synthetic {cid}", "World": rnd.choice(worlds),
+            "Gil": rnd.randint(0, 5000000), "Ceruleum": rnd.randint(0, 9999), "RepairKits": rnd.randint(0, 9999),
+            "InventorySpace": rnd.randint(0, 140), "Ventures": rnd.randint(0, 500),
+            "Enabled": i % 7 != 0, "WorkshopEnabled": True, "ExcludeWorkshop": False,
+            "OfflineSubmarineData": offline_subs, "AdditionalSubmarineData": additional_subs,
+            "RetainerData": retainers,
+        })
+        if i % 3 == 0:
+            fc_data[str(cid)] = {"HolderChara": cid, "Name": f"FC {cid % 40}", "FCPoints": rnd.randint(0, 900000)}
+            houses.append({"CID": cid, "Ward": rnd.randint(0, 29), "Plot": rnd.randint(0, 59),
+                           "ResidentialDistrict": 339, "IsPrivate": False})
+    for folder in ("AutoRetainer", "Lifestream", "XADatabase"):
+        os.makedirs(os.path.join(plugin_dir, folder), exist_ok=True)
+    with open(os.path.join(plugin_dir, "AutoRetainer", "DefaultConfig.json"), "w", encoding="utf-8") as f:
+        json.dump({"OfflineData": offline_data, "FCData": fc_data}, f)
+    with open(os.path.join(plugin_dir, "Lifestream", "DefaultConfig.json"), "w", encoding="utf-8") as f:
+        json.dump({"HousePathDatas": houses}, f)
+    create_synthetic_xa_db(os.path.join(plugin_dir, "XADatabase", "xa.db"), characters, seed=seed, first_cid=first_cid)
+    return acc(f"Synthetic{seed}", plugin_dir)
+
+
+def _time_call(fn, *args, repeat=3, **kwargs):
+    """Return (best wall seconds, last result) over `repeat` calls"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run_xa_scan_benchmark(characters=2000):
+    """Compare the Python and SQLite JSON1 xa_characters scan paths and field projections (parity + timing)"""
+    import tempfile
+    print("\n" + "=" * 60)
+    print(f"  XA DB SCAN BENCHMARK — {characters} synthetic characters")
+    print("=" * 60)
+    parity = True
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "xa.db")
+        create_synthetic_xa_db(db_path, characters)
+        print(f"  Database size: {os.path.getsize(db_path) / (1024 * 1024):.1f} MB")
+        python_seconds, python_result = _time_call(read_xa_db, db_path, use_json1=False)
+        print(f"  Python json.loads scan: {python_seconds * 1000:8.1f} ms")
+        
+        # Field projections: each must match the matching keys of the full scan
+        for fields in ({"housing", "levels"}, {"treasure"}, {"fc"}):
+            projected_seconds, projected = _time_call(read_xa_db, db_path, fields=fields, use_json1=False)
+            expected = _merge_xa_parts(_split_xa_parts(python_result, fields), fields)
+            matches = projected == expected
+            parity = parity and matches
+            label = "{" + ", ".join(sorted(fields)) + "}"
+            print(f"  Python scan {label:<20} {projected_seconds * 1000:8.1f} ms  "
+                  f"({python_seconds / max(projected_seconds, 1e-9):.1f}x)  {'PASS' if matches else 'FAIL'}")
+        
+        conn = sqlite3.connect(db_path)
+        has_json1 = sqlite_has_json1(conn)
+        conn.close()
+        if not has_json1:
+            print("  SQLite JSON1 scan:      unavailable (SQLite built without JSON1)")
+        else:
+            json1_seconds, json1_result = _time_call(read_xa_db, db_path, use_json1=True)
+            print(f"  SQLite JSON1 scan:      {json1_seconds * 1000:8.1f} ms  ({python_seconds / max(json1_seconds, 1e-9):.1f}x)")
+            json1_parity = python_result == json1_result and len(python_result) == characters
+            parity = parity and json1_parity
+            if not json1_parity:
+                mismatched = [cid for cid in python_result if python_result[cid] != json1_result.get(cid)]
+                print(f"  Mismatched characters: {len(mismatched)} (first: {mismatched[:5]})")
+        print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+        close_sqlite_connection(db_path)
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_fleet_tally_benchmark(characters=20000):
+    """Compare tally_fleet() against the per-counter generator passes it replaced (parity + timing)"""
+    import random
+    print("\n" + "=" * 60)
+    print(f"  FLEET TALLY BENCHMARK — {characters} synthetic characters")
+    print("=" * 60)
+    rnd = random.Random(7)
+    now_ts = time.time()
+    fleets = []
+    for _ in range(characters):
+        submarines = [{
+            "level": rnd.randint(1, 130),
+            "plan_name": rnd.choice(["", "", "OJ", "XP Grind"]),
+            "return_time": rnd.choice([0, int(now_ts + rnd.randint(-7200, 86400))]),
+            "is_ready": rnd.random() < 0.3,
+            "is_leveling": rnd.random() < 0.3,
+            "is_farming": rnd.random() < 0.5,
+            "daily_gil": rnd.randint(0, 150000),
+            "daily_cost": rnd.randint(0, 20000),
+            "tanks_per_day": rnd.choice([9.0, 10.5, 12.0]),
+            "kits_per_day": rnd.choice([1.5, 2.0, 3.5]),
+        } for _ in range(rnd.choice([0, 0, 4]))]
+        retainers = [{
+            "level": rnd.choice([50, 90, 100]),
+            "gil": rnd.randint(0, 50000),
+            "mb_items": rnd.choice([0, 12, 20]),
+            "has_venture": rnd.random() < 0.9,
+            "venture_ends": rnd.choice([0, int(now_ts + rnd.randint(-3600, 3600))]),
+            "is_ready": rnd.random() < 0.4,
+        } for _ in range(rnd.randint(0, 10))]
+        fleets.append((submarines, retainers))
+    
+    def return_seconds(items, key):
+        times = []
+        for item in items:
+            if item["is_ready"]:
+                times.append(0)
+            elif item[key] and item[key] > 0:
+                times.append(max(0, item[key] - now_ts))
+            else:
+                times.append(999999)
+        return min(times) if times else 999999
+    
+    # The previous code: one generator pass per counter
+    def tally_with_passes(submarines, retainers):
+        return {
+            "sub_daily_gil": sum(s["daily_gil"] for s in submarines),
+            "sub_daily_cost": sum(s["daily_cost"] for s in submarines),
+            "tanks_per_day": sum(s.get("tanks_per_day", 0) for s in submarines),
+            "kits_per_day": sum(s.get("kits_per_day", 0) for s in submarines),
+            "subs_leveling": sum(1 for s in submarines if s.get("is_leveling", False)),
+            "subs_farming": sum(1 for s in submarines if s.get("is_farming", False)),
+            "idle_subs": sum(1 for s in submarines if not s.get("plan_name") and not s.get("is_farming", False) and not s.get("is_leveling", False)),
+            "ready_subs": sum(1 for s in submarines if s["is_ready"]),
+            "max_sub_level": max((s["level"] for s in submarines), default=0),
+            "min_sub_level": min((s["level"] for s in submarines), default=0),
+            "min_sub_return": return_seconds(submarines, "return_time"),
+            "retainer_gil": sum(r["gil"] for r in retainers),
+            "mb_items": sum(r["mb_items"] for r in retainers),
+            "max_mb_count": sum(1 for r in retainers if r["mb_items"] >= 20),
+            "all_max_mb": len(retainers) > 0 and all(r["mb_items"] >= 20 for r in retainers),
+            "retainers_leveling": sum(1 for r in retainers if r["level"] < 100),
+            "retainers_farming": sum(1 for r in retainers if r["level"] >= 100),
+            "idle_retainers": sum(1 for r in retainers if not r["has_venture"]),
+            "ready_retainers": sum(1 for r in retainers if r["is_ready"]),
+            "max_retainer_level": max((r["level"] for r in retainers), default=0),
+            "min_retainer_level": min((r["level"] for r in retainers), default=0),
+            "min_retainer_return": return_seconds(retainers, "venture_ends"),
+        }
+    
+    passes_seconds, expected = _time_call(lambda: [tally_with_passes(s, r) for s, r in fleets])
+    single_seconds, actual = _time_call(lambda: [tally_fleet(s, r, now_ts) for s, r in fleets])
+    parity = actual == expected
+    print(f"  Generator pass per counter: {passes_seconds * 1000:8.1f} ms")
+    print(f"  tally_fleet single pass:    {single_seconds * 1000:8.1f} ms  ({passes_seconds / max(single_seconds, 1e-9):.1f}x)")
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_fleet_table_benchmark(characters=20000):
+    """Compare the NumPy and pure Python FleetTable paths (parity + timing)"""
+    import random
+    print("\n" + "=" * 60)
+    print(f"  FLEET TABLE BENCHMARK — {characters} synthetic characters")
+    print("=" * 60)
+    rnd = random.Random(11)
+    now_ts = time.time()
+    builds = ["WSUC", "SSUC", "S+S+U+C+", "YUUW", "Leveling"]
+    accounts = []
+    for account_index in range(4):
+        chars = []
+        for _ in range(characters // 4):
+            tanks, kits = rnd.choice([(9.0, 1.33), (10.5, 2.0), (12.0, 3.5)])
+            chars.append({
+                "region": rnd.choice(["NA", "EU", "JP", "OCE"]),
+                "ceruleum": rnd.randint(0, 5000),
+                "repair_kits": rnd.randint(0, 900),
+                "exclude_workshop": rnd.random() < 0.05,
+                "submarines": [{
+                    "build": rnd.choice(builds),
+                    "level": rnd.randint(1, 130),
+                    "return_time": rnd.choice([0, int(now_ts + rnd.randint(-7200, 86400))]),
+                    "daily_gil": rnd.randint(0, 150000),
+                    "daily_cost": tanks * CERULEUM_TANK_COST + kits * REPAIR_KIT_COST,
+                    "tanks_per_day": tanks,
+                    "kits_per_day": kits,
+                } for _ in range(rnd.choice([0, 4]))],
+            })
+        accounts.append({"nickname": f"Synthetic{account_index}", "characters": chars})
+    
+    def run_all(use_numpy):
+        table = FleetTable(accounts, use_numpy=use_numpy)
+        restock = table.restock_state()
+        return {
+            "totals": table.totals(),
+            "restock_days": table.restock_days(),
+            "restock_range": table.restock_range(restock),
+            "groups": {key: table.group_by(key, now_ts) for key in FLEET_GROUP_KEYS},
+            "projection": table.restock_projection(30, restock),
+        }
+    
+    def close(a, b):
+        # NumPy sums pairwise, so float totals can differ in the last digits
+        if isinstance(a, dict):
+            return a.keys() == b.keys() and all(close(a[k], b[k]) for k in a)
+        if isinstance(a, (list, tuple)):
+            return len(a) == len(b) and all(close(x, y) for x, y in zip(a, b))
+        if isinstance(a, float) or isinstance(b, float):
+            return math.isclose(a, b, rel_tol=1e-9)
+        return a == b
+    
+    python_seconds, python_result = _time_call(run_all, False)
+    print(f"  Pure Python: {python_seconds * 1000:8.1f} ms")
+    parity = True
+    if numpy is None:
+        print("  NumPy:       not installed (pip install numpy)")
+    else:
+        numpy_seconds, numpy_result = _time_call(run_all, True)
+        parity = close(python_result, numpy_result)
+        print(f"  NumPy:       {numpy_seconds * 1000:8.1f} ms  ({python_seconds / max(numpy_seconds, 1e-9):.1f}x)")
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_fc_extract_benchmark(target_mb=50):
+    """Time targeted FCData extraction vs the full config walk on a ~target_mb synthetic DefaultConfig.json"""
+    import shutil
+    import tempfile
+    print("\n" + "=" * 60)
+    print(f"  FC EXTRACTION BENCHMARK — ~{target_mb} MB synthetic DefaultConfig.json")
+    print("=" * 60)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        account = create_synthetic_account(os.path.join(tmp_dir, "acc"), 2000, seed=1)
+        with open(account["auto_path"], "r", encoding="utf-8") as f:
+            roster = json.load(f)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    # Repeat the roster with fresh content IDs until the file reaches the target size
+    roster_bytes = len(json.dumps(roster))
+    copies = max(1, math.ceil(target_mb * 1024 * 1024 / roster_bytes))
+    offline_data, fc_section = [], {}
+    for copy in range(copies):
+        offset = copy * 1000000
+        for char in roster["OfflineData"]:
+            offline_data.append(dict(char, CID=char["CID"] + offset))
+        for fc in roster["FCData"].values():
+            fc_section[str(fc["HolderChara"] + offset)] = dict(fc, HolderChara=fc["HolderChara"] + offset)
+    text = json.dumps({"OfflineData": offline_data, "FCData": fc_section})
+    parse_seconds, data = _time_call(json.loads, text, repeat=1)
+    
+    walk_seconds, walk_result = _time_call(extract_fc_data_full_walk, data, repeat=3)
+    targeted_seconds, targeted_result = _time_call(extract_fc_data, data, repeat=3)
+    # Moving FCData elsewhere must trip the fallback and still find every FC
+    relocated = {"OfflineData": data["OfflineData"], "FCDataRenamed": data["FCData"]}
+    parity = targeted_result == walk_result and extract_fc_data(relocated) == walk_result
+    print(f"  Config: {len(text) / (1024 * 1024):.1f} MB, {len(offline_data)} characters, {len(walk_result)} FCs")
+    print(f"  json.loads:      {parse_seconds * 1000:8.1f} ms")
+    print(f"  Full walk:       {walk_seconds * 1000:8.1f} ms")
+    print(f"  Targeted FCData: {targeted_seconds * 1000:8.1f} ms  ({walk_seconds / max(targeted_seconds, 1e-9):.0f}x)")
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_record_memory_benchmark(characters=1000):
+    """Measure memory held by get_all_data() with slotted records vs plain dicts (tracemalloc) and JSON time"""
+    import shutil
+    import tempfile
+    import tracemalloc
+    global account_locations
+    print("\n" + "=" * 60)
+    print(f"  RECORD MEMORY BENCHMARK — {characters} synthetic characters")
+    print("=" * 60)
+    saved_locations = account_locations
+    saved_types = {name: globals()[name] for name in ("Submarine", "Retainer", "Character")}
+    tmp_dir = tempfile.mkdtemp()
+    account_locations = [create_synthetic_account(os.path.join(tmp_dir, "acc"), characters, seed=1)]
+    
+    def without_ready_state(main):
+        # Synthetic return times are close to now, so ready flags can flip between the two builds
+        views = []
+        for account in main["accounts"]:
+            for char in account["characters"]:
+                view = _character_hash_view(char)
+                for key in ("submarines", "retainers"):
+                    view[key] = [{k: v for k, v in item.items() if k != "is_ready"} for item in view[key]]
+                view.pop("ready_subs")
+                view.pop("ready_retainers")
+                views.append(view)
+        return views
+    
+    def measure():
+        # Source caches are warm, so what is still allocated afterwards is the returned tree
+        clear_account_artifacts()
+        tracemalloc.start()
+        try:
+            result = get_all_data()
+            held = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        json_seconds, _ = _time_call(app.json.dumps, result)
+        return held, json_seconds, result
+    
+    try:
+        get_all_data()
+        # Previous layout: the record constructors replaced by dict() build the same keys as plain dicts
+        globals().update(Submarine=dict, Retainer=dict, Character=dict)
+        try:
+            dict_bytes, dict_json_seconds, dict_result = measure()
+        finally:
+            globals().update(saved_types)
+        record_bytes, record_json_seconds, record_result = measure()
+        parity = without_ready_state(dict_result) == without_ready_state(record_result)
+        per_1000 = 1000 / characters
+        print(f"  Plain dicts:      {dict_bytes * per_1000 / (1024 * 1024):7.2f} MB per 1,000 characters  "
+              f"JSON {dict_json_seconds * 1000:7.1f} ms")
+        print(f"  Slotted records:  {record_bytes * per_1000 / (1024 * 1024):7.2f} MB per 1,000 characters  "
+              f"JSON {record_json_seconds * 1000:7.1f} ms  ({dict_bytes / max(record_bytes, 1):.2f}x smaller)")
+    finally:
+        account_locations = saved_locations
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_map_data_benchmark(accounts=4, characters=500):
+    """Count config reads per get_map_data() build and compare its map data with the old two-pass builder"""
+    import shutil
+    import tempfile
+    global account_locations, load_lifestream_data
+    print("\n" + "=" * 60)
+    print(f"  MAP DATA BENCHMARK — {accounts} accounts x {characters} synthetic characters")
+    print("=" * 60)
+    saved_locations = account_locations
+    saved_loader = load_lifestream_data
+    lifestream_reads = []
+    
+    def counting_loader(path):
+        lifestream_reads.append(path)
+        return saved_loader(path)
+    
+    def without_etas(map_data):
+        # Sub ETAs and the timestamp are relative to now and can tick over between builds
+        result = {k: v for k, v in map_data.items() if k != "last_updated"}
+        result["sub_planner_accounts"] = [
+            dict(acc, characters=[dict(c, subs=[{k: v for k, v in sub.items() if k != "eta"} for sub in c["subs"]])
+                                  for c in acc["characters"]])
+            for acc in map_data["sub_planner_accounts"]
+        ]
+        return result
+    
+    def map_data_two_pass(loaded_sources):
+        # The get_map_data() builder before extract_map_account(): both passes re-derive every
+        # character's FC name/key, subs and exclusion flags from the raw config (plan names are
+        # passed to parse_submarine_data the way the current code does)
+        plot_list = []           # All individual plot entries
+        district_ward_map = {}   # district -> ward -> [plot entries]
+        seen_fc_plots = {}       # Deduplicate FC plots by world+district+ward+plot (same as main page)
+        no_fc_chars = []         # Characters not in any FC
+        account_summaries = []   # Per-account capacity info
+        account_xa_maps = {}
+        xa_housing_size_lookup = {}
+    
+        # First pass: build global FC manager map across ALL accounts
+        # Maps fc_key -> {name, account} for the first char with active subs per FC
+        global_fc_managers = {}
+        account_sources = [sources for sources in loaded_sources if not sources["error"]]
+        for sources in account_sources:
+            account = sources["account"]
+            pre_config = sources["ar_config"]
+            pre_fc_data = pre_config["fc_data"]
+            pre_characters = pre_config["characters"]
+            pre_housing = sources["housing_map"]
+            pre_alto_map = sources["alto_map"]
+            account_xa_maps[account["nickname"]] = pre_alto_map
+            xa_housing_size_lookup.update(build_xa_housing_size_lookup(pre_alto_map))
+            for char in pre_characters:
+                cid = char.get("CID", 0)
+                if not bool(char.get("OfflineSubmarineData", [])):
+                    continue
+                if char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False:
+                    continue
+                world = char.get("World", "Unknown")
+                name = char.get("Name", "Unknown")
+                fc_name = pre_fc_data[cid].get("Name", "") if cid in pre_fc_data else ""
+                has_fc_house = cid in pre_housing and pre_housing[cid].get('fc') is not None
+                fc_key = None
+                if has_fc_house:
+                    fcd = pre_housing[cid]['fc']
+                    fc_key = f"{world}_{fcd['district']}_W{fcd['ward']}_P{fcd['plot']}"
+                elif fc_name:
+                    fc_key = f"{world}_{fc_name}"
+                if fc_key and fc_key not in global_fc_managers:
+                    global_fc_managers[fc_key] = {"name": name, "account": account["nickname"]}
+    
+        sub_planner_accounts = []  # Per-account submarine planner data
+    
+        for sources in account_sources:
+            account = sources["account"]
+            ar_config = sources["ar_config"]
+    
+            plan_names = ar_config["plan_names"]
+            fc_data = ar_config["fc_data"]
+            characters = ar_config["characters"]
+    
+            # Scan XA Database for highest_level
+            alto_map = account_xa_maps.get(account["nickname"], {})
+    
+            # Lifestream housing (copied: entries get XA plot sizes applied below)
+            housing_map = dict(sources["housing_map"])
+    
+            # Track per-account stats
+            acc_chars_total = 0
+            acc_chars_in_fc = 0
+            acc_chars_in_fc_no_subs = 0  # orange: FC house no subs OR duplicate FC (managed by alt)
+            acc_chars_no_fc = 0
+            acc_chars_excluded = 0
+            acc_region_counts = {}   # region -> count of chars
+            acc_world_counts = {}    # world -> count of chars
+            acc_world_fc_counts = {} # world -> count of unique FCs with subs (green)
+            acc_world_fc_nosubs_counts = {} # world -> count of managed-by-alt (orange)
+            acc_world_excluded_counts = {} # world -> count of excluded chars
+            acc_region_fc = {}       # region -> count of unique FCs with subs (green)
+            acc_region_fc_nosubs = {} # region -> count of managed-by-alt (orange)
+            acc_region_excluded = {} # region -> count of excluded chars
+            acc_no_fc_list = []      # chars not in FC for this account
+            seen_fc_keys = {}        # FC plot dedup: fc_key -> first char name that claimed it
+            per_world_chars = {}     # world -> list of {name, status, fc_name} for clickable UI
+            acc_sub_chars = []       # Characters with subs for Sub Planner
+    
+            for char in characters:
+                cid = char.get("CID", 0)
+                name = char.get("Name", "Unknown")
+                world = char.get("World", "Unknown")
+                region = region_from_world(world)
+    
+                # Get highest level from XA Database
+                xa_snapshot = alto_map.get(cid, {})
+                highest_level = xa_snapshot.get("highest_level", 0)
+                if cid in housing_map:
+                    housing_map[cid] = apply_xa_housing_sizes(housing_map[cid], xa_snapshot, xa_housing_size_lookup)
+    
+                # FC membership for capacity planner
+                fc_name = ""
+                if cid in fc_data:
+                    fc_name = fc_data[cid].get("Name", "")
+    
+                # Check AR exclusion settings for this character
+                exclude_workshop = char.get("ExcludeWorkshop", False) if HONOR_AR_EXCLUSIONS else False
+                is_excluded = exclude_workshop
+    
+                has_subs = bool(char.get("OfflineSubmarineData", []))
+                has_fc_house = cid in housing_map and housing_map[cid].get('fc') is not None
+    
+                # Build FC key for dedup (same plot = same FC = same earnings)
+                fc_key = None
+                if has_fc_house:
+                    fcd = housing_map[cid]['fc']
+                    fc_key = f"{world}_{fcd['district']}_W{fcd['ward']}_P{fcd['plot']}"
+                elif fc_name:
+                    fc_key = f"{world}_{fc_name}"
+    
+                # Classify character into 4 categories:
+                # GREEN  (in_fc):         unique FC with active subs
+                # ORANGE (in_fc_no_subs): managed by alt — FC house no subs, or duplicate FC with subs
+                # GRAY   (excluded):      ExcludeWorkshop enabled
+                # YELLOW (can_join):      not in any FC
+                if is_excluded:
+                    char_status = "excluded"
+                elif has_subs:
+                    if fc_key and fc_key in seen_fc_keys:
+                        char_status = "fc_managed"  # duplicate FC — subs managed by another toon
+                    else:
+                        char_status = "in_fc"  # unique FC with active subs
+                        if fc_key:
+                            seen_fc_keys[fc_key] = {"name": name, "account": account["nickname"]}
+                elif has_fc_house:
+                    char_status = "fc_managed"  # has FC plot but no subs on this char
+                else:
+                    char_status = "can_join"
+    
+                acc_chars_total += 1
+                if char_status == "excluded":
+                    acc_chars_excluded += 1
+                elif char_status == "in_fc":
+                    acc_chars_in_fc += 1
+                elif char_status == "fc_managed":
+                    acc_chars_in_fc_no_subs += 1
+                else:
+                    acc_chars_no_fc += 1
+    
+                # Region/world counts
+                if region:
+                    acc_region_counts[region] = acc_region_counts.get(region, 0) + 1
+                    if char_status == "excluded":
+                        acc_region_excluded[region] = acc_region_excluded.get(region, 0) + 1
+                    elif char_status == "in_fc":
+                        acc_region_fc[region] = acc_region_fc.get(region, 0) + 1
+                    elif char_status == "fc_managed":
+                        acc_region_fc_nosubs[region] = acc_region_fc_nosubs.get(region, 0) + 1
+                if world:
+                    acc_world_counts[world] = acc_world_counts.get(world, 0) + 1
+                    if char_status == "excluded":
+                        acc_world_excluded_counts[world] = acc_world_excluded_counts.get(world, 0) + 1
+                    elif char_status == "in_fc":
+                        acc_world_fc_counts[world] = acc_world_fc_counts.get(world, 0) + 1
+                    elif char_status == "fc_managed":
+                        acc_world_fc_nosubs_counts[world] = acc_world_fc_nosubs_counts.get(world, 0) + 1
+    
+                # Track character for clickable world UI
+                if world not in per_world_chars:
+                    per_world_chars[world] = []
+                char_info = {
+                    "name": name,
+                    "status": char_status,
+                    "fc_name": fc_name,
+                }
+                if char_status == "fc_managed" and fc_key and fc_key in global_fc_managers:
+                    mgr = global_fc_managers[fc_key]
+                    char_info["managed_by"] = mgr["name"]
+                    char_info["managed_by_account"] = mgr["account"]
+                per_world_chars[world].append(char_info)
+    
+                # Characters not in FC (can_join or excluded — not green/orange)
+                if char_status in ("can_join", "excluded"):
+                    char_entry = {
+                        "name": name,
+                        "world": world,
+                        "region": region,
+                        "highest_level": highest_level,
+                        "account": account["nickname"],
+                        "has_fc_house": False,
+                        "has_private_house": False,
+                        "is_excluded": is_excluded,
+                    }
+                    if cid in housing_map:
+                        if housing_map[cid].get('fc'):
+                            char_entry["has_fc_house"] = True
+                        if housing_map[cid].get('private'):
+                            char_entry["has_private_house"] = True
+                            pd = housing_map[cid]['private']
+                            char_entry["private_house"] = f"{pd['district']} W{pd['ward']} P{pd['plot']}"
+                    acc_no_fc_list.append(char_entry)
+                    no_fc_chars.append(char_entry)
+    
+                # Collect plot data from housing_map
+                if cid in housing_map:
+                    for plot_type in ['private', 'fc']:
+                        pd = housing_map[cid].get(plot_type)
+                        if pd:
+                            # Deduplicate FC plots by world+district+ward+plot (same as main page unique_fc_plots)
+                            plot_key = f"{world}_{pd['district']}_W{pd['ward']}_P{pd['plot']}"
+                            if plot_type == 'fc':
+                                existing_fc_entry = seen_fc_plots.get(plot_key)
+                                if existing_fc_entry:
+                                    if not existing_fc_entry.get("size") and pd.get("size"):
+                                        existing_fc_entry["size"] = pd["size"]
+                                    if not existing_fc_entry.get("fc_name") and fc_name:
+                                        existing_fc_entry["fc_name"] = fc_name
+                                    continue
+    
+                            entry = {
+                                "type": plot_type,
+                                "district": pd['district'],
+                                "ward": pd['ward'],
+                                "plot": pd['plot'],
+                                "world": world,
+                                "region": region,
+                                "data_center": datacenter_from_world(world),
+                                "size": pd.get('size', ''),
+                                "character": name,
+                                "account": account["nickname"],
+                                "fc_name": fc_name if plot_type == 'fc' else "",
+                            }
+                            if plot_type == 'fc':
+                                seen_fc_plots[plot_key] = entry
+                            plot_list.append(entry)
+    
+                            # Build district -> ward map
+                            dist = pd['district']
+                            if dist not in district_ward_map:
+                                district_ward_map[dist] = {}
+                            ward = pd['ward']
+                            if ward not in district_ward_map[dist]:
+                                district_ward_map[dist][ward] = []
+                            district_ward_map[dist][ward].append(entry)
+    
+                # Collect submarine data for Sub Planner
+                submarines = parse_submarine_data(char, plan_names)
+                if submarines:
+                    subs_sleeping = not char.get("WorkshopEnabled", True)
+                    sub_list = []
+                    for s in submarines:
+                        # Compact ETA: "R" if ready, "Xh" or "Xm" or "XdYh"
+                        eta = "R"
+                        if not s.get("is_ready", False) and s.get("return_time"):
+                            delta = datetime.datetime.fromtimestamp(s["return_time"]) - datetime.datetime.now()
+                            secs = delta.total_seconds()
+                            if secs > 0:
+                                hrs = int(secs // 3600)
+                                mins = int((secs % 3600) // 60)
+                                if hrs >= 24:
+                                    eta = f"{hrs // 24}d{hrs % 24}h"
+                                elif hrs > 0:
+                                    eta = f"{hrs}h"
+                                else:
+                                    eta = f"{mins}m"
+                        sub_list.append({
+                            "name": s["name"],
+                            "level": s["level"],
+                            "build": s["build"],
+                            "plan_name": s.get("plan_name", ""),
+                            "is_farming": s.get("is_farming", False),
+                            "is_leveling": s.get("is_leveling", False),
+                            "eta": eta,
+                        })
+    
+                    # Character inventory stats
+                    ceruleum = char.get("Ceruleum", 0)
+                    repair_kits = char.get("RepairKits", 0)
+                    inventory_space = char.get("InventorySpace", 0)
+                    fleet = tally_fleet(submarines, ())
+                    restock_days = estimate_restock_days(ceruleum, repair_kits, fleet["tanks_per_day"], fleet["kits_per_day"])
+    
+                    acc_sub_chars.append({
+                        "name": name,
+                        "world": world,
+                        "region": region,
+                        "fc_name": fc_name,
+                        "excluded": is_excluded,
+                        "sleeping": subs_sleeping,
+                        "subs": sub_list,
+                        "tanks": ceruleum,
+                        "kits": repair_kits,
+                        "restock_days": restock_days,
+                        "inventory": inventory_space,
+                    })
+    
+            # Calculate capacity per region
+            region_capacity = []
+            for reg in ["NA", "EU", "JP", "OCE"]:
+                limit = REGION_CHAR_LIMITS[reg]
+                current = acc_region_counts.get(reg, 0)
+                in_fc_count = acc_region_fc.get(reg, 0)
+                in_fc_no_subs_count = acc_region_fc_nosubs.get(reg, 0)
+                excluded_count = acc_region_excluded.get(reg, 0)
+                not_in_fc = current - in_fc_count - in_fc_no_subs_count - excluded_count
+                remaining = limit - current
+    
+                # Per-world breakdown for this region
+                world_breakdown = []
+                for world_name in REGION_WORLD_ORDER.get(reg, []):
+                    count = acc_world_counts.get(world_name, 0)
+                    if count > 0:
+                        w_in_fc = acc_world_fc_counts.get(world_name, 0)
+                        w_in_fc_no_subs = acc_world_fc_nosubs_counts.get(world_name, 0)
+                        w_excluded = acc_world_excluded_counts.get(world_name, 0)
+                        w_not_in_fc = count - w_in_fc - w_in_fc_no_subs - w_excluded
+                        world_breakdown.append({"world": world_name, "count": count, "in_fc": w_in_fc, "in_fc_no_subs": w_in_fc_no_subs, "not_in_fc": w_not_in_fc, "excluded": w_excluded, "max": MAX_CHARS_PER_WORLD, "remaining": MAX_CHARS_PER_WORLD - count, "chars": per_world_chars.get(world_name, [])})
+    
+                region_capacity.append({
+                    "region": reg,
+                    "limit": limit,
+                    "current": current,
+                    "in_fc": in_fc_count,
+                    "in_fc_no_subs": in_fc_no_subs_count,
+                    "not_in_fc": not_in_fc,
+                    "excluded": excluded_count,
+                    "remaining": remaining,
+                    "worlds": world_breakdown,
+                })
+    
+            account_summaries.append({
+                "nickname": account["nickname"],
+                "total_chars": acc_chars_total,
+                "in_fc": acc_chars_in_fc,
+                "in_fc_no_subs": acc_chars_in_fc_no_subs,
+                "not_in_fc": acc_chars_no_fc,
+                "excluded": acc_chars_excluded,
+                "no_fc_chars": acc_no_fc_list,
+                "region_capacity": region_capacity,
+            })
+    
+            if acc_sub_chars:
+                sub_planner_accounts.append({
+                    "nickname": account["nickname"],
+                    "characters": acc_sub_chars,
+                    "total_subs": sum(len(c["subs"]) for c in acc_sub_chars),
+                    "total_chars": len(acc_sub_chars),
+                })
+    
+        # Build district summary for visualization (ordered: Goblet, LB, Mist, Empyreum, Shirogane)
+        district_summary = {}
+        # Process in defined order, then any extras alphabetically
+        ordered_districts = [d for d in DISTRICT_ORDER if d in district_ward_map]
+        ordered_districts += sorted(d for d in district_ward_map if d not in DISTRICT_ORDER)
+        for dist in ordered_districts:
+            wards = district_ward_map[dist]
+            ward_list = []
+            for ward_num in sorted(wards.keys()):
+                plots = sorted(wards[ward_num], key=lambda p: p['plot'])
+                fc_count = sum(1 for p in plots if p['type'] == 'fc')
+                personal_count = sum(1 for p in plots if p['type'] == 'private')
+                ward_list.append({
+                    "ward": ward_num,
+                    "plots": plots,
+                    "fc_count": fc_count,
+                    "personal_count": personal_count,
+                    "total": len(plots),
+                })
+            district_summary[dist] = {
+                "wards": ward_list,
+                "total_plots": sum(w['total'] for w in ward_list),
+                "total_fc": sum(w['fc_count'] for w in ward_list),
+                "total_personal": sum(w['personal_count'] for w in ward_list),
+                "ward_count": len(ward_list),
+            }
+    
+        total_plots = sum(d['total_plots'] for d in district_summary.values())
+        total_fc = sum(d['total_fc'] for d in district_summary.values())
+        total_personal = sum(d['total_personal'] for d in district_summary.values())
+    
+        # Aggregate character counts across all accounts
+        total_chars = sum(a["total_chars"] for a in account_summaries)
+        total_in_fc = sum(a["in_fc"] for a in account_summaries)
+        total_in_fc_no_subs = sum(a["in_fc_no_subs"] for a in account_summaries)
+        total_not_in_fc = sum(a["not_in_fc"] for a in account_summaries)
+        num_accounts = len(account_summaries)
+    
+        # Max capacity: sum of all region limits across all accounts
+        max_capacity = 0
+        for acc in account_summaries:
+            for rc in acc["region_capacity"]:
+                max_capacity += rc["limit"]
+    
+        # FC coverage percentage
+        fc_coverage_pct = round(total_in_fc / total_chars * 100, 1) if total_chars > 0 else 0
+    
+        # Max ward total across all districts (for bar chart scaling)
+        max_ward_total = 0
+        for dist_data in district_summary.values():
+            for w in dist_data["wards"]:
+                if w["total"] > max_ward_total:
+                    max_ward_total = w["total"]
+    
+        available_plot_regions = {p["region"] for p in plot_list if p.get("region")}
+    
+        return {
+            "plots": plot_list,
+            "district_summary": district_summary,
+            "district_ward_map": district_ward_map,
+            "no_fc_chars": no_fc_chars,
+            "account_summaries": account_summaries,
+            "total_plots": total_plots,
+            "total_fc": total_fc,
+            "total_personal": total_personal,
+            "total_chars": total_chars,
+            "total_in_fc": total_in_fc,
+            "total_in_fc_no_subs": total_in_fc_no_subs,
+            "total_not_in_fc": total_not_in_fc,
+            "num_accounts": num_accounts,
+            "max_capacity": max_capacity,
+            "fc_coverage_pct": fc_coverage_pct,
+            "max_ward_total": max_ward_total,
+            "sub_planner_accounts": sub_planner_accounts,
+            "plot_regions": [region for region in REGION_ORDER if region in available_plot_regions],
+            "plot_world_options": PLOT_WORLD_OPTIONS,
+            "plot_account_names": sorted(set(p["account"] for p in plot_list if p.get("account"))),
+            "last_updated": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+    
+    tmp_dir = tempfile.mkdtemp()
+    account_locations = [
+        create_synthetic_account(os.path.join(tmp_dir, f"acc{i}"), characters, seed=i + 1,
+                                 first_cid=i * 100000 + 1)
+        for i in range(accounts)
+    ]
+    load_lifestream_data = counting_loader
+    try:
+        with _ar_config_cache_lock:
+            _ar_config_cache.clear()
+        misses_before = ar_config_cache_stats["misses"]
+        cold_seconds, cold_result = _time_call(get_map_data, repeat=1)
+        config_reads = ar_config_cache_stats["misses"] - misses_before
+        cold_lifestream_reads = len(lifestream_reads)
+        warm_seconds, warm_result = _time_call(get_map_data)
+        reference_seconds, reference = _time_call(map_data_two_pass, load_all_account_sources())
+        matches_reference = without_etas(reference) == without_etas(cold_result)
+        parity = (config_reads == accounts and cold_lifestream_reads == accounts and matches_reference
+                  and without_etas(cold_result) == without_etas(warm_result))
+        print(f"  DefaultConfig.json reads: {config_reads} ({config_reads / accounts:.0f} per account)")
+        print(f"  Lifestream reads:         {cold_lifestream_reads} ({cold_lifestream_reads / accounts:.0f} per account)")
+        print(f"  Cold build:  {cold_seconds * 1000:8.1f} ms")
+        print(f"  Warm build:  {warm_seconds * 1000:8.1f} ms")
+        print(f"  Two-pass reference: {reference_seconds * 1000:8.1f} ms  {'PASS' if matches_reference else 'FAIL'}")
+    finally:
+        load_lifestream_data = saved_loader
+        account_locations = saved_locations
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_incremental_build_benchmark(accounts=8, characters=250):
+    """Rebuild the views after one account's Lifestream file changes: incremental vs every account recomputed"""
+    import shutil
+    import tempfile
+    global account_locations
+    print("\n" + "=" * 60)
+    print(f"  INCREMENTAL BUILD BENCHMARK — {accounts} accounts x {characters} synthetic characters")
+    print("=" * 60)
+    clock_keys = TIMER_DERIVED_KEYS | TIMER_DERIVED_ITEM_KEYS | {
+        "eta", "last_updated", "is_ready", "ready_subs", "ready_retainers", "total_ready"}
+    
+    def without_clock_fields(value):
+        # Countdowns and ready flags depend on when each partial was built
+        if isinstance(value, (dict, Record)):
+            return {k: without_clock_fields(v) for k, v in value.items() if k not in clock_keys}
+        if isinstance(value, (list, tuple)):
+            return [without_clock_fields(v) for v in value]
+        return value
+    
+    def build_views():
+        return [get_all_data(), get_map_data(), get_subs_data()]
+    
+    saved_locations = account_locations
+    tmp_dir = tempfile.mkdtemp()
+    account_locations = [
+        create_synthetic_account(os.path.join(tmp_dir, f"acc{i}"), characters, seed=i + 1,
+                                 first_cid=i * 100000 + 1)
+        for i in range(accounts)
+    ]
+    try:
+        build_views()
+        # Same content, newer mtime: enough for the signature to change
+        lfstrm_path = account_locations[0]["lfstrm_path"]
+        st = os.stat(lfstrm_path)
+        os.utime(lfstrm_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1000000000))
+        
+        with _account_artifact_lock:
+            before = dict(account_artifact_stats)
+        incremental_seconds, incremental = _time_call(build_views, repeat=1)
+        with _account_artifact_lock:
+            rebuilt = account_artifact_stats["misses"] - before["misses"]
+            # Synthetic return times sit around now, so a few partials can also expire in between
+            expired = account_artifact_stats["expired"] - before["expired"]
+        advance_artifact_clock()
+        full_seconds, full = _time_call(build_views, repeat=1)
+        expected = sum(1 for kinds in ACCOUNT_ARTIFACT_SOURCES.values() if "lifestream" in kinds)
+        parity = rebuilt - expired == expected and without_clock_fields(incremental) == without_clock_fields(full)
+        print(f"  Every account:   {full_seconds * 1000:8.1f} ms  ({accounts * len(ACCOUNT_ARTIFACT_SOURCES)} partials)")
+        print(f"  Incremental:     {incremental_seconds * 1000:8.1f} ms  ({rebuilt} partials rebuilt, "
+              f"{expired} of them expired timers, {full_seconds / max(incremental_seconds, 1e-9):.1f}x)")
+    finally:
+        account_locations = saved_locations
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_single_flight_benchmark(tabs=16, accounts=4, characters=250):
+    """Load test: N tabs opening /data/ at once share one model build and one rendered body"""
+    import shutil
+    import tempfile
+    global account_locations, model_refresher, USE_AAR_DB
+    print("\n" + "=" * 60)
+    print(f"  SINGLE-FLIGHT LOAD TEST — {tabs} concurrent tabs, {accounts} accounts x {characters} characters")
+    print("=" * 60)
+    
+    def run_tabs(fn):
+        # Release every tab at once, like a browser restoring a session
+        barrier = threading.Barrier(tabs)
+        results = [None] * tabs
+        
+        def tab(index):
+            barrier.wait()
+            results[index] = fn()
+        threads = [threading.Thread(target=tab, args=(i,)) for i in range(tabs)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - started, results
+    
+    def artifact_misses():
+        with _account_artifact_lock:
+            return account_artifact_stats["misses"]
+    
+    def fetch_subs_page():
+        response = app.test_client().get("/data/", headers={"Accept-Encoding": "gzip"})
+        return response.status_code, response.get_data()
+    
+    saved = (account_locations, model_refresher, USE_AAR_DB)
+    tmp_dir = tempfile.mkdtemp()
+    account_locations = [
+        create_synthetic_account(os.path.join(tmp_dir, f"acc{i}"), characters, seed=i + 1,
+                                 first_cid=i * 100000 + 1)
+        for i in range(accounts)
+    ]
+    # A private refresher that never rebuilds on its own, and no sublord.db snapshot writes
+    USE_AAR_DB = False
+    model_refresher = ModelRefresher(0, 3600)
+    try:
+        # Before: every request built its own views
+        clear_account_artifacts()
+        before = artifact_misses()
+        per_request_seconds, _ = run_tabs(lambda: [get_all_data(), get_map_data(), get_subs_data()])
+        per_request_partials = artifact_misses() - before
+        
+        clear_account_artifacts()
+        with _compressed_cache_lock:
+            _compressed_cache.clear()
+            _fragment_cache.clear()
+            http_before = dict(http_cache_stats)
+        before = artifact_misses()
+        shared_seconds, responses = run_tabs(fetch_subs_page)
+        shared_partials = artifact_misses() - before
+        stats = model_refresher.get_stats()
+        with _compressed_cache_lock:
+            body_builds = http_cache_stats["body_builds"] - http_before["body_builds"]
+            coalesced = http_cache_stats["coalesced"] - http_before["coalesced"]
+            cache_hits = http_cache_stats["body_cache_hits"] - http_before["body_cache_hits"]
+        parity = (stats["builds"] == 1 and body_builds == 1 and coalesced + cache_hits == tabs - 1
+                  and all(status == 200 for status, _ in responses) and len({body for _, body in responses}) == 1)
+        print(f"  Per-request builds: {per_request_seconds * 1000:8.1f} ms  ({tabs} view builds, {per_request_partials} partials)")
+        print(f"  Single-flight:      {shared_seconds * 1000:8.1f} ms  ({stats['builds']} model build, "
+              f"{shared_partials} partials, {body_builds} body render)")
+        print(f"  Coalesced:          {stats['first_build_waiters']} tabs waited for the first build, "
+              f"{coalesced} joined the body render, {cache_hits} hit the finished body")
+        
+        # /api/refresh from every tab queues one rebuild (plus one more if some arrive mid-build)
+        version = stats["version"]
+        run_tabs(lambda: app.test_client().get("/api/refresh").status_code)
+        model_refresher.wait_for_update(version, 30)
+        time.sleep(0.5)
+        stats = model_refresher.get_stats()
+        parity = parity and stats["rebuild_requests"] == tabs
+        print(f"  Refresh storm:      {stats['rebuild_requests']} requests -> {stats['builds'] - 1} rebuilds "
+              f"({stats['coalesced_requests']} coalesced)")
+    finally:
+        # The private refresher's thread stays idle until the process exits
+        account_locations, model_refresher, USE_AAR_DB = saved
+        with _compressed_cache_lock:
+            _compressed_cache.clear()
+            _fragment_cache.clear()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_http_benchmark(accounts=4, characters=250):
+    """Compare response sizes/latency for identity, gzip/brotli and 304 responses on a synthetic roster"""
+    import shutil
+    import tempfile
+    global account_locations
+    print("\n" + "=" * 60)
+    print(f"  HTTP RESPONSE BENCHMARK — {accounts} accounts x {characters} synthetic characters")
+    print("=" * 60)
+    parity = True
+    saved_locations = account_locations
+    # Loader threads keep pooled xa.db connections open, so the folder is removed best-effort
+    tmp_dir = tempfile.mkdtemp()
+    account_locations = [
+        create_synthetic_account(os.path.join(tmp_dir, f"acc{i}"), characters, seed=i + 1,
+                                 first_cid=i * 100000 + 1)
+        for i in range(accounts)
+    ]
+    try:
+        model = DashboardModel(version=-1, built_at=time.time(), build_seconds=0, timings={},
+                               main=get_all_data(), map=get_map_data(), subs=get_subs_data(),
+                               charts=None, gil_totals=None, char_hashes={}, content_hash="", timers={})
+        routes = [
+            ("/", lambda: render_page("HTML_TEMPLATE", None, **index_context(model))),
+            ("/api/data", lambda: jsonify(dict(model.main, model_version=model.version, model_epoch=MODEL_EPOCH))),
+            ("/api/subs-data", lambda: jsonify(model.subs)),
+            ("/api/map-data", lambda: jsonify(model.map)),
+        ]
+        encodings = ["identity", "gzip"] + (["br"] if brotli is not None else [])
+        print(f"  {'Route':<16}{'Encoding':<10}{'Size':>10}{'Ratio':>8}{'Cold':>10}{'Cached':>10}{'304':>9}")
+        for path, build in routes:
+            raw_size = None
+            raw_body = None
+            for encoding in encodings:
+                headers = {"Accept-Encoding": encoding}
+                with _compressed_cache_lock:
+                    _compressed_cache.clear()
+                    _fragment_cache.clear()
+                with app.test_request_context(path, headers=headers):
+                    cold_seconds, response = _time_call(model_response, model.version, build, repeat=1)
+                    cached_seconds, _ = _time_call(model_response, model.version, build)
+                    etag = response.get_etag()[0]
+                body = response.get_data()
+                if encoding == "identity":
+                    raw_body, raw_size = body, len(body)
+                elif response.headers.get("Content-Encoding") == "gzip":
+                    parity = parity and gzip.decompress(body) == raw_body
+                elif response.headers.get("Content-Encoding") == "br":
+                    parity = parity and brotli.decompress(body) == raw_body
+                with app.test_request_context(path, headers=dict(headers, **{"If-None-Match": f'"{etag}"'})):
+                    not_modified_seconds, not_modified = _time_call(model_response, model.version, build)
+                parity = parity and not_modified.status_code == 304 and not not_modified.get_data()
+                print(f"  {path:<16}{encoding:<10}{len(body) / 1024:>8.1f}KB{raw_size / max(len(body), 1):>7.1f}x"
+                      f"{cold_seconds * 1000:>8.1f}ms{cached_seconds * 1000:>8.2f}ms{not_modified_seconds * 1000:>7.2f}ms")
+    finally:
+        account_locations = saved_locations
+        with _compressed_cache_lock:
+            _compressed_cache.clear()
+            _fragment_cache.clear()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"  Parity: {'PASS' if parity else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return parity
+
+
+def run_benchmarks():
+    """Run all benchmarks; returns True if every parity check passed"""
+    return all([
+        run_xa_scan_benchmark(),
+        run_fleet_tally_benchmark(),
+        run_fleet_table_benchmark(),
+        run_record_memory_benchmark(),
+        run_fc_extract_benchmark(),
+        run_map_data_benchmark(),
+        run_incremental_build_benchmark(),
+        run_http_benchmark(),
+        run_single_flight_benchmark(),
+    ])
+
+
+# ===============================================
+# Production Serving & Load Test
+# ===============================================
+# `--serve production` runs the app under waitress with SERVER_THREADS worker threads
+# instead of Flask's development server. Request threads only read the immutable
+# DashboardModel and the lock-guarded render/body caches; config globals are set once by
+# load_external_config() before serving, and per-account state (like submarine plan names)
+# is passed down the parsers rather than kept in globals.
+SERVE_MODES = ("development", "production")
+LOAD_TEST_ROUTES = ["/", "/data/", "/fcdata/", "/api/data", "/api/subs-data", "/api/map-data", "/api/fleet",
+                    "/api/timers", "/api/charts-data"]
+LOAD_TEST_CONCURRENCY = (1, 10, 50)
+
+
+def get_cli_option(name, default=None):
+    """Return the value given as `name value` or `name=value` on the command line, else default"""
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+        if arg == name and i + 1 < len(args) and not args[i + 1].startswith("--"):
+            return args[i + 1]
+    return default
+
+
+class ProductionServer:
+    """The app under waitress with a fixed worker pool (Werkzeug's threaded server if waitress is missing)"""
+    
+    def __init__(self, host, port, threads):
+        self.threads = max(1, int(threads))
+        if waitress is not None:
+            self.backend = "waitress"
+            self._server = waitress.create_server(app, host=host, port=port, threads=self.threads)
+            self.port = self._server.effective_port
+            # Live-update streams may hold at most half the workers; the rest serve requests
+            event_stream_limit["max"] = self.threads // 2
+        else:
+            from werkzeug.serving import make_server
+            self.backend = "werkzeug"
+            self._server = make_server(host, port, app, threaded=True)
+            self.port = self._server.server_port
+    
+    def serve_forever(self):
+        """Serve requests until the process exits"""
+        if self.backend == "waitress":
+            self._server.run()
+        else:
+            self._server.serve_forever()
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(1, math.ceil(pct / 100 * len(sorted_values))) - 1]
+
+
+def run_load_test(base_url=None, requests_per_client=10, accounts=4, characters=100):
+    """
+    Request each LOAD_TEST_ROUTES page from 1/10/50 concurrent clients and print p50/p95/p99 latency,
+    then repeat /api/data while every live-update stream slot is held open by an idle tab
+    (the request after the last slot must get a 503, not hang). Without base_url, a production server is started in-process on a free port against synthetic
+    accounts (its clients share the GIL with the server, so a separately started server gives
+    cleaner numbers). Returns True if every request succeeded.
+    """
+    import logging
+    import shutil
+    import tempfile
+    import urllib.error
+    import urllib.request
+    global account_locations, model_refresher, USE_AAR_DB
+    saved = (account_locations, model_refresher, USE_AAR_DB)
+    # 50 clients on SERVER_THREADS workers queue on purpose; don't log every queued request
+    logging.getLogger("waitress.queue").setLevel(logging.ERROR)
+    tmp_dir = None
+    if base_url is None:
+        tmp_dir = tempfile.mkdtemp()
+        account_locations = [
+            create_synthetic_account(os.path.join(tmp_dir, f"acc{i}"), characters, seed=i + 1,
+                                     first_cid=i * 100000 + 1)
+            for i in range(accounts)
+        ]
+        # A private refresher that never rebuilds on its own, and no sublord.db snapshot writes
+        USE_AAR_DB = False
+        model_refresher = ModelRefresher(0, 3600)
+        server = ProductionServer("127.0.0.1", 0, SERVER_THREADS)
+        threading.Thread(target=server.serve_forever, name="load-test-server", daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.port}"
+        target = f"in-process {server.backend}, {server.threads} threads, {accounts} x {characters} synthetic characters"
+    else:
+        target = base_url
+    base_url = base_url.rstrip("/")
+    print("\n" + "=" * 60)
+    print(f"  LOAD TEST — {target}")
+    print("=" * 60)
+    
+    def fetch(path):
+        started = time.perf_counter()
+        req = urllib.request.Request(base_url + path, headers={"Accept-Encoding": "gzip"})
+        with urllib.request.urlopen(req, timeout=60) as response:
+            response.read()
+        return time.perf_counter() - started
+    
+    def run_clients(path, clients):
+        latencies, errors = [], []
+        lock = threading.Lock()
+        
+        def client():
+            for _ in range(requests_per_client):
+                try:
+                    seconds = fetch(path)
+                except Exception as e:
+                    with lock:
+                        errors.append(e)
+                    continue
+                with lock:
+                    latencies.append(seconds)
+        threads = [threading.Thread(target=client) for _ in range(clients)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return sorted(latencies), errors, time.perf_counter() - started
+    
+    def report(label, clients, latencies, errors, elapsed):
+        p50, p95, p99 = (percentile(latencies, pct) * 1000 for pct in (50, 95, 99))
+        print(f"  {label:<18}{clients:>8}{p50:>8.1f}ms{p95:>8.1f}ms{p99:>8.1f}ms"
+              f"{len(latencies) / max(elapsed, 1e-9):>9.0f}{len(errors):>8}")
+        if errors:
+            print(f"    [LOAD] {label}: {errors[0]}")
+        return not errors
+    
+    def open_stream():
+        # Returns once the stream's headers arrive; the connection stays open like an idle tab's
+        return urllib.request.urlopen(base_url + "/api/events", timeout=60)
+    
+    ok = True
+    streams = []
+    try:
+        for path in LOAD_TEST_ROUTES:
+            fetch(path)  # First build and body cache warm-up
+        print(f"  {'Route':<18}{'Clients':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'req/s':>9}{'Errors':>8}")
+        for path in LOAD_TEST_ROUTES:
+            for clients in LOAD_TEST_CONCURRENCY:
+                ok = report(path, clients, *run_clients(path, clients)) and ok
+        
+        with urllib.request.urlopen(base_url + "/api/cache-stats", timeout=60) as response:
+            limit = json.loads(response.read())["events"].get("limit")
+        # Unlimited (thread-per-request server): hold as many streams as the default pool has threads
+        stream_count = limit if limit is not None else 16
+        streams = [open_stream() for _ in range(stream_count)]
+        print(f"  With {stream_count} open /api/events streams (limit: {limit if limit is not None else 'none'}):")
+        ok = report("/api/data", 10, *run_clients("/api/data", 10)) and ok
+        if limit is not None:
+            try:
+                streams.append(open_stream())
+                print("    [LOAD] Stream past the limit was accepted")
+                ok = False
+            except urllib.error.HTTPError as e:
+                print(f"    Stream past the limit: HTTP {e.code} (page falls back to /api/timers)")
+                ok = ok and e.code == 503
+    except Exception as e:
+        print(f"  [LOAD] Load test failed: {e}")
+        ok = False
+    finally:
+        for stream in streams:
+            stream.close()
+        # The in-process server and its refresher stay idle until the process exits
+        account_locations, model_refresher, USE_AAR_DB = saved
+        if tmp_dir:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    print(f"  Result: {'PASS' if ok else 'FAIL'}")
+    print("=" * 60 + "\n")
+    return ok
+
+
 # ===============================================
 # Main Entry Point
 # ===============================================
 def main():
     load_external_config()
     
+    if "--benchmark" in sys.argv[1:]:
+        sys.exit(0 if run_benchmarks() else 1)
+    
+    if "--load-test" in sys.argv[1:]:
+        sys.exit(0 if run_load_test(get_cli_option("--load-test")) else 1)
+    
+    serve_mode = get_cli_option("--serve", "development")
+    if serve_mode not in SERVE_MODES:
+        print(f"[SERVE] Unknown --serve mode '{serve_mode}' (expected {' or '.join(SERVE_MODES)}); using development")
+        serve_mode = "development"
+    
     print("=" * 60)
     print(f"  AutoRetainer Dashboard {VERSION}")
     print("=" * 60)
@@ -9028,14 +13237,42 @@ def main():
                 print(f"  [XA-DB] {acc_name} doesn't have a XA Database file to parse")
         write_startup_daily_snapshot()
     print(f"  Accounts: {len(account_locations)}")
-    print(f"  Auto-refresh: {AUTO_REFRESH}s" if AUTO_REFRESH > 0 else "  Auto-refresh: Disabled")
+    if LIVE_UPDATES:
+        print("  Auto-refresh: Live (/api/events)")
+    else:
+        print(f"  Auto-refresh: {AUTO_REFRESH}s" if AUTO_REFRESH > 0 else "  Auto-refresh: Disabled")
     print("=" * 60)
     
     # Run FC detection diagnostic (only when DEBUG is enabled)
     if DEBUG:
         run_fc_diagnostic()
     
-    app.run(host=HOST, port=PORT, debug=DEBUG)
+    compile_templates()
+    
+    # Build the dashboard model in the background (skip the Flask reloader's watcher process;
+    # the production server has no reloader)
+    model_refresher.refresh_interval = MODEL_REFRESH_INTERVAL
+    model_refresher.poll_interval = max(0.1, MODEL_CHANGE_POLL_INTERVAL)
+    source_watcher.poll_interval = max(0.1, MODEL_CHANGE_POLL_INTERVAL)
+    source_watcher.debounce = max(0.0, WATCH_DEBOUNCE)
+    source_watcher.mode = SOURCE_WATCHER
+    if serve_mode == "production" or not DEBUG or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        source_watcher.start()
+        print(f"  [WATCH] Watching {len(source_watcher.watched_paths())} source files ({source_watcher.backend})")
+        model_refresher.start()
+    
+    if serve_mode == "production":
+        server = ProductionServer(HOST, PORT, SERVER_THREADS)
+        if server.backend == "waitress":
+            print(f"  [SERVE] Production server: waitress, {server.threads} threads")
+            if LIVE_UPDATES:
+                print(f"  [SERVE] Live updates for up to {event_stream_limit['max']} open tabs; "
+                      "further tabs poll /api/timers")
+        else:
+            print("  [SERVE] waitress not installed (pip install waitress); using Werkzeug's threaded server")
+        server.serve_forever()
+    else:
+        app.run(host=HOST, port=PORT, debug=DEBUG)
 
 
 if __name__ == "__main__":